@@ -1,61 +1,231 @@
 #!/usr/bin/env python3
 """
 파일 번역기 통합 실행 파일
+웹 화면 파일은 스레드 서버로 동시에 제공 (화면 구성 파일만 허용, 업로드/번역 결과 파일은 제공하지 않음)
 """
+import multiprocessing
 import threading
 import time
 import webbrowser
 import os
-import sys
-from translate_server import app
-import http.server
-import socketserver
+import gzip
+import hashlib
+import re
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from serve import load_app
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 웹 화면에서 사용하는 파일만 제공 (URL 경로 -> (파일 경로, Content-Type))
+UI_ASSETS = {
+    '/index.html': ('index.html', 'text/html; charset=utf-8'),
+    '/script.js': ('script.js', 'application/javascript; charset=utf-8'),
+    '/style.css': ('style.css', 'text/css; charset=utf-8'),
+}
+if os.path.isdir(os.path.join(BASE_DIR, 'icons')):
+    for _icon in os.listdir(os.path.join(BASE_DIR, 'icons')):
+        if _icon.endswith('.png'):
+            UI_ASSETS[f'/icons/{_icon}'] = (os.path.join('icons', _icon), 'image/png')
+
+# 미리 gzip으로 압축해 둘 파일 형식
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript')
+# index.html이 참조하는 화면 파일 주소에는 ?v=<내용 해시>를 붙여서 제공
+# 현재 내용의 해시와 같은 ?v= 요청은 내용이 바뀌지 않으므로 오래 캐시, 그 외에는 매번 ETag로 재검증
+VERSIONED_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+DEFAULT_CACHE_CONTROL = 'no-cache'
+
+
+class StaticAsset:
+    """화면 파일 하나 (내용, gzip 압축본, ETag, 수정 시각) - 파일이 바뀌면 다시 읽음"""
+
+    def __init__(self, path, content_type):
+        self.path = os.path.join(BASE_DIR, path)
+        self.content_type = content_type
+        self.mtime = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """파일이 바뀐 경우에만 다시 읽고 압축 (없는 파일이면 None)"""
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return None
+        with self._lock:
+            if mtime != self.mtime:
+                with open(self.path, 'rb') as f:
+                    self._set_body(f.read(), mtime)
+            return self
+
+    def _set_body(self, body, mtime):
+        self.body = body
+        self.gzip_body = None
+        if self.content_type.startswith(COMPRESSIBLE_TYPES):
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                self.gzip_body = compressed
+        self.version = hashlib.sha1(body).hexdigest()[:16]
+        self.etag = f'"{self.version}"'
+        self.last_modified = formatdate(int(mtime), usegmt=True)
+        self.mtime = mtime
+
+
+class IndexAsset(StaticAsset):
+    """index.html - 화면 파일 참조(style.css?v=...)의 버전을 각 파일의 내용 해시로 바꿔서 제공
+    파일이 바뀌면 주소도 바뀌므로 오래 캐시해 둔 이전 스크립트/스타일을 쓰지 않음"""
+
+    ASSET_REFERENCE = re.compile(rb'((?:href|src)=")([^"?#]+)\?v=[^"]*(")')
+
+    def __init__(self, path, content_type):
+        super().__init__(path, content_type)
+        self._source = None
+        self._source_mtime = None
+
+    def load(self):
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return None
+        with self._lock:
+            if mtime != self._source_mtime:
+                with open(self.path, 'rb') as f:
+                    self._source = f.read()
+                self._source_mtime = mtime
+
+            mtimes = [mtime]
+
+            def versioned(match):
+                asset = _assets.get('/' + match.group(2).decode('utf-8'))
+                asset = asset.load() if asset is not None and asset is not self else None
+                if asset is None:
+                    return match.group(0)
+                mtimes.append(asset.mtime)
+                return match.group(1) + match.group(2) + b'?v=' + asset.version.encode('ascii') + match.group(3)
+
+            body = self.ASSET_REFERENCE.sub(versioned, self._source)
+            # 참조한 파일만 바뀌어도 내용이 달라지므로 수정 시각은 가장 최근 값 사용
+            if body != getattr(self, 'body', None) or max(mtimes) != self.mtime:
+                self._set_body(body, max(mtimes))
+            return self
+
+
+_assets = {
+    url: (IndexAsset if url == '/index.html' else StaticAsset)(path, content_type)
+    for url, (path, content_type) in UI_ASSETS.items()
+}
+
+
+class UIRequestHandler(BaseHTTPRequestHandler):
+    """웹 화면 파일 제공 (ETag/Last-Modified 조건부 요청, gzip 압축본, 캐시 헤더)"""
+
+    def do_GET(self):
+        self._send_asset(include_body=True)
+
+    def do_HEAD(self):
+        self._send_asset(include_body=False)
+
+    def _send_asset(self, include_body):
+        url = urlsplit(self.path)
+        path = '/index.html' if url.path == '/' else url.path
+        asset = _assets.get(path)
+        asset = asset.load() if asset else None
+        if asset is None:
+            self.send_error(404, 'Not Found')
+            return
+
+        # 요청한 버전이 현재 내용과 다르면(이전 index.html이 참조한 주소) 오래 캐시하지 않음
+        versioned = parse_qs(url.query).get('v', [None])[0] == asset.version
+        cache_control = VERSIONED_CACHE_CONTROL if versioned else DEFAULT_CACHE_CONTROL
+
+        if self._not_modified(asset):
+            self.send_response(304)
+            self.send_header('ETag', asset.etag)
+            self.send_header('Cache-Control', cache_control)
+            self.end_headers()
+            return
+
+        body = asset.body
+        use_gzip = asset.gzip_body is not None and 'gzip' in self.headers.get('Accept-Encoding', '')
+        if use_gzip:
+            body = asset.gzip_body
+
+        self.send_response(200)
+        self.send_header('Content-Type', asset.content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', asset.etag)
+        self.send_header('Last-Modified', asset.last_modified)
+        self.send_header('Cache-Control', cache_control)
+        if asset.gzip_body is not None:
+            self.send_header('Vary', 'Accept-Encoding')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def _not_modified(self, asset):
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            return asset.etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                return int(asset.mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def log_message(self, format, *args):
+        # 화면 파일 요청마다 로그를 남기지 않음
+        pass
+
 
 def run_translation_server():
     """번역 서버 실행"""
-    app.run(host='0.0.0.0', port=5001, debug=False, use_reloader=False)
+    load_app().run(host='0.0.0.0', port=5001, debug=False, use_reloader=False, threaded=True)
 
 def run_web_server():
-    """웹 서버 실행"""
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
-    Handler = http.server.SimpleHTTPRequestHandler
-    with socketserver.TCPServer(("", 8000), Handler) as httpd:
+    """웹 서버 실행 (연결마다 스레드로 처리하여 느린 연결이 다른 요청을 막지 않음)"""
+    ThreadingHTTPServer.daemon_threads = True
+    with ThreadingHTTPServer(("", 8000), UIRequestHandler) as httpd:
         httpd.serve_forever()
 
 if __name__ == '__main__':
+    # EXE로 빌드했을 때 시트 단위 작업 프로세스(TRANSLATION_SHEET_PROCESSES)가 앱을 다시 실행하지 않도록
+    multiprocessing.freeze_support()
     print('=' * 50)
     print('   파일 번역기 v1.0')
     print('   한국어 ↔ 중국어 번역 도구')
     print('=' * 50)
     print('서버 시작 중...')
-    
+
     # 번역 서버 시작
     t1 = threading.Thread(target=run_translation_server)
     t1.daemon = True
     t1.start()
-    
+
     # 웹 서버 시작
     t2 = threading.Thread(target=run_web_server)
     t2.daemon = True
     t2.start()
-    
+
     # 잠시 대기
     time.sleep(3)
-    
+
     # 브라우저 열기
     print('\n브라우저를 여는 중...')
     webbrowser.open('http://localhost:8000')
-    
+
     print('\n' + '=' * 50)
     print('서비스가 실행 중입니다!')
     print('주소: http://localhost:8000')
     print('종료하려면 Ctrl+C를 누르세요')
     print('=' * 50 + '\n')
-    
+
     # 프로그램 유지
     try:
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
         print('\n프로그램을 종료합니다...')
-        sys.exit(0)
\ No newline at end of file
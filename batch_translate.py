@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+엑셀 일괄 번역 CLI - 폴더/glob 패턴의 엑셀 파일을 여러 프로세스로 나눠서 번역
+모든 프로세스가 같은 번역 메모리(TRANSLATION_MEMORY_PATH)와 엔진 차단 상태(ENGINE_HEALTH_DB) SQLite 파일을 공유
+출력 파일이 원본보다 새롭고 같은 번역 설정으로 만든 것이면 이미 번역된 것으로 보고 건너뜀 (--force로 다시 번역)
+번역 설정은 출력 폴더의 .batch_translate.json에 파일별로 기록
+
+사용법:
+    python batch_translate.py ./orders --output-dir ./translated --direction ko-zh --jobs 4
+    python batch_translate.py "./orders/**/*.xlsx" --output-dir ./translated --direction zh-ko
+"""
+
+import argparse
+import contextlib
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+EXCEL_EXTENSIONS = ('.xlsx', '.xlsm')
+TRANSLATORS = {
+    'template': ('excel_translator_template', 'ExcelTranslatorTemplate'),
+    'direct': ('excel_translator_direct', 'ExcelTranslatorDirect'),
+}
+DEFAULT_JOBS = min(4, os.cpu_count() or 1)
+# 출력 폴더에 두는 파일별 번역 설정 기록
+RECORD_FILENAME = '.batch_translate.json'
+# 같은 결과가 나오는 번역 설정 (이 값이 다르면 출력 파일이 최신이어도 다시 번역)
+OUTPUT_OPTIONS = ('direction', 'translator', 'preserve_english', 'add_new_sheet', 'exclude_sheets')
+
+# 작업자 프로세스마다 한 번 만든 번역기 (번역 메모리 LRU를 파일 사이에 재사용)
+_worker_translator = None
+_worker_options = None
+
+
+def _is_excel_file(path):
+    name = os.path.basename(path)
+    # ~$로 시작하는 파일은 Excel이 열려 있을 때 만드는 잠금 파일
+    return name.lower().endswith(EXCEL_EXTENSIONS) and not name.startswith('~$')
+
+
+def find_input_files(sources, recursive=False, exclude_dir=None):
+    """입력 경로(파일/폴더/glob 패턴) 목록 -> (입력 파일, 출력 폴더 기준 상대 경로) 목록"""
+    exclude_dir = os.path.abspath(exclude_dir) + os.sep if exclude_dir else None
+    found = {}
+    for source in sources:
+        if os.path.isdir(source):
+            pattern = os.path.join(source, '**', '*') if recursive else os.path.join(source, '*')
+            paths, base = glob.glob(pattern, recursive=recursive), source
+        elif glob.has_magic(source):
+            paths = glob.glob(source, recursive=True)
+            # 패턴에서 와일드카드가 나오기 전까지의 폴더를 기준으로 하위 폴더 구조 유지
+            base = source
+            while glob.has_magic(base):
+                base = os.path.dirname(base)
+        else:
+            paths, base = [source], os.path.dirname(source)
+        for path in paths:
+            absolute = os.path.abspath(path)
+            if not os.path.isfile(path) or not _is_excel_file(path) or absolute in found:
+                continue
+            if exclude_dir and absolute.startswith(exclude_dir):
+                continue
+            found[absolute] = os.path.relpath(absolute, os.path.abspath(base or '.'))
+    return sorted(found.items())
+
+
+def output_path_for(relative_path, output_dir, direction):
+    """출력 파일 경로 (하위 폴더 구조 유지, 파일명에 방향 표시: 발주서.xlsx -> 발주서_ko-zh.xlsx)"""
+    stem, ext = os.path.splitext(relative_path)
+    return os.path.join(output_dir, f'{stem}_{direction}{ext}')
+
+
+def output_options(options):
+    """출력 파일 내용에 영향을 주는 설정만 (제외 시트는 순서 무관)"""
+    result = {name: options[name] for name in OUTPUT_OPTIONS}
+    result['exclude_sheets'] = sorted(result['exclude_sheets'] or [])
+    return result
+
+
+def load_output_records(output_dir):
+    """출력 폴더의 파일별 번역 설정 기록 {출력 상대 경로: 설정} (없거나 읽을 수 없으면 빈 기록)"""
+    try:
+        with open(os.path.join(output_dir, RECORD_FILENAME), encoding='utf-8') as f:
+            return json.load(f).get('files') or {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_output_records(output_dir, records):
+    """임시 파일에 쓴 뒤 교체 (중간에 끊겨도 이전 기록이 깨지지 않음)"""
+    os.makedirs(output_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix='.batch-record-', suffix='.json', dir=output_dir)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'files': records}, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(temp_path, os.path.join(output_dir, RECORD_FILENAME))
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def is_up_to_date(input_path, output_path, recorded_options=None, options=None):
+    """출력 파일이 있고 원본보다 나중에 수정되었으며 같은 번역 설정으로 만들었으면 번역하지 않음
+    (설정 기록이 없는 출력 파일은 어떤 설정으로 만들었는지 알 수 없으므로 다시 번역)"""
+    if options is not None and recorded_options != options:
+        return False
+    try:
+        return os.path.getmtime(output_path) >= os.path.getmtime(input_path)
+    except OSError:
+        return False
+
+
+def _init_worker(options):
+    global _worker_translator, _worker_options
+    if options['threads']:
+        os.environ['TRANSLATION_MAX_WORKERS'] = str(options['threads'])
+
+    import importlib
+    module_name, class_name = TRANSLATORS[options['translator']]
+    translator_class = getattr(importlib.import_module(module_name), class_name)
+    # 파일 단위로 이미 프로세스를 나눴으므로 시트 단위 작업 프로세스는 쓰지 않음
+    _worker_translator = translator_class(sheet_processes=0)
+    _worker_options = options
+
+    from engine_registry import start_warm_up
+    start_warm_up(verbose=options['verbose'])
+
+
+def _translate_one(input_path, output_path, name):
+    """작업자 프로세스에서 파일 하나 번역 (임시 파일에 저장 후 교체하여 중간에 끊겨도 최신으로 보이지 않게 함)"""
+    translator, options = _worker_translator, _worker_options
+    result = {'input': input_path, 'name': name, 'output': output_path, 'bytes': os.path.getsize(input_path)}
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix='.batch-', suffix=os.path.splitext(output_path)[1], dir=os.path.dirname(output_path) or '.')
+    os.close(fd)
+    started = time.perf_counter()
+    try:
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, \
+                contextlib.redirect_stdout(sys.stdout if options['verbose'] else devnull):
+            translator.translate_excel_file(
+                input_path,
+                temp_path,
+                direction=options['direction'],
+                preserve_english=options['preserve_english'],
+                add_new_sheet=options['add_new_sheet'],
+                exclude_sheets=options['exclude_sheets'],
+            )
+        os.replace(temp_path, output_path)
+        progress = translator.progress.snapshot()
+        result.update({
+            'status': 'ok',
+            'unique': progress.get('unique') or 0,
+            'cache_hits': progress.get('cache_hits') or 0,
+            'timings': translator.timings.as_dict(),
+        })
+    except Exception as e:
+        result.update({'status': 'error', 'error': f'{type(e).__name__}: {e}'})
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    result['seconds'] = round(time.perf_counter() - started, 4)
+    return result
+
+
+def print_summary(results, skipped, seconds, jobs):
+    ok = [r for r in results if r['status'] == 'ok']
+    failed = [r for r in results if r['status'] != 'ok']
+    unique = sum(r['unique'] for r in ok)
+    cache_hits = sum(r['cache_hits'] for r in ok)
+    megabytes = sum(r['bytes'] for r in ok) / (1024 * 1024)
+    busy = sum(r['seconds'] for r in results)
+
+    print(f"\n번역 {len(ok)}개, 실패 {len(failed)}개, 최신이라 건너뜀 {skipped}개 ({seconds:.2f}초, 프로세스 {jobs}개)")
+    if ok and seconds > 0:
+        print(f"처리량: 파일 {len(ok) / seconds:.2f}개/초, {megabytes / seconds:.2f} MB/초, "
+              f"고유 텍스트 {unique / seconds:.0f}개/초 (고유 텍스트 {unique}개, 캐시 적중 {cache_hits}개)")
+        print(f"병렬 효율: 파일별 소요 시간 합계 {busy:.2f}초 / (경과 {seconds:.2f}초 x {jobs}) = {busy / (seconds * jobs):.0%}")
+        stages = {}
+        for r in ok:
+            for stage, value in r['timings'].items():
+                stages[stage] = stages.get(stage, 0.0) + value
+        if stages:
+            print('단계별 합계: ' + ', '.join(f'{stage} {value:.2f}s' for stage, value in stages.items()))
+    for r in failed:
+        print(f"  실패: {r['name']} - {r['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='엑셀 파일 일괄 번역 (여러 프로세스)')
+    parser.add_argument('inputs', nargs='+', help='엑셀 파일, 폴더 또는 glob 패턴 (예: "orders/**/*.xlsx")')
+    parser.add_argument('--output-dir', '-o', required=True, help='번역 결과를 저장할 폴더 (입력 폴더의 하위 구조 유지)')
+    parser.add_argument('--direction', '-d', default='ko-zh', choices=('ko-zh', 'zh-ko'))
+    parser.add_argument('--jobs', '-j', type=int, default=DEFAULT_JOBS, help=f'동시에 번역할 파일 수 (프로세스 수, 기본 {DEFAULT_JOBS})')
+    parser.add_argument('--threads', type=int, default=None, help='프로세스당 문자열 번역 작업자 수 (TRANSLATION_MAX_WORKERS)')
+    parser.add_argument('--translator', default='template', choices=tuple(TRANSLATORS), help='번역기 (direct: xlsx 직접 수정, 대용량용)')
+    parser.add_argument('--recursive', '-r', action='store_true', help='폴더 입력 시 하위 폴더까지 포함')
+    parser.add_argument('--force', action='store_true', help='출력 파일이 최신이어도 다시 번역')
+    parser.add_argument('--no-preserve-english', action='store_true', help='영문도 번역')
+    parser.add_argument('--replace-sheets', action='store_true', help='새 시트를 추가하지 않고 원본 시트를 번역')
+    parser.add_argument('--exclude-sheet', action='append', default=[], help='번역하지 않을 시트 이름 (여러 번 지정 가능)')
+    parser.add_argument('--memory', help='공유 번역 메모리 SQLite 파일 (TRANSLATION_MEMORY_PATH)')
+    parser.add_argument('--verbose', action='store_true', help='번역기 출력 표시')
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        parser.error('--jobs는 1 이상이어야 합니다.')
+
+    # 작업자 프로세스는 환경 변수를 물려받으므로 여기서 공유 SQLite 파일을 정해 둠
+    from engine_health import DEFAULT_SHARED_DB_PATH
+    if args.memory:
+        os.environ['TRANSLATION_MEMORY_PATH'] = os.path.abspath(args.memory)
+    os.environ.setdefault('ENGINE_HEALTH_DB', DEFAULT_SHARED_DB_PATH)
+
+    files = find_input_files(args.inputs, recursive=args.recursive, exclude_dir=args.output_dir)
+    if not files:
+        print("번역할 엑셀 파일이 없습니다.")
+        return 1
+
+    options = {
+        'direction': args.direction,
+        'translator': args.translator,
+        'threads': args.threads,
+        'preserve_english': not args.no_preserve_english,
+        'add_new_sheet': not args.replace_sheets,
+        'exclude_sheets': args.exclude_sheet or None,
+        'verbose': args.verbose,
+    }
+
+    # 다른 설정(영문 유지, 새 시트, 제외 시트, 번역기)으로 만든 출력 파일은 최신이어도 다시 번역
+    records = load_output_records(args.output_dir)
+    current_options = output_options(options)
+    pending, skipped = [], 0
+    for input_path, relative_path in files:
+        output_path = output_path_for(relative_path, args.output_dir, args.direction)
+        record_key = os.path.relpath(output_path, args.output_dir).replace(os.sep, '/')
+        if not args.force and is_up_to_date(input_path, output_path, records.get(record_key), current_options):
+            skipped += 1
+            continue
+        pending.append((input_path, output_path, relative_path))
+
+    print(f"엑셀 파일 {len(files)}개 중 {len(pending)}개 번역 ({args.direction}, 프로세스 {min(args.jobs, len(pending) or 1)}개)")
+
+    results = []
+    jobs = min(args.jobs, len(pending)) or 1
+    started = time.perf_counter()
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(options,)) as pool:
+            futures = [pool.submit(_translate_one, *item) for item in pending]
+            try:
+                for count, future in enumerate(as_completed(futures), 1):
+                    result = future.result()
+                    results.append(result)
+                    if result['status'] == 'ok':
+                        records[os.path.relpath(result['output'], args.output_dir).replace(os.sep, '/')] = current_options
+                        save_output_records(args.output_dir, records)
+                    mark = '✓' if result['status'] == 'ok' else '✗'
+                    print(f"[{count}/{len(pending)}] {mark} {result['name']} ({result['seconds']:.2f}초)")
+            except KeyboardInterrupt:
+                print("중단 요청 - 대기 중인 파일은 번역하지 않습니다.")
+                # shutdown(cancel_futures=)는 3.9부터라 하나씩 취소 (Python 3.8 지원)
+                for future in futures:
+                    future.cancel()
+                pool.shutdown(wait=True)
+                raise
+    print_summary(results, skipped, time.perf_counter() - started, jobs)
+    return 1 if any(r['status'] != 'ok' for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+엑셀 번역기 처리량 벤치마크
+합성 엑셀 파일을 만들어 각 번역기 클래스를 가짜 엔진으로 실행하고, 결과를 JSON으로 저장
+번역기마다 새 프로세스에서 실행하여 최대 메모리(peak RSS)와 번역 메모리 캐시가 서로 섞이지 않게 함
+
+사용법:
+    python benchmarks/run_benchmark.py --rows 2000 --latency 0.005 --output bench.json
+    python benchmarks/run_benchmark.py --engines template,direct --baseline bench.json
+"""
+
+import argparse
+import contextlib
+import importlib
+import inspect
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from synthetic_workbook import add_workbook_arguments, generate_workbook, workbook_options
+
+# 벤치마크 이름 -> (모듈, 클래스)
+ENGINES = {
+    'template': ('excel_translator_template', 'ExcelTranslatorTemplate'),
+    'direct': ('excel_translator_direct', 'ExcelTranslatorDirect'),
+    'v2': ('excel_translator_v2', 'ExcelTranslatorWithProgress'),
+    'v1': ('excel_translator', 'ExcelTranslator'),
+    'xlwings': ('excel_translator_xlwings', 'ExcelTranslatorXlwings'),
+}
+DEFAULT_ENGINES = 'template,direct,v2,v1'
+# 번역기 하나의 최대 실행 시간 (초)
+DEFAULT_TIMEOUT = 600
+
+
+class StageTimer:
+    """진행률 이벤트의 단계(stage) 변경 시각으로 단계별 소요 시간 계산"""
+
+    def __init__(self):
+        self.stages = {}
+        self.last_event = {}
+        self._current = None
+        self._started = None
+
+    def on_event(self, event):
+        stage = event.get('stage')
+        now = time.perf_counter()
+        if stage != self._current:
+            self.close(now)
+            self._current, self._started = stage, now
+        self.last_event = event
+
+    def close(self, now=None):
+        if self._current is not None:
+            now = time.perf_counter() if now is None else now
+            self.stages[self._current] = self.stages.get(self._current, 0.0) + now - self._started
+            self._current = None
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 메모리 사용량 (MB, 측정할 수 없으면 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _run_engine(name, input_path, output_path, options, results):
+    """번역기 하나 실행 (새 프로세스에서 호출)"""
+    result = {'engine': name}
+    try:
+        # 번역 메모리는 실행마다 빈 파일로 시작 (이전 실행의 캐시 적중 방지)
+        os.environ['TRANSLATION_MEMORY_PATH'] = os.path.join(os.path.dirname(output_path), f'{name}_memory.db')
+        if options['workers']:
+            os.environ['TRANSLATION_MAX_WORKERS'] = str(options['workers'])
+
+        from progress_reporter import ProgressReporter
+        from stub_engine import StubEngine, install_stub
+
+        module_name, class_name = ENGINES[name]
+        translator_class = getattr(importlib.import_module(module_name), class_name)
+        timer = StageTimer()
+        engine = StubEngine(latency=options['latency'], jitter=options['jitter'], seed=options['seed'])
+        if 'progress_callback' in inspect.signature(translator_class).parameters:
+            translator = translator_class(progress_callback=ProgressReporter(on_event=timer.on_event))
+        else:
+            translator = translator_class()
+        install_stub(translator, engine)
+
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(sys.stdout if options['verbose'] else open(os.devnull, 'w', encoding='utf-8')):
+            translator.translate_excel_file(input_path, output_path, direction=options['direction'])
+        seconds = time.perf_counter() - started
+        timer.close()
+
+        result.update({
+            'status': 'ok',
+            'seconds': round(seconds, 4),
+            'engine_calls': engine.calls,
+            'cache_hits': timer.last_event.get('cache_hits'),
+            'stages': {stage: round(value, 4) for stage, value in timer.stages.items()},
+            'output_bytes': os.path.getsize(output_path) if os.path.exists(output_path) else None,
+        })
+    except ImportError as e:
+        result.update({'status': 'skipped', 'error': str(e)})
+    except Exception as e:
+        result.update({'status': 'error', 'error': f'{type(e).__name__}: {e}'})
+    result['peak_rss_mb'] = peak_rss_mb()
+    results.put(result)
+
+
+def run_engine(name, input_path, output_path, options, timeout=DEFAULT_TIMEOUT):
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=_run_engine, args=(name, input_path, output_path, options, results))
+    process.start()
+    try:
+        return results.get(timeout=timeout)
+    except Exception:
+        process.terminate()
+        return {'engine': name, 'status': 'timeout', 'error': f'{timeout}초 안에 끝나지 않음'}
+    finally:
+        process.join()
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def print_report(report, baseline=None):
+    baseline_seconds = {}
+    if baseline:
+        baseline_seconds = {r['engine']: r.get('seconds') for r in baseline.get('results', []) if r.get('status') == 'ok'}
+
+    workbook = report['workbook']
+    print(f"\n셀 {workbook['cells']}개, 텍스트 셀 {workbook['text_cells']}개, 고유 텍스트 {workbook['unique_texts']}개 (commit {report['commit']})")
+    print(f"{'엔진':<10}{'상태':<9}{'초':>9}{'셀/초':>11}{'고유/초':>10}{'호출':>8}{'RSS MB':>9}  비교")
+    for result in report['results']:
+        if result['status'] != 'ok':
+            print(f"{result['engine']:<10}{result['status']:<9}  {result.get('error', '')}")
+            continue
+        compare = ''
+        previous = baseline_seconds.get(result['engine'])
+        if previous:
+            compare = f"x{previous / result['seconds']:.2f} (기준 {previous:.2f}초)"
+        print(f"{result['engine']:<10}{'ok':<9}{result['seconds']:>9.2f}{result['cells_per_sec']:>11.0f}"
+              f"{result['unique_per_sec']:>10.0f}{result['engine_calls']:>8}{str(result['peak_rss_mb']):>9}  {compare}")
+        if result['stages']:
+            print('          ' + ', '.join(f'{stage} {value:.2f}s' for stage, value in result['stages'].items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='엑셀 번역기 처리량 벤치마크')
+    add_workbook_arguments(parser)
+    parser.add_argument('--engines', default=DEFAULT_ENGINES, help=f"실행할 번역기 ({', '.join(ENGINES)})")
+    parser.add_argument('--latency', type=float, default=0.0, help='가짜 엔진 호출당 지연 시간(초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='지연 시간 변동 폭(초)')
+    parser.add_argument('--workers', type=int, default=None, help='TRANSLATION_MAX_WORKERS (템플릿/직접 수정 번역기)')
+    parser.add_argument('--direction', default='ko-zh', choices=('ko-zh', 'zh-ko'))
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='번역기 하나의 최대 실행 시간(초)')
+    parser.add_argument('--output', help='결과 JSON 파일 경로')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일')
+    parser.add_argument('--verbose', action='store_true', help='번역기 출력 표시')
+    args = parser.parse_args()
+
+    engines = [name.strip() for name in args.engines.split(',') if name.strip()]
+    unknown = [name for name in engines if name not in ENGINES]
+    if unknown:
+        parser.error(f"알 수 없는 번역기: {', '.join(unknown)}")
+
+    options = {
+        'latency': args.latency,
+        'jitter': args.jitter,
+        'seed': args.seed,
+        'workers': args.workers,
+        'direction': args.direction,
+        'verbose': args.verbose,
+    }
+
+    with tempfile.TemporaryDirectory(prefix='translator-bench-') as work_dir:
+        input_path = os.path.join(work_dir, 'synthetic.xlsx')
+        started = time.perf_counter()
+        workbook = generate_workbook(input_path, **workbook_options(args))
+        workbook['generate_seconds'] = round(time.perf_counter() - started, 4)
+        workbook['path'] = None
+        print(f"합성 파일 생성: 셀 {workbook['cells']}개, 고유 텍스트 {workbook['unique_texts']}개 ({workbook['generate_seconds']}초)")
+
+        results = []
+        for name in engines:
+            print(f"실행 중: {name}")
+            result = run_engine(name, input_path, os.path.join(work_dir, f'{name}.xlsx'), options, args.timeout)
+            if result['status'] == 'ok':
+                result['cells_per_sec'] = round(workbook['cells'] / result['seconds'], 1)
+                result['unique_per_sec'] = round(workbook['unique_texts'] / result['seconds'], 1)
+            results.append(result)
+
+    report = {
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'options': {**workbook_options(args), **options},
+        'workbook': workbook,
+        'results': results,
+    }
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
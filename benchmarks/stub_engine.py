@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 프로세스 내 가짜 번역 엔진 - 네트워크 없이 정해진 지연 시간 후 결정적인 번역문 반환
+같은 텍스트는 항상 같은 지연 시간/번역문을 돌려주므로 실행마다 결과를 비교할 수 있음
+"""
+
+import random
+import threading
+import time
+import zlib
+
+
+class StubEngine:
+    def __init__(self, latency=0.0, jitter=0.0, seed=0):
+        # 호출당 지연 시간 (초): latency ± jitter 범위에서 텍스트별로 고정
+        self.latency = latency
+        self.jitter = jitter
+        self.seed = seed
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def delay_for(self, text):
+        if not self.jitter:
+            return self.latency
+        rng = random.Random(zlib.crc32(text.encode('utf-8')) ^ self.seed)
+        return max(0.0, self.latency + rng.uniform(-self.jitter, self.jitter))
+
+    def translate(self, text, direction):
+        with self._lock:
+            self.calls += 1
+        delay = self.delay_for(text)
+        if delay:
+            time.sleep(delay)
+        prefix = '[zh]' if direction == 'ko-zh' else '[ko]'
+        return f'{prefix}{text}'
+
+
+def install_stub(translator, engine):
+    """번역기 인스턴스의 네트워크 엔진 호출을 가짜 엔진으로 교체
+    (템플릿/직접 수정 번역기: Google 자리만 응답하고 나머지 엔진은 실패 처리, v1/v2: LibreTranslate API 교체)"""
+    if hasattr(translator, 'translate_with_google'):
+        translator.translate_with_google = engine.translate
+        translator.translate_with_libretranslate = lambda text, source_lang, target_lang: None
+        translator.translate_with_huggingface = lambda text, direction: None
+        translator.translate_with_ollama = lambda text, direction: None
+    elif hasattr(translator, 'translate_with_api'):
+        translator.translate_with_api = lambda text, source_lang, target_lang: engine.translate(
+            text, 'ko-zh' if source_lang == 'ko' else 'zh-ko'
+        )
+    else:
+        raise TypeError(f'{type(translator).__name__}: 가짜 엔진을 연결할 번역 메서드가 없습니다.')
+    return translator
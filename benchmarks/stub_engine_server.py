@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+가짜 번역 엔진 서버 - LibreTranslate(/translate), Ollama(/api/generate), Hugging Face(/models/<모델>) 요청/응답 형식
+지연 시간 분포, 오류율, 429 제한, 타임아웃을 지정하여 폴백/경쟁/서킷 브레이커 동작을 오프라인에서 재현 가능하게 테스트
+실제 서비스 응답을 녹화(--record)해 두었다가 그대로 재생(--replay)할 수도 있음
+
+같은 seed면 같은 텍스트의 n번째 요청은 요청 순서와 관계없이 항상 같은 지연 시간/결과를 받음
+
+사용법:
+    python benchmarks/stub_engine_server.py --port 5055 --latency 0.2 --jitter 0.1 --dist lognormal --error-rate 0.05
+
+    # 번역 서버가 가짜 서버를 사용하도록 설정 (Google/Deep Translator는 주소를 바꿀 수 없으므로 제외)
+    LIBRETRANSLATE_URLS=http://localhost:5055/translate \\
+    OLLAMA_URL=http://localhost:5055/api/generate \\
+    HUGGINGFACE_API_URL=http://localhost:5055/models/{model} \\
+    TRANSLATION_ENGINES=libretranslate,huggingface,ollama python translate-server.py
+
+    # 실행 중 설정 변경 (엔진별로 지정 가능) / 통계 조회
+    curl -X POST localhost:5055/_stub/config -d '{"ollama": {"error_rate": 1.0}}'
+    curl localhost:5055/_stub/stats
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+ENDPOINTS = ('libretranslate', 'ollama', 'huggingface')
+DISTRIBUTIONS = ('constant', 'uniform', 'normal', 'exponential', 'lognormal')
+
+DEFAULT_CONFIG = {
+    # 지연 시간 (초): constant=latency, uniform=latency±jitter, normal=평균 latency/표준편차 jitter,
+    # exponential=평균 latency, lognormal=중앙값 latency/형태 jitter
+    'latency': 0.05,
+    'jitter': 0.0,
+    'dist': 'constant',
+    # 요청 중 500 오류 / 429 제한 / 응답 없이 대기(타임아웃 유도) 비율
+    'error_rate': 0.0,
+    'throttle_rate': 0.0,
+    'timeout_rate': 0.0,
+    # 타임아웃을 유도할 때 응답을 미루는 시간 (초, 클라이언트 timeout보다 길게)
+    'hang_seconds': 30.0,
+    # 초당 허용 요청 수 (0: 제한 없음, 초과 시 429 + Retry-After)
+    'rate_limit': 0.0,
+    'retry_after': 1,
+}
+
+
+class FaultConfig:
+    """엔진별 설정 (엔진별 값이 없으면 기본값 사용) - 실행 중 /_stub/config로 변경 가능"""
+
+    def __init__(self, default):
+        self._lock = threading.Lock()
+        self._default = dict(DEFAULT_CONFIG, **default)
+        self._endpoints = {}
+
+    def get(self, endpoint):
+        with self._lock:
+            return dict(self._default, **self._endpoints.get(endpoint, {}))
+
+    def update(self, changes):
+        """{"latency": 0.1} 처럼 기본값을, {"ollama": {"error_rate": 1}} 처럼 엔진별 값을 변경"""
+        with self._lock:
+            for key, value in changes.items():
+                if key in ENDPOINTS and isinstance(value, dict):
+                    self._check(value)
+                    self._endpoints.setdefault(key, {}).update(value)
+                else:
+                    self._check({key: value})
+                    self._default[key] = value
+            return {'default': dict(self._default), **{name: dict(values) for name, values in self._endpoints.items()}}
+
+    def _check(self, values):
+        for key, value in values.items():
+            if key not in DEFAULT_CONFIG:
+                raise ValueError(f'알 수 없는 설정: {key}')
+            if key == 'dist' and value not in DISTRIBUTIONS:
+                raise ValueError(f"지연 분포는 {', '.join(DISTRIBUTIONS)} 중 하나여야 합니다.")
+
+
+def sample_latency(rng, config):
+    latency, jitter, dist = config['latency'], config['jitter'], config['dist']
+    if dist == 'uniform':
+        value = rng.uniform(latency - jitter, latency + jitter)
+    elif dist == 'normal':
+        value = rng.gauss(latency, jitter)
+    elif dist == 'exponential':
+        value = rng.expovariate(1 / latency) if latency > 0 else 0.0
+    elif dist == 'lognormal':
+        value = latency * math.exp(rng.gauss(0, jitter)) if latency > 0 else 0.0
+    else:
+        value = latency
+    return max(0.0, value)
+
+
+class RateLimiter:
+    """초당 요청 수 제한 (토큰 버킷, 버킷 크기 = 초당 허용 수)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tokens = {}
+        self._updated = {}
+
+    def allow(self, endpoint, rate):
+        if rate <= 0:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            tokens = self._tokens.get(endpoint, rate)
+            tokens = min(rate, tokens + (now - self._updated.get(endpoint, now)) * rate)
+            self._updated[endpoint] = now
+            allowed = tokens >= 1
+            self._tokens[endpoint] = tokens - 1 if allowed else tokens
+            return allowed
+
+
+class Cassette:
+    """녹화된 실제 응답 (JSON Lines: endpoint, key, status, body) - 같은 요청은 같은 응답으로 재생"""
+
+    def __init__(self, path, recording):
+        self.path = path
+        self.recording = recording
+        self._lock = threading.Lock()
+        self._responses = {}
+        if not recording:
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._responses[(entry['endpoint'], entry['key'])] = (entry['status'], entry['body'])
+
+    @staticmethod
+    def key(payload):
+        return json.dumps(payload, sort_keys=True, ensure_ascii=False)
+
+    def lookup(self, endpoint, payload):
+        return self._responses.get((endpoint, self.key(payload)))
+
+    def record(self, endpoint, payload, status, body):
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'endpoint': endpoint, 'key': self.key(payload), 'status': status, 'body': body}, ensure_ascii=False) + '\n')
+
+
+def fake_translation(text, target):
+    return f'[{target}]{text}'
+
+
+def build_response(endpoint, payload, path):
+    """엔진 형식에 맞는 가짜 응답 본문"""
+    if endpoint == 'libretranslate':
+        target = payload.get('target', 'zh')
+        texts = payload.get('q', '')
+        if isinstance(texts, list):
+            return {'translatedText': [fake_translation(text, target) for text in texts]}
+        return {'translatedText': fake_translation(texts, target)}
+    if endpoint == 'ollama':
+        # 프롬프트 마지막 단락이 번역할 원문
+        text = str(payload.get('prompt', '')).rsplit('\n\n', 1)[-1]
+        target = 'zh' if '중국어로' in str(payload.get('prompt', '')) else 'ko'
+        return {
+            'model': payload.get('model', 'stub'),
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'response': fake_translation(text, target),
+            'done': True
+        }
+    target = 'zh' if path.rstrip('/').endswith('-zh') else 'ko'
+    return [{'translation_text': fake_translation(str(payload.get('inputs', '')), target)}]
+
+
+def request_text(endpoint, payload):
+    if endpoint == 'libretranslate':
+        return json.dumps(payload.get('q', ''), ensure_ascii=False)
+    if endpoint == 'ollama':
+        return str(payload.get('prompt', ''))
+    return str(payload.get('inputs', ''))
+
+
+class StubEngineServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, config, seed=0, cassette=None, upstreams=None, strict_replay=False):
+        super().__init__(address, StubEngineHandler)
+        self.config = config
+        self.seed = seed
+        self.cassette = cassette
+        self.upstreams = upstreams or {}
+        self.strict_replay = strict_replay
+        self.rate_limiter = RateLimiter()
+        self._lock = threading.Lock()
+        self._seen = Counter()
+        self.stats = Counter()
+
+    def rng_for(self, endpoint, payload):
+        """같은 요청 내용의 n번째 요청마다 고정된 난수 (동시 요청 순서와 무관하게 재현 가능)"""
+        text = request_text(endpoint, payload)
+        with self._lock:
+            self._seen[(endpoint, text)] += 1
+            attempt = self._seen[(endpoint, text)]
+        return random.Random(f'{self.seed}:{endpoint}:{attempt}:{text}')
+
+    def count(self, endpoint, outcome):
+        with self._lock:
+            self.stats[f'{endpoint}.{outcome}'] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.stats)
+
+
+class StubEngineHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # 헤더와 본문을 따로 쓰므로 Nagle을 켜 두면 keep-alive 연결에서 응답마다 지연 ACK(약 40ms)만큼 늦어짐
+    disable_nagle_algorithm = True
+
+    def _endpoint(self):
+        if self.path.startswith('/translate'):
+            return 'libretranslate'
+        if self.path.startswith('/api/generate'):
+            return 'ollama'
+        if self.path.startswith('/models/'):
+            return 'huggingface'
+        return None
+
+    def _send_json(self, status, body, headers=None):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'{}')
+
+    def do_GET(self):
+        if self.path == '/_stub/stats':
+            self._send_json(200, self.server.snapshot())
+        elif self.path == '/_stub/config':
+            self._send_json(200, self.server.config.update({}))
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        try:
+            payload = self._read_json()
+        except (ValueError, UnicodeDecodeError):
+            self._send_json(400, {'error': 'invalid json'})
+            return
+
+        if self.path == '/_stub/config':
+            try:
+                self._send_json(200, self.server.config.update(payload))
+            except ValueError as e:
+                self._send_json(400, {'error': str(e)})
+            return
+
+        endpoint = self._endpoint()
+        if endpoint is None:
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        server = self.server
+        config = server.config.get(endpoint)
+        rng = server.rng_for(endpoint, payload)
+
+        if not server.rate_limiter.allow(endpoint, config['rate_limit']):
+            server.count(endpoint, 'rate_limited')
+            self._send_json(429, {'error': 'Too many requests'}, {'Retry-After': config['retry_after']})
+            return
+
+        # 장애 주입: 한 번의 난수로 타임아웃 / 429 / 500 / 정상 중 하나 선택
+        roll = rng.random()
+        if roll < config['timeout_rate']:
+            server.count(endpoint, 'timeout')
+            time.sleep(config['hang_seconds'])
+            self._send_json(504, {'error': 'Gateway timeout'})
+            return
+        roll -= config['timeout_rate']
+        if roll < config['throttle_rate']:
+            server.count(endpoint, 'throttled')
+            self._send_json(429, {'error': 'Too many requests'}, {'Retry-After': config['retry_after']})
+            return
+        roll -= config['throttle_rate']
+        if roll < config['error_rate']:
+            time.sleep(sample_latency(rng, config))
+            server.count(endpoint, 'error')
+            self._send_json(500, {'error': 'Internal server error'})
+            return
+
+        status, body = self._respond(endpoint, payload, config, rng)
+        server.count(endpoint, 'ok' if status == 200 else f'status_{status}')
+        self._send_json(status, body)
+
+    def _respond(self, endpoint, payload, config, rng):
+        """정상 응답: 녹화 재생 > 실제 서비스 녹화 > 가짜 번역 순"""
+        cassette = self.server.cassette
+        if cassette is not None and not cassette.recording:
+            recorded = cassette.lookup(endpoint, payload)
+            if recorded is not None:
+                time.sleep(sample_latency(rng, config))
+                return recorded
+            if self.server.strict_replay:
+                return 404, {'error': 'no recorded response'}
+
+        upstream = self.server.upstreams.get(endpoint)
+        if cassette is not None and cassette.recording and upstream:
+            url = upstream.format(model=self.path[len('/models/'):]) if endpoint == 'huggingface' else upstream
+            try:
+                response = requests.post(url, json=payload, timeout=60)
+                body = response.json()
+            except (requests.exceptions.RequestException, ValueError) as e:
+                return 502, {'error': f'upstream error: {e}'}
+            cassette.record(endpoint, payload, response.status_code, body)
+            return response.status_code, body
+
+        time.sleep(sample_latency(rng, config))
+        return 200, build_response(endpoint, payload, self.path)
+
+    def log_message(self, format, *args):
+        # 부하 테스트 중 요청마다 로그를 남기지 않음
+        pass
+
+
+def parse_upstreams(values):
+    """--upstream libretranslate=https://libretranslate.com/translate 형식"""
+    upstreams = {}
+    for value in values or []:
+        endpoint, _, url = value.partition('=')
+        if endpoint not in ENDPOINTS or not url:
+            raise ValueError(f'잘못된 --upstream 값: {value}')
+        upstreams[endpoint] = url
+    return upstreams
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가짜 번역 엔진 서버 (LibreTranslate/Ollama/Hugging Face 형식)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5055)
+    parser.add_argument('--latency', type=float, default=DEFAULT_CONFIG['latency'])
+    parser.add_argument('--jitter', type=float, default=DEFAULT_CONFIG['jitter'])
+    parser.add_argument('--dist', choices=DISTRIBUTIONS, default=DEFAULT_CONFIG['dist'])
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--timeout-rate', type=float, default=0.0)
+    parser.add_argument('--hang-seconds', type=float, default=DEFAULT_CONFIG['hang_seconds'])
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='엔진별 초당 허용 요청 수')
+    parser.add_argument('--retry-after', type=int, default=DEFAULT_CONFIG['retry_after'])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--record', metavar='FILE', help='실제 서비스(--upstream) 응답을 녹화할 파일')
+    parser.add_argument('--replay', metavar='FILE', help='녹화된 응답을 재생할 파일')
+    parser.add_argument('--strict', action='store_true', help='재생 시 녹화에 없는 요청은 404 (기본: 가짜 번역)')
+    parser.add_argument('--upstream', action='append', help='녹화할 실제 서비스 (예: libretranslate=https://libretranslate.com/translate)')
+    args = parser.parse_args()
+
+    if args.record and args.replay:
+        parser.error('--record와 --replay는 함께 쓸 수 없습니다.')
+    try:
+        upstreams = parse_upstreams(args.upstream)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.record and not upstreams:
+        parser.error('--record에는 --upstream이 필요합니다.')
+
+    config = FaultConfig({
+        'latency': args.latency,
+        'jitter': args.jitter,
+        'dist': args.dist,
+        'error_rate': args.error_rate,
+        'throttle_rate': args.throttle_rate,
+        'timeout_rate': args.timeout_rate,
+        'hang_seconds': args.hang_seconds,
+        'rate_limit': args.rate_limit,
+        'retry_after': args.retry_after,
+    })
+    cassette = None
+    if args.record or args.replay:
+        cassette = Cassette(args.record or args.replay, recording=bool(args.record))
+
+    server = StubEngineServer((args.host, args.port), config, seed=args.seed, cassette=cassette,
+                              upstreams=upstreams, strict_replay=args.strict)
+    print(f"가짜 번역 엔진 서버: http://{args.host}:{args.port} (/translate, /api/generate, /models/<모델>)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print('\n종료합니다...')
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
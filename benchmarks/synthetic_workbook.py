@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 합성 엑셀 파일 생성기
+시트/행/열 수, 중복 비율, 한국어/중국어/영문 비율, 병합 셀, 서식을 지정하여 같은 seed면 항상 같은 파일 생성
+
+사용법:
+    python benchmarks/synthetic_workbook.py out.xlsx --sheets 3 --rows 2000 --cols 8 --duplicate-ratio 0.6
+"""
+
+import argparse
+import random
+
+import openpyxl
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+DEFAULT_SHEETS = 3
+DEFAULT_ROWS = 1000
+DEFAULT_COLS = 8
+# 텍스트 셀 중 앞에서 나온 문자열을 다시 쓰는 비율
+DEFAULT_DUPLICATE_RATIO = 0.5
+# 한국어:중국어:영문 비율
+DEFAULT_LANGUAGE_MIX = (0.6, 0.2, 0.2)
+# 숫자 셀 비율 (번역 대상이 아닌 셀)
+DEFAULT_NUMERIC_RATIO = 0.2
+# 시트당 병합 셀 수
+DEFAULT_MERGED_PER_SHEET = 20
+
+# 번역 사전 경로도 거치도록 섞어 넣는 발주서 용어
+GLOSSARY_TERMS = ['발주서', '수주처', '품목', '수량', '단위', '비고', '합계', '납기일자']
+
+_THIN = Side(style='thin')
+_STYLES = [
+    {'font': Font(bold=True)},
+    {'fill': PatternFill('solid', fgColor='FFF2CC')},
+    {'border': Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)},
+    {'alignment': Alignment(horizontal='center', wrap_text=True)},
+]
+
+
+def _random_word(rng, start, size, min_len, max_len):
+    return ''.join(chr(start + rng.randrange(size)) for _ in range(rng.randint(min_len, max_len)))
+
+
+def _korean_text(rng):
+    words = [_random_word(rng, 0xAC00, 11172, 2, 4) for _ in range(rng.randint(1, 4))]
+    if rng.random() < 0.2:
+        words.insert(rng.randrange(len(words) + 1), rng.choice(GLOSSARY_TERMS))
+    return ' '.join(words)
+
+
+def _chinese_text(rng):
+    return _random_word(rng, 0x4E00, 20902, 2, 8)
+
+
+def _english_text(rng):
+    return ' '.join(_random_word(rng, ord('a'), 26, 3, 8) for _ in range(rng.randint(1, 3))).capitalize()
+
+
+class TextSource:
+    """중복 비율/언어 비율에 맞춰 셀 텍스트를 생성 (중복은 앞에서 만든 문자열 중에서 선택)"""
+
+    def __init__(self, rng, duplicate_ratio=DEFAULT_DUPLICATE_RATIO, language_mix=DEFAULT_LANGUAGE_MIX):
+        self.rng = rng
+        self.duplicate_ratio = duplicate_ratio
+        total = sum(language_mix) or 1
+        self.language_weights = [weight / total for weight in language_mix]
+        self.generated = []
+        self._seen = set()
+
+    def next(self):
+        if self.generated and self.rng.random() < self.duplicate_ratio:
+            return self.rng.choice(self.generated)
+        make = self.rng.choices((_korean_text, _chinese_text, _english_text), weights=self.language_weights)[0]
+        text = make(self.rng)
+        if text not in self._seen:
+            self._seen.add(text)
+            self.generated.append(text)
+        return text
+
+
+def generate_workbook(path, sheets=DEFAULT_SHEETS, rows=DEFAULT_ROWS, cols=DEFAULT_COLS,
+                      duplicate_ratio=DEFAULT_DUPLICATE_RATIO, language_mix=DEFAULT_LANGUAGE_MIX,
+                      numeric_ratio=DEFAULT_NUMERIC_RATIO, merged_per_sheet=DEFAULT_MERGED_PER_SHEET,
+                      styled=True, seed=0):
+    """합성 엑셀 파일을 만들고 파일 정보(셀 수, 텍스트 셀 수, 고유 텍스트 수) 반환"""
+    rng = random.Random(seed)
+    texts = TextSource(rng, duplicate_ratio, language_mix)
+    workbook = openpyxl.Workbook()
+    workbook.remove(workbook.active)
+
+    cells = text_cells = merged = 0
+    unique_texts = set()
+    for sheet_index in range(sheets):
+        sheet = workbook.create_sheet(f'시트{sheet_index + 1}')
+        for row in range(1, rows + 1):
+            for column in range(1, cols + 1):
+                if rng.random() < numeric_ratio:
+                    value = rng.randint(1, 100000)
+                else:
+                    value = texts.next()
+                    text_cells += 1
+                    unique_texts.add(value)
+                cell = sheet.cell(row=row, column=column, value=value)
+                cells += 1
+                if styled and rng.random() < 0.3:
+                    for name, style in rng.choice(_STYLES).items():
+                        setattr(cell, name, style)
+
+        # 병합 셀은 겹치지 않도록 2행 간격의 가로 병합으로 생성
+        for _ in range(min(merged_per_sheet, rows // 2)):
+            if cols < 2:
+                break
+            row = rng.randrange(1, rows // 2) * 2 if rows >= 4 else 1
+            start = rng.randint(1, cols - 1)
+            try:
+                sheet.merge_cells(start_row=row, start_column=start, end_row=row, end_column=min(cols, start + rng.randint(1, 2)))
+                merged += 1
+            except ValueError:
+                continue
+
+    workbook.save(path)
+    return {
+        'path': path,
+        'sheets': sheets,
+        'cells': cells,
+        'text_cells': text_cells,
+        'unique_texts': len(unique_texts),
+        'merged_ranges': sum(len(ws.merged_cells.ranges) for ws in workbook.worksheets),
+        'seed': seed
+    }
+
+
+def add_workbook_arguments(parser):
+    parser.add_argument('--sheets', type=int, default=DEFAULT_SHEETS)
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS)
+    parser.add_argument('--cols', type=int, default=DEFAULT_COLS)
+    parser.add_argument('--duplicate-ratio', type=float, default=DEFAULT_DUPLICATE_RATIO)
+    parser.add_argument('--mix', default=','.join(str(weight) for weight in DEFAULT_LANGUAGE_MIX),
+                        help='한국어,중국어,영문 비율 (예: 0.6,0.2,0.2)')
+    parser.add_argument('--numeric-ratio', type=float, default=DEFAULT_NUMERIC_RATIO)
+    parser.add_argument('--merged', type=int, default=DEFAULT_MERGED_PER_SHEET, help='시트당 병합 셀 수')
+    parser.add_argument('--no-styles', action='store_true', help='서식 없이 생성')
+    parser.add_argument('--seed', type=int, default=0)
+
+
+def workbook_options(args):
+    return {
+        'sheets': args.sheets,
+        'rows': args.rows,
+        'cols': args.cols,
+        'duplicate_ratio': args.duplicate_ratio,
+        'language_mix': tuple(float(weight) for weight in args.mix.split(',')),
+        'numeric_ratio': args.numeric_ratio,
+        'merged_per_sheet': args.merged,
+        'styled': not args.no_styles,
+        'seed': args.seed
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='벤치마크용 합성 엑셀 파일 생성')
+    parser.add_argument('output')
+    add_workbook_arguments(parser)
+    args = parser.parse_args()
+    info = generate_workbook(args.output, **workbook_options(args))
+    print(f"생성 완료: {info['path']} (셀 {info['cells']}개, 텍스트 셀 {info['text_cells']}개, 고유 텍스트 {info['unique_texts']}개, 병합 {info['merged_ranges']}개)")
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+번역 엔진 주소 설정 - 환경 변수로 LibreTranslate/Ollama/Hugging Face 주소를 바꿀 수 있음
+(예: benchmarks/stub_engine_server.py 가짜 서버를 가리켜 오프라인 부하 테스트)
+호출할 때마다 환경 변수를 읽으므로 실행 중인 프로세스에서 바꿔도 다음 호출부터 적용
+"""
+
+import os
+
+DEFAULT_LIBRETRANSLATE_URLS = [
+    "https://libretranslate.de/translate",
+    "https://translate.argosopentech.com/translate",
+    "https://libretranslate.com/translate"
+]
+DEFAULT_OLLAMA_URL = "http://localhost:11434/api/generate"
+DEFAULT_OLLAMA_MODEL = "llama3.2:3b"
+# {model}은 모델 ID로 치환 (예: Helsinki-NLP/opus-mt-ko-zh)
+DEFAULT_HUGGINGFACE_URL = "https://api-inference.huggingface.co/models/{model}"
+
+
+def libretranslate_urls():
+    """LibreTranslate 미러 목록 (LIBRETRANSLATE_URLS: 쉼표로 구분, 앞에서부터 시도)"""
+    urls = [url.strip() for url in os.environ.get('LIBRETRANSLATE_URLS', '').split(',') if url.strip()]
+    return urls or list(DEFAULT_LIBRETRANSLATE_URLS)
+
+
+def ollama_url():
+    return os.environ.get('OLLAMA_URL') or DEFAULT_OLLAMA_URL
+
+
+def ollama_model():
+    return os.environ.get('OLLAMA_MODEL') or DEFAULT_OLLAMA_MODEL
+
+
+def huggingface_url(model_id):
+    return (os.environ.get('HUGGINGFACE_API_URL') or DEFAULT_HUGGINGFACE_URL).format(model=model_id)
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+번역 엔진 상태 추적기 - 서킷 브레이커 + 적응형 엔진 순서
+엔진/URL별로 성공률과 지연 시간을 추적하고, 연속 실패한 백엔드는 일정 시간 호출하지 않음(open)
+대기 시간이 지나면 한 번만 시험 호출(half-open)하여 복구 여부 확인
+번역 서버와 ExcelTranslatorTemplate이 같은 인스턴스를 공유
+db_path를 주면 상태를 SQLite에 저장하여 여러 작업자 프로세스가 같은 차단 상태를 공유
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from engine_registry import get_engine_registry
+from metrics import get_metrics
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# 연속 실패 몇 번에 차단할지
+DEFAULT_FAILURE_THRESHOLD = 3
+# 첫 차단 시간 (초), 시험 호출이 실패할 때마다 두 배로 늘어남
+DEFAULT_OPEN_SECONDS = 30
+DEFAULT_MAX_OPEN_SECONDS = 600
+# 성공률/지연 시간 지수 이동 평균 가중치
+EWMA_ALPHA = 0.2
+# 적응형 순서에 반영하기 위한 최소 관측 수
+MIN_SAMPLES = 5
+# 여러 프로세스가 차단 상태를 공유할 때 기본 SQLite 파일 (serve.py, batch_translate.py)
+DEFAULT_SHARED_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'engine_health.db')
+# 시험 호출을 맡은 프로세스가 결과를 기록하지 못하고 죽었을 때 다른 시험 호출을 허용하기까지의 시간 (초)
+PROBE_TIMEOUT = 60
+# 공유 저장소에 저장하는 차단 상태 필드 (이 값이 바뀔 때만 쓰기 트랜잭션)
+BREAKER_FIELDS = ('state', 'consecutive_failures', 'open_until', 'open_seconds', 'probe_in_flight', 'probe_started')
+# 성공률/지연 시간/횟수 통계를 공유 저장소에 반영하는 최소 간격 (초)
+STATS_FLUSH_INTERVAL = 5.0
+
+
+class EngineHealthTracker:
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, open_seconds=DEFAULT_OPEN_SECONDS,
+                 max_open_seconds=DEFAULT_MAX_OPEN_SECONDS, adaptive_order=True, db_path=None):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.adaptive_order = adaptive_order
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._backends = {}
+        # 공유 저장소를 쓸 때 아직 반영하지 않은 이 프로세스의 통계
+        self._local_stats = {}
+
+        # 공유 저장소 (작업자 프로세스 간 차단 상태 공유, 없으면 프로세스 내 dict만 사용)
+        self._conn = None
+        if db_path:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30, isolation_level=None)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS engine_health ('
+                ' backend TEXT PRIMARY KEY,'
+                ' entry TEXT NOT NULL,'
+                ' updated_at REAL NOT NULL)'
+            )
+
+    def _new_entry(self):
+        return {
+            'state': CLOSED,
+            'consecutive_failures': 0,
+            'open_until': 0.0,
+            'open_seconds': self.open_seconds,
+            'probe_in_flight': False,
+            'probe_started': 0.0,
+            'success_rate': 1.0,
+            'latency': None,
+            'samples': 0,
+            'successes': 0,
+            'failures': 0,
+            'rejected': 0
+        }
+
+    def _read_shared_locked(self, key):
+        row = self._conn.execute('SELECT entry FROM engine_health WHERE backend = ?', (key,)).fetchone()
+        return dict(self._new_entry(), **json.loads(row[0])) if row else self._new_entry()
+
+    def _write_shared_locked(self, key, entry):
+        """공유 저장소에 저장하며 이 프로세스에 쌓인 통계도 함께 반영 (BEGIN IMMEDIATE 트랜잭션 안에서 호출)"""
+        self._apply_local_stats(key, entry)
+        self._local_stats.pop(key, None)
+        self._conn.execute(
+            'INSERT OR REPLACE INTO engine_health (backend, entry, updated_at) VALUES (?, ?, ?)',
+            (key, json.dumps(entry), time.time())
+        )
+
+    def _update(self, key, change):
+        """백엔드 하나의 차단 상태를 change(entry)로 고치고 change의 반환값을 돌려줌
+        공유 저장소는 먼저 쓰기 트랜잭션 없이 읽어서 계산해 보고, 차단 상태가 실제로 바뀔 때만
+        BEGIN IMMEDIATE로 다시 읽어 계산한 뒤 저장 (닫힌 상태의 allow/성공 기록은 쓰기 잠금을 다투지 않음)"""
+        with self._lock:
+            if self._conn is None:
+                entry = self._backends.get(key)
+                if entry is None:
+                    entry = self._backends[key] = self._new_entry()
+                return change(entry)
+
+            entry = self._read_shared_locked(key)
+            before = [entry[field] for field in BREAKER_FIELDS]
+            result = change(entry)
+            if [entry[field] for field in BREAKER_FIELDS] != before:
+                self._conn.execute('BEGIN IMMEDIATE')
+                try:
+                    entry = self._read_shared_locked(key)
+                    result = change(entry)
+                    self._write_shared_locked(key, entry)
+                    self._conn.execute('COMMIT')
+                except BaseException:
+                    self._conn.execute('ROLLBACK')
+                    raise
+            self._backends[key] = entry
+            return result
+
+    def _load_all_locked(self):
+        """공유 저장소의 최신 상태를 읽어 옴 (self._lock을 잡은 상태에서 호출, 아직 저장하지 않은 이 프로세스의 통계 포함)"""
+        if self._conn is not None:
+            for key, entry in self._conn.execute('SELECT backend, entry FROM engine_health'):
+                self._backends[key] = dict(self._new_entry(), **json.loads(entry))
+            for key in self._local_stats:
+                self._backends.setdefault(key, self._new_entry())
+            return {key: self._apply_local_stats(key, dict(entry)) for key, entry in self._backends.items()}
+        return self._backends
+
+    def allow(self, key):
+        """호출 가능 여부 (차단 중이면 False, 대기 시간이 지났으면 시험 호출 한 번만 허용)"""
+        def change(entry):
+            if entry['state'] == CLOSED:
+                return True
+
+            now = time.time()
+            if entry['state'] == OPEN and now >= entry['open_until']:
+                entry['state'] = HALF_OPEN
+                entry['probe_in_flight'] = False
+
+            if entry['state'] == HALF_OPEN and (
+                    not entry['probe_in_flight'] or now - entry['probe_started'] >= PROBE_TIMEOUT):
+                entry['probe_in_flight'] = True
+                entry['probe_started'] = now
+                return True
+            return False
+
+        allowed = self._update(key, change)
+        if not allowed:
+            self._count(key, 'rejected')
+        return allowed
+
+    def release(self, key):
+        """허용받았지만 실제로 호출하지 않은 경우 시험 호출 자리 반납"""
+        def change(entry):
+            if entry['state'] == HALF_OPEN:
+                entry['probe_in_flight'] = False
+        self._update(key, change)
+
+    def _local_entry(self, key):
+        """공유 저장소에 아직 반영하지 않은 이 프로세스의 통계 (횟수는 증가분, 성공률/지연 시간은 이동 평균 값)"""
+        local = self._local_stats.get(key)
+        if local is None:
+            base = self._backends.get(key) or self._new_entry()
+            local = self._local_stats[key] = {
+                'samples': 0, 'successes': 0, 'failures': 0, 'rejected': 0,
+                'success_rate': base['success_rate'], 'latency': base['latency'],
+                'since': time.monotonic()
+            }
+        return local
+
+    def _apply_local_stats(self, key, entry):
+        local = self._local_stats.get(key)
+        if local is not None:
+            for field in ('samples', 'successes', 'failures', 'rejected'):
+                entry[field] += local[field]
+            if local['samples']:
+                entry['success_rate'] = local['success_rate']
+                entry['latency'] = local['latency']
+        return entry
+
+    def _flush_stats_locked(self, key):
+        """쌓인 통계를 공유 저장소에 반영 (프로세스마다 백엔드별로 STATS_FLUSH_INTERVAL에 한 번)"""
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._write_shared_locked(key, self._read_shared_locked(key))
+            self._conn.execute('COMMIT')
+        except BaseException:
+            self._conn.execute('ROLLBACK')
+            raise
+
+    def _count(self, key, field):
+        with self._lock:
+            if self._conn is None:
+                entry = self._backends.get(key)
+                if entry is None:
+                    entry = self._backends[key] = self._new_entry()
+                entry[field] += 1
+            else:
+                self._local_entry(key)[field] += 1
+
+    def _observe(self, key, success, latency):
+        """성공률/지연 시간 이동 평균 갱신 (공유 저장소를 쓰면 프로세스 안에 모았다가 주기적으로 반영)"""
+        with self._lock:
+            if self._conn is None:
+                entry = self._backends.get(key)
+                if entry is None:
+                    entry = self._backends[key] = self._new_entry()
+            else:
+                entry = self._local_entry(key)
+            entry['samples'] += 1
+            entry['success_rate'] += EWMA_ALPHA * ((1.0 if success else 0.0) - entry['success_rate'])
+            if latency is not None:
+                if entry['latency'] is None:
+                    entry['latency'] = latency
+                else:
+                    entry['latency'] += EWMA_ALPHA * (latency - entry['latency'])
+            entry['successes' if success else 'failures'] += 1
+
+            if self._conn is not None and time.monotonic() - entry['since'] >= STATS_FLUSH_INTERVAL:
+                self._flush_stats_locked(key)
+
+    def record_success(self, key, latency=None):
+        self._observe(key, True, latency)
+
+        def change(entry):
+            entry['consecutive_failures'] = 0
+            entry['state'] = CLOSED
+            entry['open_seconds'] = self.open_seconds
+            entry['probe_in_flight'] = False
+        self._update(key, change)
+
+    def record_failure(self, key, latency=None, hard=False):
+        """실패 기록 (hard=True: 연결 실패/타임아웃처럼 한 번만으로 차단할 실패)"""
+        self._observe(key, False, latency)
+
+        def change(entry):
+            entry['consecutive_failures'] += 1
+            if entry['state'] == HALF_OPEN:
+                # 시험 호출 실패: 차단 시간을 늘려서 다시 차단
+                entry['open_seconds'] = min(self.max_open_seconds, entry['open_seconds'] * 2)
+                self._open(entry)
+            elif hard or entry['consecutive_failures'] >= self.failure_threshold:
+                self._open(entry)
+        self._update(key, change)
+
+    def _open(self, entry):
+        entry['state'] = OPEN
+        # 여러 프로세스가 같은 값을 비교하므로 벽시계 시간 사용
+        entry['open_until'] = time.time() + entry['open_seconds']
+        entry['probe_in_flight'] = False
+
+    def order(self, names):
+        """관측된 성공률과 지연 시간으로 엔진 순서 조정
+        관측 데이터가 충분한 엔진끼리만 자리를 바꾸고, 데이터가 부족한 엔진은 원래 자리 유지"""
+        names = list(names)
+        if not self.adaptive_order:
+            return names
+
+        with self._lock:
+            backends = self._load_all_locked()
+            known = []
+            for index, name in enumerate(names):
+                entry = backends.get(name)
+                if entry is None or entry['samples'] < MIN_SAMPLES or entry['latency'] is None:
+                    continue
+                # 기대 비용: 성공 한 번을 얻기까지 걸리는 평균 시간 (차단된 엔진은 뒤로)
+                expected_cost = entry['latency'] / max(entry['success_rate'], 0.05)
+                known.append((entry['state'] != CLOSED, expected_cost, index))
+
+        slots = sorted(index for _, _, index in known)
+        ordered = list(names)
+        for slot, (_, _, index) in zip(slots, sorted(known)):
+            ordered[slot] = names[index]
+        return ordered
+
+    def snapshot(self):
+        with self._lock:
+            now = time.time()
+            result = {}
+            for key, entry in self._load_all_locked().items():
+                result[key] = {
+                    'state': entry['state'],
+                    'consecutive_failures': entry['consecutive_failures'],
+                    'retry_in': round(max(0.0, entry['open_until'] - now), 1) if entry['state'] == OPEN else 0,
+                    'success_rate': round(entry['success_rate'], 3),
+                    'latency': round(entry['latency'], 4) if entry['latency'] is not None else None,
+                    'successes': entry['successes'],
+                    'failures': entry['failures'],
+                    'rejected': entry['rejected']
+                }
+            return result
+
+
+# 프로세스 전역 공유 인스턴스
+_shared_tracker = None
+_shared_lock = threading.Lock()
+
+
+def get_engine_health():
+    """프로세스 전역 엔진 상태 추적기 (환경 변수로 임계값 설정 가능, ENGINE_HEALTH_DB를 주면 프로세스 간 공유)"""
+    global _shared_tracker
+    with _shared_lock:
+        if _shared_tracker is None:
+            _shared_tracker = EngineHealthTracker(
+                failure_threshold=int(os.environ.get('ENGINE_FAILURE_THRESHOLD', DEFAULT_FAILURE_THRESHOLD)),
+                open_seconds=float(os.environ.get('ENGINE_OPEN_SECONDS', DEFAULT_OPEN_SECONDS)),
+                max_open_seconds=float(os.environ.get('ENGINE_MAX_OPEN_SECONDS', DEFAULT_MAX_OPEN_SECONDS)),
+                adaptive_order=os.environ.get('ENGINE_ADAPTIVE_ORDER', 'true').lower() not in ('0', 'false', 'no', 'off'),
+                db_path=os.environ.get('ENGINE_HEALTH_DB') or None
+            )
+        return _shared_tracker
+
+
+# 스레드별 요청 타임아웃 상한 (경쟁 모드 엔진 호출이 limit_request_timeout으로 설정)
+_request_limits = threading.local()
+
+
+@contextmanager
+def limit_request_timeout(seconds):
+    """이 스레드에서 보내는 guarded_post 요청의 타임아웃 상한 (None이면 엔진별 타임아웃 그대로)"""
+    previous = getattr(_request_limits, 'timeout', None)
+    _request_limits.timeout = seconds
+    try:
+        yield
+    finally:
+        _request_limits.timeout = previous
+
+
+_backend_requests = get_metrics().counter(
+    'translator_backend_requests_total',
+    'URL별 요청 결과 (outcome: ok/http_error/timeout/connection_error/error/rejected)', ('backend', 'outcome'))
+
+
+def guarded_post(url, health=None, **kwargs):
+    """URL별 서킷 브레이커를 거친 POST 요청 (프로세스 공유 세션의 연결 풀 사용 - 호출마다 새로 연결하지 않음)
+    차단 중이면 요청하지 않고 None 반환, 연결 실패/타임아웃은 즉시 차단, 200이 아닌 응답은 실패로 누적"""
+    import requests
+
+    health = health or get_engine_health()
+    if not health.allow(url):
+        _backend_requests.inc(backend=url, outcome='rejected')
+        return None
+
+    limit = getattr(_request_limits, 'timeout', None)
+    if limit is not None:
+        kwargs['timeout'] = min(kwargs.get('timeout', limit), limit)
+
+    started = time.monotonic()
+    try:
+        response = get_engine_registry().session().post(url, **kwargs)
+    except requests.exceptions.RequestException as e:
+        health.record_failure(url, time.monotonic() - started, hard=True)
+        _backend_requests.inc(backend=url, outcome='timeout' if isinstance(e, requests.exceptions.Timeout) else 'connection_error')
+        return None
+    except Exception:
+        health.record_failure(url, time.monotonic() - started)
+        _backend_requests.inc(backend=url, outcome='error')
+        return None
+
+    if response.status_code == 200:
+        health.record_success(url, time.monotonic() - started)
+        _backend_requests.inc(backend=url, outcome='ok')
+    else:
+        health.record_failure(url, time.monotonic() - started)
+        _backend_requests.inc(backend=url, outcome='http_error')
+    return response
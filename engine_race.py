@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+번역 엔진 실행기 - 순차 폴백 / 헤지(hedged) 병렬 경쟁
+선호 엔진을 먼저 시작하고, 헤지 지연 시간이 지나도 응답이 없으면 다음 엔진을 추가로 시작하여
+가장 먼저 도착한 정상 결과를 사용 (느린 호출은 결과를 버리고 대기하지 않음)
+엔진별 승리/지연 통계를 기록하여 헤지 지연 값을 실제 데이터로 조정할 수 있게 함
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from engine_health import get_engine_health, limit_request_timeout
+from metrics import get_metrics
+
+# 다음 엔진을 추가로 시작하기 전 기본 대기 시간 (초)
+DEFAULT_HEDGE_DELAY = 1.5
+# 경쟁 모드에서 동시에 실행될 수 있는 엔진 호출 수
+DEFAULT_RACE_WORKERS = 16
+# 엔진별로 보관하는 최근 지연 시간 샘플 수
+LATENCY_SAMPLE_SIZE = 500
+# 프로세스 전체에서 동시에 진행될 수 있는 엔진 호출 수 (여러 작업이 동시에 실행되어도 소켓 수 제한)
+DEFAULT_MAX_CONCURRENCY = 32
+# 경쟁 모드 엔진 호출의 HTTP 요청 타임아웃 상한 (초) - 진 호출이 작업자 스레드를 오래 붙잡지 않도록
+DEFAULT_RACE_TIMEOUT = 8.0
+
+
+def is_race_mode_enabled():
+    """환경 변수 TRANSLATION_RACE_MODE로 경쟁 모드 사용 여부 결정 (기본: 순차 폴백)"""
+    return os.environ.get('TRANSLATION_RACE_MODE', '').lower() in ('1', 'true', 'yes', 'on')
+
+
+def load_enabled_engines():
+    """사용할 엔진 이름 집합 (TRANSLATION_ENGINES="libretranslate,ollama", 비어 있으면 전체 사용)"""
+    names = {name.strip() for name in os.environ.get('TRANSLATION_ENGINES', '').split(',') if name.strip()}
+    return names or None
+
+
+def load_hedge_delays():
+    """엔진별 헤지 지연 시간 로드 (예: TRANSLATION_HEDGE_DELAYS="google:0.8,libretranslate:2")"""
+    hedge_delays = {}
+    for item in os.environ.get('TRANSLATION_HEDGE_DELAYS', '').split(','):
+        if ':' not in item:
+            continue
+        name, delay = item.split(':', 1)
+        try:
+            hedge_delays[name.strip()] = float(delay)
+        except ValueError:
+            continue
+    return hedge_delays
+
+
+def race_request_timeout():
+    """경쟁 모드 요청 타임아웃 상한 (TRANSLATION_RACE_TIMEOUT, 0이면 엔진별 타임아웃 그대로)"""
+    try:
+        timeout = float(os.environ.get('TRANSLATION_RACE_TIMEOUT', DEFAULT_RACE_TIMEOUT))
+    except ValueError:
+        timeout = DEFAULT_RACE_TIMEOUT
+    return timeout if timeout > 0 else None
+
+
+def default_hedge_delay():
+    try:
+        return float(os.environ.get('TRANSLATION_HEDGE_DELAY', DEFAULT_HEDGE_DELAY))
+    except ValueError:
+        return DEFAULT_HEDGE_DELAY
+
+
+def _percentile(sorted_values, ratio):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(ratio * (len(sorted_values) - 1))))
+    return round(sorted_values[index], 4)
+
+
+class EngineStats:
+    """엔진별 실행/승리/실패 횟수와 성공 지연 시간 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines = {}
+
+    def _entry(self, name):
+        entry = self._engines.get(name)
+        if entry is None:
+            entry = {
+                'launched': 0,
+                'wins': 0,
+                'successes': 0,
+                'failures': 0,
+                'abandoned': 0,
+                'latencies': deque(maxlen=LATENCY_SAMPLE_SIZE)
+            }
+            self._engines[name] = entry
+        return entry
+
+    def record_launch(self, name):
+        with self._lock:
+            self._entry(name)['launched'] += 1
+
+    def record_result(self, name, latency, success, win=False):
+        with self._lock:
+            entry = self._entry(name)
+            if success:
+                entry['successes'] += 1
+                entry['latencies'].append(latency)
+                if win:
+                    entry['wins'] += 1
+            else:
+                entry['failures'] += 1
+
+    def record_abandoned(self, name):
+        with self._lock:
+            self._entry(name)['abandoned'] += 1
+
+    def snapshot(self):
+        """엔진별 통계 (헤지 지연 조정용 p50/p90/p95 지연 포함)"""
+        with self._lock:
+            result = {}
+            for name, entry in self._engines.items():
+                latencies = sorted(entry['latencies'])
+                p90 = _percentile(latencies, 0.90)
+                result[name] = {
+                    'launched': entry['launched'],
+                    'wins': entry['wins'],
+                    'successes': entry['successes'],
+                    'failures': entry['failures'],
+                    'abandoned': entry['abandoned'],
+                    'avg_latency': round(sum(latencies) / len(latencies), 4) if latencies else None,
+                    'p50_latency': _percentile(latencies, 0.50),
+                    'p90_latency': p90,
+                    'p95_latency': _percentile(latencies, 0.95),
+                    # 성공 호출의 90%가 이 시간 안에 끝나므로 다음 엔진을 시작하기 적당한 시점
+                    'suggested_hedge_delay': p90
+                }
+            return result
+
+
+# 프로세스 전역 공유 인스턴스
+_shared_stats = EngineStats()
+_executor = None
+_executor_lock = threading.Lock()
+_engine_slots = threading.BoundedSemaphore(
+    int(os.environ.get('TRANSLATION_MAX_CONCURRENCY', DEFAULT_MAX_CONCURRENCY))
+)
+
+
+def get_engine_stats():
+    return _shared_stats
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            max_workers = int(os.environ.get('TRANSLATION_RACE_WORKERS', DEFAULT_RACE_WORKERS))
+            _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='engine-race')
+        return _executor
+
+
+def _call_engine(engine):
+    """전역 동시 호출 제한 안에서 엔진 호출"""
+    with _engine_slots:
+        return engine()
+
+
+class _RaceCall:
+    """경쟁 모드 엔진 호출 하나 - 경쟁이 끝나면 호출이 끝나기 전이라도 전역 동시 호출 자리를 먼저 반납(abandon)"""
+
+    def __init__(self, engine, timeout=None):
+        self.engine = engine
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._held = False
+        self._abandoned = False
+        self.skipped = False
+
+    def __call__(self):
+        _engine_slots.acquire()
+        with self._lock:
+            if self._abandoned:
+                # 자리를 기다리는 동안 경쟁이 끝났으면 호출하지 않음
+                _engine_slots.release()
+                self.skipped = True
+                return None
+            self._held = True
+        try:
+            with limit_request_timeout(self.timeout):
+                return self.engine()
+        finally:
+            self._release()
+
+    def _release(self):
+        with self._lock:
+            held, self._held = self._held, False
+        if held:
+            _engine_slots.release()
+
+    def abandon(self):
+        with self._lock:
+            self._abandoned = True
+        self._release()
+
+
+_engine_requests = get_metrics().counter(
+    'translator_engine_requests_total', '엔진 호출 수 (result: success/failure)', ('engine', 'result'))
+_engine_latency = get_metrics().histogram(
+    'translator_engine_latency_seconds', '엔진 호출 지연 시간 (실패 포함)', ('engine',))
+
+
+def _record_result(stats, health, name, latency, success, win=False):
+    stats.record_result(name, latency, success, win=win)
+    _engine_requests.inc(engine=name, result='success' if success else 'failure')
+    _engine_latency.observe(latency, engine=name)
+    if success:
+        health.record_success(name, latency)
+    else:
+        health.record_failure(name, latency)
+
+
+def _finish_abandoned(stats, health, name, started, call, future):
+    """버린 호출이 끝났을 때 기록 (자리를 기다리다 호출하지 않았으면 시험 호출 자리만 반납)"""
+    if call.skipped:
+        health.release(name)
+        return
+    _record_result(stats, health, name, time.monotonic() - started,
+                   not future.cancelled() and future.exception() is None and bool(future.result()))
+
+
+def cascade_engines(engines, stats=None, health=None):
+    """순차 폴백: 앞 엔진이 실패했을 때만 다음 엔진 호출. (엔진명, 결과) 반환, 모두 실패 시 (None, None)"""
+    stats = stats or _shared_stats
+    health = health or get_engine_health()
+
+    for name, engine in engines:
+        # 차단된(서킷 open) 엔진은 기다리지 않고 건너뜀
+        if not health.allow(name):
+            continue
+        stats.record_launch(name)
+        started = time.monotonic()
+        try:
+            result = _call_engine(engine)
+        except Exception:
+            result = None
+        _record_result(stats, health, name, time.monotonic() - started, bool(result), win=bool(result))
+        if result:
+            return name, result
+    return None, None
+
+
+def race_engines(engines, hedge_delays=None, default_delay=None, stats=None, health=None):
+    """헤지 경쟁: 선호 엔진부터 시작하고 헤지 지연마다 다음 엔진을 추가 시작, 첫 정상 결과 반환
+    결과가 정해지면 진 호출은 버림(abandon): 시작 전이면 취소, 실행 중이면 전역 동시 호출 자리를 바로 반납하고
+    결과는 통계/서킷 브레이커에만 기록 (HTTP 요청은 중단할 수 없으므로 경쟁 작업자 스레드는 응답이나
+    TRANSLATION_RACE_TIMEOUT 타임아웃까지 사용 중)"""
+    stats = stats or _shared_stats
+    health = health or get_engine_health()
+    hedge_delays = load_hedge_delays() if hedge_delays is None else hedge_delays
+    default_delay = default_hedge_delay() if default_delay is None else default_delay
+    executor = _get_executor()
+    request_timeout = race_request_timeout()
+
+    pending = {}
+    next_index = 0
+    next_launch_at = 0.0
+
+    def launch():
+        """다음으로 호출 가능한 엔진 시작 (차단된 엔진은 건너뜀)"""
+        nonlocal next_index, next_launch_at
+        while next_index < len(engines):
+            name, engine = engines[next_index]
+            next_index += 1
+            if not health.allow(name):
+                continue
+            stats.record_launch(name)
+            call = _RaceCall(engine, request_timeout)
+            pending[executor.submit(call)] = (name, time.monotonic(), call)
+            next_launch_at = time.monotonic() + hedge_delays.get(name, default_delay)
+            return
+
+    winner = (None, None)
+
+    while pending or next_index < len(engines):
+        # 실행 중인 엔진이 모두 실패했으면 다음 엔진을 바로 시작
+        if not pending or (next_index < len(engines) and time.monotonic() >= next_launch_at):
+            launch()
+            if not pending:
+                break
+
+        timeout = max(0.0, next_launch_at - time.monotonic()) if next_index < len(engines) else None
+        done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            name, started, _ = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception:
+                result = None
+            is_win = bool(result) and winner[0] is None
+            _record_result(stats, health, name, time.monotonic() - started, bool(result), win=is_win)
+            if is_win:
+                winner = (name, result)
+
+        if winner[0] is not None:
+            break
+
+    # 느린 호출 정리: 아직 시작 전이면 취소, 실행 중이면 동시 호출 자리를 반납하고 결과는 통계에만 기록
+    for future, (name, started, call) in pending.items():
+        stats.record_abandoned(name)
+        if future.cancel():
+            health.release(name)
+        else:
+            call.abandon()
+            future.add_done_callback(
+                lambda f, name=name, started=started, call=call: _finish_abandoned(stats, health, name, started, call, f)
+            )
+
+    return winner
+
+
+def run_engines(engines, race=None, stats=None, health=None):
+    """설정된 모드(순차/경쟁)로 엔진 실행 - 엔진 순서는 관측된 성공률/지연 시간에 따라 조정"""
+    health = health or get_engine_health()
+    # TRANSLATION_ENGINES로 엔진을 제한한 경우 (예: 가짜 엔진 서버로 부하 테스트할 때 Google 제외)
+    enabled = load_enabled_engines()
+    if enabled is not None:
+        engines = [(name, engine) for name, engine in engines if name in enabled]
+    by_name = dict(engines)
+    engines = [(name, by_name[name]) for name in health.order([name for name, _ in engines])]
+
+    if race is None:
+        race = is_race_mode_enabled()
+    if race:
+        return race_engines(engines, stats=stats, health=health)
+    return cascade_engines(engines, stats=stats, health=health)
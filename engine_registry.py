@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+번역 엔진 클라이언트 모음 - 엔진 클라이언트를 프로세스마다 한 번만 만들어 재사용
+HTTP 엔진(LibreTranslate/Hugging Face/Ollama)은 연결을 유지하는 requests.Session 하나를 공유하여
+셀마다 TCP/TLS 연결을 새로 맺지 않음 (호스트별 연결 풀 크기는 환경 변수로 설정)
+googletrans/deep_translator 번역기 객체도 방향별로 한 번만 만듦 (googletrans는 스레드 안전하지 않아 스레드마다 하나)
+시작할 때 warm_up()으로 설정된 엔진 주소에 미리 연결해 두면 첫 셀부터 연결 비용 없이 번역
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from engine_endpoints import libretranslate_urls, ollama_url, huggingface_url
+
+# 연결 풀을 유지할 호스트 수
+DEFAULT_POOL_CONNECTIONS = 10
+# 호스트별로 유지할 최대 연결 수 (TRANSLATION_MAX_CONCURRENCY 기본값과 같게 - 동시 호출이 상한까지 가도 연결을 버리지 않음)
+DEFAULT_POOL_MAXSIZE = 32
+# 미리 연결할 때 호스트별 연결 수 (TRANSLATION_MAX_WORKERS 기본값과 같게)와 응답 대기 시간 (초)
+DEFAULT_WARMUP_CONNECTIONS = 4
+DEFAULT_WARMUP_TIMEOUT = 3
+
+
+def is_warmup_enabled():
+    """시작할 때 엔진 연결을 미리 맺을지 (ENGINE_WARMUP, 기본: 사용)"""
+    return os.environ.get('ENGINE_WARMUP', 'true').lower() not in ('0', 'false', 'no', 'off')
+
+
+def engine_warmup_urls(enabled=None):
+    """미리 연결할 HTTP 엔진 주소 (enabled: 사용할 엔진 이름 집합, None이면 전체)
+    같은 호스트는 연결 풀을 공유하므로 호스트마다 첫 주소 하나만"""
+    urls = []
+    if enabled is None or 'libretranslate' in enabled:
+        urls.extend(libretranslate_urls())
+    if enabled is None or 'huggingface' in enabled:
+        urls.append(huggingface_url('Helsinki-NLP/opus-mt-ko-zh'))
+    if enabled is None or 'ollama' in enabled:
+        urls.append(ollama_url())
+
+    hosts = {}
+    for url in urls:
+        parts = urlsplit(url)
+        hosts.setdefault((parts.scheme, parts.netloc), url)
+    return list(hosts.values())
+
+
+class EngineRegistry:
+    def __init__(self, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+
+        self._lock = threading.Lock()
+        self._session = None
+        self._session_pid = None
+        self._clients = {}
+        # 스레드별 googletrans Translator (내부 httpx 클라이언트를 여러 스레드가 함께 쓰지 않도록)
+        self._thread_clients = threading.local()
+        self._thread_client_count = 0
+
+    def session(self):
+        """연결을 유지하는 공유 HTTP 세션 (포크된 자식 프로세스는 부모의 소켓을 쓰지 않도록 새로 만듦)"""
+        session = self._session
+        if session is not None and self._session_pid == os.getpid():
+            return session
+        with self._lock:
+            if self._session is None or self._session_pid != os.getpid():
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                # 재시도는 서킷 브레이커/엔진 폴백이 담당하므로 어댑터에서는 하지 않음
+                adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, max_retries=0)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._session, self._session_pid = session, os.getpid()
+            return self._session
+
+    def _client(self, key, factory):
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = factory()
+        return client
+
+    def googletrans_translator(self):
+        """이 스레드의 googletrans Translator (내부 HTTP 클라이언트의 연결을 호출 사이에 재사용)
+        Translator는 스레드 안전하지 않으므로 작업자 스레드마다 하나씩 만들어 같은 스레드의 호출끼리만 재사용"""
+        translator = getattr(self._thread_clients, 'googletrans', None)
+        if translator is None:
+            from googletrans import Translator
+            translator = self._thread_clients.googletrans = Translator()
+            with self._lock:
+                self._thread_client_count += 1
+        return translator
+
+    def deep_translator(self, name, source, target):
+        """deep_translator 번역기 (name: 'google' 또는 'bing', 언어 쌍별로 하나)"""
+        def create():
+            import deep_translator
+            translator_class = {'google': deep_translator.GoogleTranslator, 'bing': deep_translator.BingTranslator}[name]
+            return translator_class(source=source, target=target)
+        return self._client(('deep_translator', name, source, target), create)
+
+    def warm_up(self, enabled=None, connections=DEFAULT_WARMUP_CONNECTIONS, timeout=DEFAULT_WARMUP_TIMEOUT, health=None):
+        """엔진 클라이언트를 미리 만들고 HTTP 엔진 호스트마다 연결을 connections개씩 맺어 둠
+        응답 코드와 관계없이 연결만 확인 (연결 실패/타임아웃인 주소는 서킷 브레이커에 기록하여 첫 셀부터 건너뜀)
+        -> {'connected': [...], 'failed': [...], 'seconds': ...}"""
+        from engine_health import get_engine_health
+        import requests
+
+        health = health or get_engine_health()
+        started = time.monotonic()
+
+        # 파이썬 클라이언트는 import/생성 비용만 미리 치름 (설치되지 않은 패키지는 무시)
+        clients = []
+        if enabled is None or 'google' in enabled:
+            clients.append(self.googletrans_translator)
+        if enabled is None or 'deep_translator' in enabled:
+            for source, target in (('ko', 'zh-CN'), ('zh-CN', 'ko')):
+                for name in ('google', 'bing'):
+                    clients.append(lambda name=name, source=source, target=target: self.deep_translator(name, source, target))
+        for create in clients:
+            try:
+                create()
+            except Exception:
+                pass
+
+        session = self.session()
+
+        def connect(url):
+            try:
+                session.head(url, timeout=timeout)
+                return True
+            except requests.exceptions.RequestException:
+                return False
+
+        urls = [url for url in engine_warmup_urls(enabled) if health.allow(url)]
+        result = {'connected': [], 'failed': []}
+        if urls:
+            count = max(1, min(connections, self.pool_maxsize))
+            with ThreadPoolExecutor(max_workers=len(urls) * count, thread_name_prefix='engine-warmup') as pool:
+                futures = {url: [pool.submit(connect, url) for _ in range(count)] for url in urls}
+            for url, url_futures in futures.items():
+                if any(future.result() for future in url_futures):
+                    # 연결 확인은 번역 성공이 아니므로 기록하지 않고 시험 호출 자리만 반납
+                    health.release(url)
+                    result['connected'].append(url)
+                else:
+                    health.record_failure(url, time.monotonic() - started, hard=True)
+                    result['failed'].append(url)
+        result['seconds'] = round(time.monotonic() - started, 4)
+        return result
+
+    def stats(self):
+        return {
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'clients': sorted(':'.join(key) for key in self._clients),
+            'googletrans_translators': self._thread_client_count,
+        }
+
+
+# 프로세스 전역 공유 인스턴스
+_shared_registry = None
+_shared_lock = threading.Lock()
+
+
+def get_engine_registry():
+    """프로세스 전역 엔진 클라이언트 모음 (ENGINE_POOL_MAXSIZE가 없으면 TRANSLATION_MAX_CONCURRENCY를 연결 풀 크기로 사용)"""
+    global _shared_registry
+    with _shared_lock:
+        if _shared_registry is None:
+            _shared_registry = EngineRegistry(
+                pool_connections=int(os.environ.get('ENGINE_POOL_CONNECTIONS', DEFAULT_POOL_CONNECTIONS)),
+                pool_maxsize=int(os.environ.get('ENGINE_POOL_MAXSIZE')
+                                 or os.environ.get('TRANSLATION_MAX_CONCURRENCY', DEFAULT_POOL_MAXSIZE))
+            )
+        return _shared_registry
+
+
+def start_warm_up(verbose=True):
+    """백그라운드 스레드에서 엔진 연결을 미리 맺음 (ENGINE_WARMUP=0이면 아무것도 하지 않음, 시작을 늦추지 않음)
+    verbose=False: 작업 프로세스처럼 여러 개가 동시에 시작할 때 결과 출력 생략"""
+    if not is_warmup_enabled():
+        return None
+    from engine_race import load_enabled_engines
+
+    def run():
+        try:
+            result = get_engine_registry().warm_up(
+                enabled=load_enabled_engines(),
+                connections=int(os.environ.get('ENGINE_WARMUP_CONNECTIONS', DEFAULT_WARMUP_CONNECTIONS))
+            )
+        except Exception as e:
+            print(f"엔진 연결 준비 오류: {e}")
+            return
+        if verbose and (result['connected'] or result['failed']):
+            print(f"엔진 연결 준비 완료 ({result['seconds']:.2f}초): 연결 {len(result['connected'])}개, 실패 {len(result['failed'])}개 {result['failed']}")
+
+    thread = threading.Thread(target=run, name='engine-warmup', daemon=True)
+    thread.start()
+    return thread
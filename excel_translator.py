@@ -7,27 +7,28 @@ openpyxl을 사용하여 원본 엑셀 파일의 모든 서식을 유지하면
 import openpyxl
 from openpyxl.utils import get_column_letter
 from copy import copy
-import requests
+from engine_registry import get_engine_registry
 import re
 import os
 import time
+from translation_memory import get_translation_memory
+from progress_reporter import as_progress_reporter
+from engine_endpoints import libretranslate_urls
 
 class ExcelTranslator:
     def __init__(self):
-        self.libretranslate_urls = [
-            "https://libretranslate.de/translate",
-            "https://translate.argosopentech.com/translate",
-            "https://libretranslate.com/translate"
-        ]
+        self.libretranslate_urls = libretranslate_urls()
 
 class ExcelTranslatorWithProgress(ExcelTranslator):
     def __init__(self, progress_callback=None):
         super().__init__()
-        self.progress_callback = progress_callback or (lambda msg, pct: None)
+        # 진행률 보고기 (셀 단위 진행률은 시간 간격으로 합쳐서 전달)
+        self.progress = as_progress_reporter(progress_callback)
+        self.progress_callback = self.progress
     
     def translate_excel_file(self, input_path, output_path, direction='ko-zh', preserve_english=True, add_new_sheet=True):
         """진행률 콜백이 포함된 엑셀 파일 번역"""
-        self.progress_callback("파일 열기 중...", 0)
+        self.progress.stage('open', "파일 열기 중...", 0)
         print(f"파일 열기: {input_path}")
         workbook = openpyxl.load_workbook(input_path)
         
@@ -40,7 +41,7 @@ class ExcelTranslatorWithProgress(ExcelTranslator):
                 translated_sheet_name = f"{sheet_name}_中文" if direction == 'ko-zh' else f"{sheet_name}_한국어"
                 
                 sheet_progress = (sheet_idx / total_sheets) * 90  # 90%까지 시트 처리
-                self.progress_callback(f"시트 '{sheet_name}' 번역 중...", sheet_progress)
+                self.progress.stage('translate', f"시트 '{sheet_name}' 번역 중...", sheet_progress)
                 print(f"시트 '{sheet_name}' 번역 중...")
                 
                 # 새 시트 생성
@@ -57,17 +58,17 @@ class ExcelTranslatorWithProgress(ExcelTranslator):
                 source_ws = workbook[sheet_name]
                 
                 sheet_progress = (sheet_idx / total_sheets) * 90
-                self.progress_callback(f"시트 '{sheet_name}' 번역 중...", sheet_progress)
+                self.progress.stage('translate', f"시트 '{sheet_name}' 번역 중...", sheet_progress)
                 print(f"시트 '{sheet_name}' 번역 중...")
                 
                 self.translate_worksheet_with_progress(source_ws, direction, preserve_english, sheet_idx, total_sheets)
 
-        self.progress_callback("파일 저장 중...", 95)
+        self.progress.stage('save', "파일 저장 중...", 95)
         print(f"번역 완료. 파일 저장: {output_path}")
         workbook.save(output_path)
         workbook.close()
         
-        self.progress_callback("번역 완료!", 100)
+        self.progress.stage('done', "번역 완료!", 100)
         return output_path
 
     def translate_worksheet_with_progress(self, worksheet, direction, preserve_english, sheet_idx, total_sheets):
@@ -79,11 +80,10 @@ class ExcelTranslatorWithProgress(ExcelTranslator):
             for cell in row:
                 current_cell += 1
                 
-                # 50셀마다 진행률 업데이트
-                if current_cell % 50 == 0 or current_cell == total_cells:
-                    cell_progress = (current_cell / total_cells) * 80 / total_sheets  # 시트당 80%/총시트수
-                    total_progress = (sheet_idx / total_sheets) * 80 + cell_progress
-                    self.progress_callback(f"번역 중... ({current_cell}/{total_cells} 셀)", total_progress)
+                # 진행률 업데이트 (전달 빈도는 보고기가 시간 기준으로 제한)
+                cell_progress = (current_cell / total_cells) * 80 / total_sheets  # 시트당 80%/총시트수
+                total_progress = (sheet_idx / total_sheets) * 80 + cell_progress
+                self.progress.update(f"번역 중... ({current_cell}/{total_cells} 셀)", total_progress, done=current_cell, total=total_cells)
                 
                 if cell.value and isinstance(cell.value, str):
                     translated = self.translate_text(cell.value, direction, preserve_english)
@@ -93,11 +93,7 @@ class ExcelTranslatorWithProgress(ExcelTranslator):
         
 class ExcelTranslator:
     def __init__(self):
-        self.libretranslate_urls = [
-            "https://libretranslate.de/translate",
-            "https://translate.argosopentech.com/translate",
-            "https://libretranslate.com/translate"
-        ]
+        self.libretranslate_urls = libretranslate_urls()
         
         # 발주서 전용 번역 사전
         self.ko_to_zh_dict = {
@@ -156,7 +152,8 @@ class ExcelTranslator:
         return bool(re.match(r'^[a-zA-Z0-9\s\.\,\-\(\)\[\]\{\}@:\/]+$', text.strip()))
 
     def translate_with_api(self, text, source_lang, target_lang):
-        """LibreTranslate API로 번역"""
+        """LibreTranslate API로 번역 (프로세스 공유 세션의 연결 풀 사용)"""
+        session = get_engine_registry().session()
         for url in self.libretranslate_urls:
             try:
                 data = {
@@ -166,7 +163,7 @@ class ExcelTranslator:
                     "format": "text"
                 }
                 
-                response = requests.post(url, json=data, timeout=10)
+                response = session.post(url, json=data, timeout=10)
                 if response.status_code == 200:
                     result = response.json()
                     if 'translatedText' in result:
@@ -207,8 +204,15 @@ class ExcelTranslator:
         source_lang = 'ko' if direction == 'ko-zh' else 'zh'
         target_lang = 'zh' if direction == 'ko-zh' else 'ko'
         
+        # 번역 메모리 확인 (API 호출 전)
+        memory = get_translation_memory()
+        cached_result = memory.get(direction, text)
+        if cached_result:
+            return cached_result
+        
         api_result = self.translate_with_api(text, source_lang, target_lang)
         if api_result:
+            memory.put(direction, text, api_result, 'libretranslate')
             return api_result
         
         # 백업 사전 사용
@@ -0,0 +1,584 @@
+#!/usr/bin/env python3
+"""
+엑셀 파일 번역기 - XLSX 직접 수정 방식
+openpyxl로 워크북 전체를 읽고 쓰지 않고, xlsx(zip) 안의 공유 문자열(sharedStrings)과 인라인 문자열만 스트리밍으로 수정
+번역하지 않는 zip 항목(스타일, 이미지, 차트 등)은 내용 그대로 복사하여 서식 100% 보존
+"""
+
+import html
+import os
+import posixpath
+import re
+import shutil
+import tempfile
+import time
+import zipfile
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape, quoteattr
+
+from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
+
+from excel_translator_template import ExcelTranslatorTemplate
+
+# 워크시트 XML을 읽는 단위 (행 경계에서 잘라서 처리)
+CHUNK_SIZE = 1 << 20
+
+WORKSHEET_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml'
+SHARED_STRINGS_REL_SUFFIX = '/sharedStrings'
+
+ROW_END_RE = re.compile(rb'</(?:\w+:)?row>')
+CELL_RE = re.compile(rb'<((?:\w+:)?)c\b([^>]*?)(?:/>|>(.*?)</(?:\w+:)?c>)', re.S)
+ATTR_R_RE = re.compile(rb'\sr="([^"]*)"')
+ATTR_T_RE = re.compile(rb'\st="([^"]*)"')
+VALUE_RE = re.compile(rb'(<(?:\w+:)?v>)([^<]*)(</(?:\w+:)?v>)')
+INLINE_RE = re.compile(rb'<((?:\w+:)?)is>(.*?)</(?:\w+:)?is>', re.S)
+PHONETIC_RE = re.compile(rb'<((?:\w+:)?)rPh\b.*?</\1rPh>', re.S)
+TEXT_RE = re.compile(rb'<(?:\w+:)?t\b[^>]*>(.*?)</(?:\w+:)?t>', re.S)
+SST_START_RE = re.compile(rb'<((?:\w+:)?)sst\b([^>]*?)(/?)>')
+COUNT_ATTR_RE = re.compile(rb'\s(count|uniqueCount)="(\d*)"')
+SHARED_CELL_RE = re.compile(rb'<(?:\w+:)?c\b[^>]*?\st="s"')
+TAB_SELECTED_RE = re.compile(rb'\stabSelected="(?:1|true)"')
+
+# 복제한 시트에서 제거할 요소 (다른 파트를 참조하므로 원본 시트와 공유할 수 없음)
+# openpyxl copy_worksheet도 이미지/차트/표/메모는 복사하지 않음
+CLONE_STRIP_RES = [
+    re.compile(rb'<(?:\w+:)?(?:drawing|legacyDrawing|legacyDrawingHF|picture)\b[^>]*/>'),
+    re.compile(rb'<((?:\w+:)?)(tableParts|oleObjects|controls)\b[^>]*?(?:/>|>.*?</\1\2>)', re.S),
+]
+
+class UnsupportedWorkbookError(Exception):
+    """직접 수정 방식으로 처리할 수 없는 파일 (템플릿 방식으로 대체)"""
+
+
+def _local(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def _namespace(tag):
+    return tag[1:].split('}', 1)[0] if tag.startswith('{') else ''
+
+
+def _resolve_target(base_dir, target):
+    """관계(Relationship) Target을 zip 내부 경로로 변환"""
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+
+def _rels_path(part):
+    return posixpath.join(posixpath.dirname(part), '_rels', posixpath.basename(part) + '.rels')
+
+
+def _iter_row_chunks(stream):
+    """워크시트 XML을 </row> 경계에서 잘라서 순서대로 반환 (셀이 중간에 잘리지 않음)"""
+    buffer = b''
+    while True:
+        data = stream.read(CHUNK_SIZE)
+        if not data:
+            break
+        buffer += data
+        last = None
+        for last in ROW_END_RE.finditer(buffer):
+            pass
+        if last is not None:
+            yield buffer[:last.end()]
+            buffer = buffer[last.end():]
+    if buffer:
+        yield buffer
+
+
+def _text_xml(prefix, text):
+    return b'<%st xml:space="preserve">%s</%st>' % (prefix, escape(text).encode('utf-8'), prefix)
+
+
+def _inline_text(inner):
+    """인라인 문자열(<is>)의 텍스트 (윗주 rPh 제외)"""
+    inner = PHONETIC_RE.sub(b'', inner)
+    return html.unescape(b''.join(TEXT_RE.findall(inner)).decode('utf-8'))
+
+
+class ExcelTranslatorDirect(ExcelTranslatorTemplate):
+    def translate_excel_file(self, input_path, output_path, direction='ko-zh', preserve_english=True, add_new_sheet=True, exclude_sheets=None, exclude_cells=None, exclude_patterns=None,
+                             previous_source=None, previous_output=None, previous_manifest=None, manifest_path=None):
+        """XLSX 직접 수정 방식 번역 - 공유 문자열/인라인 문자열만 교체하고 나머지는 그대로 복사
+        셀 단위로 이전 번역을 재사용하는 수정본 번역은 템플릿 방식으로 처리 (직접 수정 방식은 매니페스트를 저장하지 않음)"""
+        if previous_manifest or (previous_source and previous_output):
+            print("수정본 번역은 셀 단위 비교가 필요하여 템플릿 방식으로 번역합니다.")
+            return super().translate_excel_file(input_path, output_path, direction, preserve_english, add_new_sheet, exclude_sheets, exclude_cells, exclude_patterns,
+                                                previous_source, previous_output, previous_manifest, manifest_path)
+        timings = self.timings
+        timings.reset()
+        self.cell_counts = {'reused': 0, 'translated': 0}
+        started = time.perf_counter()
+
+        self.progress.stage('prepare', "파일 구조 분석 중...", 0)
+
+        try:
+            with zipfile.ZipFile(input_path) as zin, timings.measure('load_workbook'):
+                package = self._read_package(zin)
+                target_sheets = [sheet for sheet in package['sheets'] if not (exclude_sheets and sheet['name'] in exclude_sheets)]
+
+                for sheet in package['sheets']:
+                    if sheet not in target_sheets:
+                        self.progress_callback(f"시트 '{sheet['name']}' 건너뜀 (제외 목록)", 5)
+
+                # 1단계: 번역할 텍스트 수집 (워크북 전체에서 고유 문자열 단위)
+                self.progress.stage('collect', "번역할 텍스트 수집 중...", 10)
+                with timings.measure('collect'):
+                    exclusions = self.compile_exclusions(exclude_cells, exclude_patterns)
+                    scan = self._scan_sheets(zin, package, target_sheets, exclusions)
+
+                # 새 시트 추가 모드: 복제 시트 등록 정보 준비
+                with timings.measure('copy_worksheet'):
+                    plan = self._clone_plan(zin, package, target_sheets, direction) if add_new_sheet else []
+                    patched_parts = self._patched_workbook_parts(zin, package, plan) if plan else {}
+        except (zipfile.BadZipFile, KeyError, ElementTree.ParseError, UnsupportedWorkbookError) as e:
+            print(f"직접 수정 방식을 사용할 수 없어 템플릿 방식으로 번역합니다: {e}")
+            return super().translate_excel_file(input_path, output_path, direction, preserve_english, add_new_sheet, exclude_sheets, exclude_cells, exclude_patterns, manifest_path=manifest_path)
+
+        print(f"번역 대상: 셀 {scan['cell_count']}개, 고유 텍스트 {len(scan['texts'])}개 (작업자 {self.max_workers}개)")
+        self.cell_counts['translated'] = scan['cell_count']
+
+        # 2단계: 고유 문자열마다 한 번씩만 번역
+        with timings.measure('translate'):
+            translations = self.translate_unique_texts(scan['texts'], direction, preserve_english, 20, 85)
+
+        # 번역된 공유 문자열은 기존 항목을 고치지 않고 뒤에 새 항목으로 추가
+        # (원본 시트/제외 셀이 같은 항목을 계속 참조할 수 있도록)
+        new_shared = {}
+        for text in scan['shared_texts']:
+            translated = translations.get(text)
+            if translated is not None and translated != text and translated not in new_shared:
+                new_shared[translated] = package['shared_count'] + len(new_shared)
+
+        self.progress.stage('save', "변경사항 저장 중...", 90)
+
+        # 3단계: 새 zip 작성 (임시 파일에 쓴 후 교체)
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        fd, temp_path = tempfile.mkstemp(suffix='.xlsx', dir=output_dir)
+        os.close(fd)
+        try:
+            with timings.measure('save'):
+                with zipfile.ZipFile(input_path) as zin, zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED) as zout:
+                    self._write_package(zin, zout, package, target_sheets, plan, patched_parts, translations, new_shared, scan, add_new_sheet, exclusions)
+                os.replace(temp_path, output_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        timings.add('total', time.perf_counter() - started)
+        self.progress.stage('done', "번역 완료!", 100)
+        return output_path
+
+    def _read_package(self, zin):
+        """워크북 구조 (시트 목록, 파트 경로, 공유 문자열) 읽기"""
+        names = set(zin.namelist())
+
+        root_rels = ElementTree.fromstring(zin.read('_rels/.rels'))
+        workbook_part = None
+        for rel in root_rels:
+            if rel.get('Type', '').endswith('/officeDocument'):
+                workbook_part = _resolve_target('', rel.get('Target'))
+        if not workbook_part or workbook_part not in names:
+            raise UnsupportedWorkbookError('워크북 파트를 찾을 수 없습니다')
+
+        workbook_dir = posixpath.dirname(workbook_part)
+        workbook_rels_part = _rels_path(workbook_part)
+        workbook_rels = ElementTree.fromstring(zin.read(workbook_rels_part))
+
+        rel_targets = {}
+        shared_strings_part = None
+        for rel in workbook_rels:
+            if rel.get('TargetMode') == 'External':
+                continue
+            rel_targets[rel.get('Id')] = (rel.get('Type'), _resolve_target(workbook_dir, rel.get('Target')))
+            if rel.get('Type', '').endswith(SHARED_STRINGS_REL_SUFFIX):
+                shared_strings_part = _resolve_target(workbook_dir, rel.get('Target'))
+
+        workbook_xml = ElementTree.fromstring(zin.read(workbook_part))
+        sheets = []
+        rel_namespace = None
+        max_sheet_id = 0
+        for element in workbook_xml.iter():
+            if _local(element.tag) != 'sheet':
+                continue
+            rel_id = None
+            for key, value in element.attrib.items():
+                if _local(key) == 'id' and _namespace(key):
+                    rel_id = value
+                    rel_namespace = _namespace(key)
+            max_sheet_id = max(max_sheet_id, int(element.get('sheetId', 0)))
+            rel_type, part = rel_targets.get(rel_id, (None, None))
+            # 차트 시트/대화 상자 시트는 셀이 없으므로 건너뜀
+            if not rel_type or not rel_type.endswith('/worksheet') or part not in names:
+                continue
+            sheets.append({'name': element.get('name'), 'part': part, 'rel_type': rel_type})
+
+        shared_texts = []
+        if shared_strings_part and shared_strings_part in names:
+            shared_texts = self._read_shared_strings(zin, shared_strings_part)
+        else:
+            shared_strings_part = None
+
+        return {
+            'names': names,
+            'workbook_part': workbook_part,
+            'workbook_rels_part': workbook_rels_part,
+            'rel_namespace': rel_namespace,
+            'max_sheet_id': max_sheet_id,
+            'sheets': sheets,
+            'shared_strings_part': shared_strings_part,
+            'shared_texts': shared_texts,
+            'shared_count': len(shared_texts)
+        }
+
+    def _read_shared_strings(self, zin, part):
+        """sharedStrings.xml을 스트리밍으로 읽어 항목별 텍스트 목록 반환 (서식 있는 텍스트는 이어 붙임)"""
+        texts = []
+        root = None
+        with zin.open(part) as stream:
+            for event, element in ElementTree.iterparse(stream, events=('start', 'end')):
+                if event == 'start':
+                    if root is None:
+                        root = element
+                    continue
+                if _local(element.tag) != 'si':
+                    continue
+
+                parts = []
+                for child in element:
+                    name = _local(child.tag)
+                    if name == 't':
+                        parts.append(child.text or '')
+                    elif name == 'r':
+                        for run_child in child:
+                            if _local(run_child.tag) == 't':
+                                parts.append(run_child.text or '')
+                texts.append(''.join(parts))
+                root.clear()
+        return texts
+
+    def _is_translatable(self, text, coordinate, sheet_name, exclusions):
+        """템플릿 방식과 같은 기준으로 번역 대상인지 확인"""
+        if not text or not text.strip():
+            return False
+        if exclusions.sheet_has_cells(sheet_name):
+            column_letter, row = coordinate_from_string(coordinate)
+            if exclusions.is_cell_excluded(sheet_name, row, column_index_from_string(column_letter)):
+                return False
+        if exclusions.is_text_excluded(text):
+            return False
+        return True
+
+    def _transform_cells(self, chunk, sheet_name, shared_texts, exclusions, on_text):
+        """청크 안의 문자열 셀마다 on_text(텍스트, 공유 문자열 여부) 호출
+        on_text가 번역문을 반환하면 셀 내용을 교체한 청크 반환"""
+
+        def replace_cell(match):
+            prefix, attrs, inner = match.group(1), match.group(2), match.group(3)
+            if inner is None:
+                return match.group(0)
+
+            type_match = ATTR_T_RE.search(attrs)
+            cell_type = type_match.group(1) if type_match else b'n'
+            if cell_type == b's':
+                value_match = VALUE_RE.search(inner)
+                if not value_match:
+                    return match.group(0)
+                index = int(value_match.group(2))
+                if index >= len(shared_texts):
+                    raise UnsupportedWorkbookError(f"시트 '{sheet_name}'의 공유 문자열 번호가 범위를 벗어났습니다")
+                text = shared_texts[index]
+            elif cell_type == b'inlineStr':
+                inline_match = INLINE_RE.search(inner)
+                if not inline_match:
+                    return match.group(0)
+                text = _inline_text(inline_match.group(2))
+            else:
+                return match.group(0)
+
+            ref_match = ATTR_R_RE.search(attrs)
+            if not ref_match:
+                raise UnsupportedWorkbookError(f"시트 '{sheet_name}'에 주소(r)가 없는 셀이 있습니다")
+            coordinate = ref_match.group(1).decode('ascii')
+
+            if not self._is_translatable(text, coordinate, sheet_name, exclusions):
+                return match.group(0)
+
+            replacement = on_text(text, cell_type == b's')
+            if replacement is None:
+                return match.group(0)
+
+            if cell_type == b's':
+                new_inner = inner[:value_match.start(2)] + str(replacement).encode('ascii') + inner[value_match.end(2):]
+            else:
+                is_prefix = inline_match.group(1)
+                new_is = b'<%sis>%s</%sis>' % (is_prefix, _text_xml(is_prefix, replacement), is_prefix)
+                new_inner = inner[:inline_match.start()] + new_is + inner[inline_match.end():]
+            return b'<%sc%s>%s</%sc>' % (prefix, attrs, new_inner, prefix)
+
+        return CELL_RE.sub(replace_cell, chunk)
+
+    def _scan_sheets(self, zin, package, target_sheets, exclusions):
+        """번역 대상 시트의 고유 텍스트 수집 (셀 내용은 바꾸지 않음)"""
+        texts = {}
+        shared_texts = {}
+        counts = {'cells': 0, 'shared_refs': 0}
+
+        def collect(text, is_shared):
+            counts['cells'] += 1
+            texts[text] = True
+            if is_shared:
+                shared_texts[text] = True
+            return None
+
+        for sheet in target_sheets:
+            with zin.open(sheet['part']) as stream:
+                for chunk in _iter_row_chunks(stream):
+                    # 복제 시트가 추가로 참조하게 될 공유 문자열 수 (sst count 갱신용)
+                    counts['shared_refs'] += len(SHARED_CELL_RE.findall(chunk))
+                    self._transform_cells(chunk, sheet['name'], package['shared_texts'], exclusions, collect)
+
+        return {
+            'texts': list(texts),
+            'shared_texts': list(shared_texts),
+            'cell_count': counts['cells'],
+            'shared_refs': counts['shared_refs']
+        }
+
+    def _write_sheet(self, zin, zout, source_part, target_part, sheet_name, package, translations, new_shared, exclusions, clone_rel_ids=None):
+        """시트 XML을 행 단위로 읽으면서 번역된 셀만 교체하여 기록"""
+
+        def replace(text, is_shared):
+            translated = translations.get(text)
+            if translated is None or translated == text:
+                return None
+            return new_shared[translated] if is_shared else translated
+
+        info = zin.getinfo(source_part)
+        out_info = zipfile.ZipInfo(target_part, date_time=info.date_time)
+        out_info.compress_type = zipfile.ZIP_DEFLATED
+        with zin.open(info) as src, zout.open(out_info, 'w') as dst:
+            for chunk in _iter_row_chunks(src):
+                chunk = self._transform_cells(chunk, sheet_name, package['shared_texts'], exclusions, replace)
+                if clone_rel_ids is not None:
+                    chunk = self._strip_clone_references(chunk, clone_rel_ids)
+                dst.write(chunk)
+
+    def _strip_clone_references(self, chunk, internal_rel_ids):
+        """복제 시트에서 원본 시트 전용 파트(그림, 표, 메모 등) 참조 제거"""
+        chunk = TAB_SELECTED_RE.sub(b'', chunk)
+        for pattern in CLONE_STRIP_RES:
+            chunk = pattern.sub(b'', chunk)
+        for rel_id in internal_rel_ids:
+            chunk = re.sub(rb'\s\w+:id="%s"' % re.escape(rel_id.encode('utf-8')), b'', chunk)
+        return chunk
+
+    def _write_shared_strings(self, zin, zout, part, new_shared, added_refs):
+        """기존 sharedStrings.xml은 그대로 두고 번역문 항목만 끝에 추가"""
+        info = zin.getinfo(part)
+        out_info = zipfile.ZipInfo(part, date_time=info.date_time)
+        out_info.compress_type = zipfile.ZIP_DEFLATED
+
+        with zin.open(info) as src, zout.open(out_info, 'w') as dst:
+            head = src.read(CHUNK_SIZE)
+            root_match = SST_START_RE.search(head)
+            if not root_match:
+                raise UnsupportedWorkbookError('sharedStrings.xml 형식을 인식할 수 없습니다')
+            prefix, attrs, self_closing = root_match.groups()
+
+            def update_count(match):
+                name, value = match.group(1), int(match.group(2) or 0)
+                value += len(new_shared) if name == b'uniqueCount' else added_refs
+                return b' %s="%d"' % (name, value)
+
+            attrs = COUNT_ATTR_RE.sub(update_count, attrs)
+            new_items = b''.join(
+                b'<%ssi>%s</%ssi>' % (prefix, _text_xml(prefix, text), prefix)
+                for text in new_shared
+            )
+
+            if self_closing:
+                dst.write(head[:root_match.start()])
+                dst.write(b'<%ssst%s>%s</%ssst>' % (prefix, attrs, new_items, prefix))
+                dst.write(head[root_match.end():])
+                return
+
+            pending = head[:root_match.start()] + b'<%ssst%s>' % (prefix, attrs) + head[root_match.end():]
+            while True:
+                data = src.read(CHUNK_SIZE)
+                if not data:
+                    break
+                pending += data
+                # 닫는 태그가 잘리지 않도록 끝부분은 남겨 둠
+                dst.write(pending[:-64])
+                pending = pending[-64:]
+
+            close_tag = b'</%ssst>' % prefix
+            close_index = pending.rfind(close_tag)
+            if close_index < 0:
+                raise UnsupportedWorkbookError('sharedStrings.xml 닫는 태그를 찾을 수 없습니다')
+            dst.write(pending[:close_index] + new_items + pending[close_index:])
+
+    def _clone_plan(self, zin, package, target_sheets, direction):
+        """새 시트 추가 모드: 복제할 시트의 새 파트 경로, 시트명, 관계 ID 결정"""
+        names = set(package['names'])
+        existing_sheet_names = {sheet['name'] for sheet in package['sheets']}
+        workbook_rels = zin.read(package['workbook_rels_part']).decode('utf-8')
+        rel_numbers = [int(n) for n in re.findall(r'Id="rId(\d+)"', workbook_rels)]
+        next_rel = max(rel_numbers, default=0) + 1
+        next_sheet_id = package['max_sheet_id'] + 1
+
+        plan = []
+        part_number = 1
+        for sheet in target_sheets:
+            while f"xl/worksheets/sheet{part_number}.xml" in names:
+                part_number += 1
+            part = f"xl/worksheets/sheet{part_number}.xml"
+            names.add(part)
+
+            suffix = '_中文' if direction == 'ko-zh' else '_한국어'
+            # 엑셀 시트명은 31자 제한, 중복 시 숫자 추가
+            title = (sheet['name'][:31 - len(suffix)] + suffix)
+            base_title, number = title, 1
+            while title in existing_sheet_names:
+                title = base_title[:31 - len(str(number))] + str(number)
+                number += 1
+            existing_sheet_names.add(title)
+
+            # 원본 시트 관계 중 외부 링크(하이퍼링크)만 복제
+            external_rels = []
+            internal_rel_ids = []
+            source_rels_part = _rels_path(sheet['part'])
+            if source_rels_part in package['names']:
+                for rel in ElementTree.fromstring(zin.read(source_rels_part)):
+                    if rel.get('TargetMode') == 'External':
+                        external_rels.append(rel)
+                    else:
+                        internal_rel_ids.append(rel.get('Id'))
+
+            plan.append({
+                'source': sheet,
+                'part': part,
+                'title': title,
+                'rel_id': f"rId{next_rel}",
+                'sheet_id': next_sheet_id,
+                'external_rels': external_rels,
+                'internal_rel_ids': internal_rel_ids
+            })
+            next_rel += 1
+            next_sheet_id += 1
+        return plan
+
+    def _patched_workbook_parts(self, zin, package, plan):
+        """새 시트 추가 모드: workbook.xml, workbook.xml.rels, [Content_Types].xml에 복제 시트 등록"""
+        workbook_part = package['workbook_part']
+        workbook_dir = posixpath.dirname(workbook_part)
+
+        workbook_xml = zin.read(workbook_part)
+        sheets_close = re.search(rb'</((?:\w+:)?)sheets>', workbook_xml)
+        if not package['rel_namespace'] or not sheets_close:
+            raise UnsupportedWorkbookError('workbook.xml 형식을 인식할 수 없습니다')
+        sheet_prefix = sheets_close.group(1)
+        # 관계 네임스페이스는 루트가 아닌 sheet 요소에 선언된 파일도 있으므로 새 요소마다 직접 선언
+        new_sheets = b''.join(
+            b'<%ssheet xmlns:r="%s" name=%s sheetId="%d" r:id="%s"/>' % (
+                sheet_prefix, package['rel_namespace'].encode('utf-8'), quoteattr(item['title']).encode('utf-8'),
+                item['sheet_id'], item['rel_id'].encode('utf-8')
+            )
+            for item in plan
+        )
+        workbook_xml = workbook_xml[:sheets_close.start()] + new_sheets + workbook_xml[sheets_close.start():]
+
+        rels_xml = zin.read(package['workbook_rels_part'])
+        new_rels = b''.join(
+            b'<Relationship Id="%s" Type="%s" Target="%s"/>' % (
+                item['rel_id'].encode('utf-8'), item['source']['rel_type'].encode('utf-8'),
+                posixpath.relpath(item['part'], workbook_dir).encode('utf-8')
+            )
+            for item in plan
+        )
+        close_index = rels_xml.rfind(b'</Relationships>')
+        rels_xml = rels_xml[:close_index] + new_rels + rels_xml[close_index:]
+
+        content_types = zin.read('[Content_Types].xml')
+        new_overrides = b''
+        for item in plan:
+            source_override = re.search(
+                rb'<Override[^>]*PartName="/%s"[^>]*ContentType="([^"]+)"' % re.escape(item['source']['part'].encode('utf-8')),
+                content_types
+            )
+            content_type = source_override.group(1) if source_override else WORKSHEET_CONTENT_TYPE.encode('utf-8')
+            new_overrides += b'<Override PartName="/%s" ContentType="%s"/>' % (item['part'].encode('utf-8'), content_type)
+        close_index = content_types.rfind(b'</Types>')
+        content_types = content_types[:close_index] + new_overrides + content_types[close_index:]
+
+        return {
+            workbook_part: workbook_xml,
+            package['workbook_rels_part']: rels_xml,
+            '[Content_Types].xml': content_types
+        }
+
+    def _write_package(self, zin, zout, package, target_sheets, plan, patched_parts, translations, new_shared, scan, add_new_sheet, exclusions):
+        """번역 결과가 반영된 zip 작성 - 바뀌지 않는 항목은 내용 그대로 복사"""
+        in_place_parts = {} if add_new_sheet else {sheet['part']: sheet for sheet in target_sheets}
+        shared_part = package['shared_strings_part'] if new_shared or (add_new_sheet and scan['shared_refs']) else None
+        added_refs = scan['shared_refs'] if add_new_sheet else 0
+
+        for info in zin.infolist():
+            if info.filename == shared_part:
+                self._write_shared_strings(zin, zout, info.filename, new_shared, added_refs)
+            elif info.filename in in_place_parts:
+                sheet = in_place_parts[info.filename]
+                self._write_sheet(zin, zout, info.filename, info.filename, sheet['name'], package, translations, new_shared, exclusions)
+            elif info.filename in patched_parts:
+                zout.writestr(info, patched_parts[info.filename])
+            else:
+                # 번역과 무관한 항목은 내용 그대로 복사
+                with zin.open(info) as src, zout.open(info, 'w') as dst:
+                    shutil.copyfileobj(src, dst, CHUNK_SIZE)
+
+        # 새 시트 추가 모드: 원본 시트 XML을 복제하면서 번역 적용
+        for item in plan:
+            sheet = item['source']
+            self.progress_callback(f"시트 '{sheet['name']}' 복사 중...", 92)
+            self._write_sheet(zin, zout, sheet['part'], item['part'], sheet['name'], package, translations, new_shared, exclusions, clone_rel_ids=item['internal_rel_ids'])
+            if item['external_rels']:
+                rels = b''.join(
+                    b'<Relationship Id=%s Type=%s Target=%s TargetMode="External"/>' % (
+                        quoteattr(rel.get('Id')).encode('utf-8'), quoteattr(rel.get('Type')).encode('utf-8'), quoteattr(rel.get('Target')).encode('utf-8')
+                    )
+                    for rel in item['external_rels']
+                )
+                zout.writestr(
+                    _rels_path(item['part']),
+                    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                    b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">%s</Relationships>' % rels,
+                    zipfile.ZIP_DEFLATED
+                )
+
+
+if __name__ == "__main__":
+    def test_progress(msg, pct):
+        print(f"[{pct:5.1f}%] {msg}")
+
+    translator = ExcelTranslatorDirect(test_progress)
+
+    # 테스트
+    input_file = "sample-purchase-order.xlsx"
+    output_file = "sample-purchase-order_direct.xlsx"
+
+    if os.path.exists(input_file):
+        try:
+            result = translator.translate_excel_file(
+                input_path=input_file,
+                output_path=output_file,
+                direction='ko-zh',
+                preserve_english=True,
+                add_new_sheet=True
+            )
+            print(f"번역 완료: {result}")
+        except Exception as e:
+            print(f"번역 오류: {e}")
+    else:
+        print(f"파일을 찾을 수 없습니다: {input_file}")
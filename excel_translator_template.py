@@ -6,14 +6,137 @@
 
 import openpyxl
 from openpyxl.utils import get_column_letter
+import multiprocessing
 import os
 import re
 import shutil
 import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from translation_memory import get_translation_memory
+from engine_race import run_engines
+from glossary_matcher import get_glossary_matcher
+from engine_health import guarded_post
+from engine_registry import get_engine_registry, start_warm_up
+from exclusion_index import ExclusionIndex
+from progress_reporter import as_progress_reporter, debug_logger, is_debug_enabled
+from engine_endpoints import libretranslate_urls, ollama_url, ollama_model, huggingface_url
+from metrics import StageTimings
+from translation_manifest import TranslationManifest, reuse_translation
+from job_checkpoint import TranslationCheckpoint
+
+# 고유 문자열 동시 번역 작업자 수 기본값
+DEFAULT_MAX_WORKERS = 4
+
+
+def resolve_sheet_processes(value):
+    """TRANSLATION_SHEET_PROCESSES 값 해석 (auto: CPU 코어 수, 비어 있거나 0/1: 사용 안 함)"""
+    if not value:
+        return 0
+    if str(value).lower() == 'auto':
+        return os.cpu_count() or 1
+    return max(0, int(value))
+
+
+# 시트 단위 작업 프로세스에서 재사용하는 번역기 (프로세스마다 하나)
+_sheet_worker_translator = None
+
+
+def _init_sheet_worker(translator_class, race_mode, max_workers, checkpoint_path=None):
+    global _sheet_worker_translator
+    _sheet_worker_translator = translator_class(race_mode=race_mode, max_workers=max_workers, sheet_processes=0)
+    # 작업 프로세스들은 같은 체크포인트 파일에 추가 기록 (재시작 시 모든 시트의 결과를 복원)
+    if checkpoint_path:
+        _sheet_worker_translator.checkpoint = TranslationCheckpoint(checkpoint_path)
+    # 새 프로세스라 연결 풀이 비어 있으므로 셀 수집하는 동안 엔진 연결을 미리 맺어 둠
+    start_warm_up(verbose=False)
+
+
+def _translate_sheet_unit(input_path, sheet_name, direction, preserve_english, exclude_cells, exclude_patterns, reuse_entries=None):
+    """작업 프로세스에서 원본 시트 하나의 셀 수집 + 고유 문자열 번역 -> 값이 바뀌는 셀의 (좌표, 번역문) 목록, 값이 그대로인 셀의 좌표 목록
+    reuse_entries: 이전 실행 매니페스트의 이 시트 항목 (원문이 같은 셀은 번역하지 않고 이전 번역 사용)"""
+    translator = _sheet_worker_translator
+    translator.timings.reset()
+    translator.progress = translator.progress_callback = as_progress_reporter(None)
+    
+    # 읽기 전용 모드는 이 시트의 XML만 순서대로 읽으므로 전체 불러오기보다 빠르고 메모리도 적게 씀
+    with translator.timings.measure('collect'):
+        workbook = openpyxl.load_workbook(input_path, read_only=True, data_only=False)
+        try:
+            exclusions = translator.compile_exclusions(exclude_cells, exclude_patterns)
+            cells = translator.collect_translatable_cells(workbook[sheet_name], exclude_cells, exclude_patterns, exclusions=exclusions)
+            reused = []
+            coordinates_by_text = {}
+            for cell in cells:
+                translation = reuse_translation(reuse_entries, cell.coordinate, cell.value) if reuse_entries else None
+                if translation is not None:
+                    reused.append((cell.coordinate, translation))
+                else:
+                    coordinates_by_text.setdefault(cell.value, []).append(cell.coordinate)
+        finally:
+            workbook.close()
+    
+    with translator.timings.measure('translate'):
+        translations = translator.translate_unique_texts(coordinates_by_text.keys(), direction, preserve_english, 0, 100)
+    
+    changes = list(reused)
+    unchanged = []
+    for original_value, coordinates in coordinates_by_text.items():
+        translated_value = translations.get(original_value, original_value)
+        if translated_value != original_value:
+            changes.extend((coordinate, translated_value) for coordinate in coordinates)
+        else:
+            unchanged.extend(coordinates)
+    return {
+        'sheet': sheet_name,
+        'changes': changes,
+        'unchanged': unchanged,
+        'unique': len(coordinates_by_text),
+        'reused': len(reused),
+        'translated': len(cells) - len(reused),
+        'cache_hits': translator.progress.snapshot()['cache_hits'],
+        'fallbacks': translator.progress.snapshot()['fallbacks'],
+        'timings': translator.timings.as_dict(),
+    }
+
 
 class ExcelTranslatorTemplate:
-    def __init__(self, progress_callback=None):
-        self.progress_callback = progress_callback or (lambda msg, pct: None)
+    def __init__(self, progress_callback=None, translation_memory=None, race_mode=None, max_workers=None, sheet_processes=None):
+        # 진행률 보고기 (단계 변경은 바로, 문자열 단위 진행률은 시간 간격으로 합쳐서 전달)
+        self.progress = as_progress_reporter(progress_callback)
+        self.progress_callback = self.progress
+        
+        # 단계별 소요 시간 (파일 복사/불러오기/시트 복사/수집/번역/엔진 호출/저장)
+        self.timings = StageTimings()
+        
+        # 마지막 작업의 셀 수 (reused: 이전 번역 재사용, translated: 번역 대상)
+        self.cell_counts = {'reused': 0, 'translated': 0}
+        
+        # 작업 프로파일러 (job_profiler.JobProfiler, 설정되면 작업자 풀 스레드에서도 기록)
+        self.profiler = None
+        
+        # 작업 체크포인트 (job_checkpoint.TranslationCheckpoint, 설정되면 번역 결과를 주기적으로 파일에 기록)
+        self.checkpoint = None
+        
+        # 스레드별 마지막 translate_text 호출이 엔진 실패로 대체 번역했는지 (대체 번역은 체크포인트에 기록하지 않음)
+        self._fallback_state = threading.local()
+        
+        # 동시 번역 작업자 수 (None이면 TRANSLATION_MAX_WORKERS 환경 변수 사용)
+        if max_workers is None:
+            max_workers = int(os.environ.get('TRANSLATION_MAX_WORKERS', DEFAULT_MAX_WORKERS))
+        self.max_workers = max(1, max_workers)
+        
+        # 시트 단위 작업 프로세스 수 (None이면 TRANSLATION_SHEET_PROCESSES 환경 변수, 0/1이면 한 프로세스에서 처리)
+        if sheet_processes is None:
+            sheet_processes = resolve_sheet_processes(os.environ.get('TRANSLATION_SHEET_PROCESSES'))
+        self.sheet_processes = sheet_processes
+        
+        # 서버/다른 번역기와 공유하는 번역 메모리
+        self.translation_memory = translation_memory or get_translation_memory()
+        
+        # 엔진 실행 방식 (None이면 TRANSLATION_RACE_MODE 환경 변수 사용)
+        self.race_mode = race_mode
         
         # 확장된 한국어-중국어 번역 사전
         self.ko_to_zh_dict = {
@@ -250,58 +373,28 @@ class ExcelTranslatorTemplate:
         return bool(re.match(r'^[a-zA-Z0-9\s\.\,\-\(\)\[\]\{\}@:\/]+$', str(text).strip()))
     
     def is_cell_excluded(self, cell, exclude_cells, sheet_name):
-        """셀이 제외 범위에 포함되는지 확인"""
+        """셀이 제외 범위에 포함되는지 확인 (exclude_cells: 범위 목록 또는 컴파일된 ExclusionIndex)"""
         if not exclude_cells:
             return False
-            
-        cell_addr = cell.coordinate
-        
-        for exclude_range in exclude_cells:
-            exclude_range = exclude_range.strip()
-            if not exclude_range:
-                continue
-                
-            # 시트명이 포함된 경우 (Sheet1!A1 형식)
-            if '!' in exclude_range:
-                sheet_part, cell_part = exclude_range.split('!', 1)
-                if sheet_part != sheet_name:
-                    continue  # 다른 시트의 셀이면 건너뜀
-                exclude_range = cell_part
-            
-            if ':' in exclude_range:
-                # 범위 형식 (예: A1:B5)
-                try:
-                    from openpyxl.utils import range_boundaries
-                    min_col, min_row, max_col, max_row = range_boundaries(exclude_range)
-                    if min_col <= cell.column <= max_col and min_row <= cell.row <= max_row:
-                        return True
-                except:
-                    pass
-            elif exclude_range == cell_addr:
-                # 단일 셀 (예: A1)
-                return True
-        return False
+        exclusions = exclude_cells if isinstance(exclude_cells, ExclusionIndex) else ExclusionIndex(exclude_cells)
+        return exclusions.is_cell_excluded(sheet_name, cell.row, cell.column)
     
     def is_text_excluded(self, text, exclude_patterns):
-        """텍스트가 제외 패턴에 포함되는지 확인"""
-        text_lower = str(text).lower()
-        for pattern in exclude_patterns:
-            pattern = pattern.strip().lower()
-            if pattern in text_lower:
-                return True
-        return False
+        """텍스트가 제외 패턴에 포함되는지 확인 (exclude_patterns: 패턴 목록 또는 컴파일된 ExclusionIndex)"""
+        exclusions = exclude_patterns if isinstance(exclude_patterns, ExclusionIndex) else ExclusionIndex(exclude_patterns=exclude_patterns)
+        return exclusions.is_text_excluded(text)
+
+    def compile_exclusions(self, exclude_cells=None, exclude_patterns=None):
+        """작업 시작 시 제외 셀/패턴을 한 번만 컴파일"""
+        exclusions = ExclusionIndex(exclude_cells, exclude_patterns)
+        if exclusions.invalid_entries:
+            print(f"해석할 수 없는 제외 범위 {len(exclusions.invalid_entries)}개 무시: {exclusions.invalid_entries[:3]}")
+        return exclusions
 
     def translate_with_libretranslate(self, text, source_lang, target_lang):
-        """LibreTranslate API로 번역"""
-        libretranslate_urls = [
-            "https://libretranslate.de/translate",
-            "https://translate.argosopentech.com/translate", 
-            "https://libretranslate.com/translate"
-        ]
-        
-        for url in libretranslate_urls:
+        """LibreTranslate API로 번역 (미러 목록은 LIBRETRANSLATE_URLS 환경 변수로 변경 가능)"""
+        for url in libretranslate_urls():
             try:
-                import requests
                 data = {
                     "q": text,
                     "source": source_lang,
@@ -309,8 +402,9 @@ class ExcelTranslatorTemplate:
                     "format": "text"
                 }
                 
-                response = requests.post(url, json=data, timeout=8)
-                if response.status_code == 200:
+                # 차단된 미러는 건너뜀 (연결 실패/타임아웃 시 일정 시간 차단)
+                response = guarded_post(url, json=data, timeout=8)
+                if response is not None and response.status_code == 200:
                     result = response.json()
                     if 'translatedText' in result and result['translatedText'].strip():
                         return result['translatedText']
@@ -321,8 +415,7 @@ class ExcelTranslatorTemplate:
     def translate_with_google(self, text, direction):
         """Google Translate로 번역"""
         try:
-            from googletrans import Translator
-            translator = Translator()
+            translator = get_engine_registry().googletrans_translator()
             
             if direction == 'ko-zh':
                 source, target = 'ko', 'zh-CN'
@@ -339,24 +432,22 @@ class ExcelTranslatorTemplate:
     def translate_with_huggingface(self, text, direction):
         """Hugging Face 무료 API로 번역"""
         try:
-            import requests
-            
             # Hugging Face의 무료 번역 모델들
             if direction == 'ko-zh':
                 model_id = "Helsinki-NLP/opus-mt-ko-zh"
             else:
                 model_id = "Helsinki-NLP/opus-mt-zh-ko"
             
-            api_url = f"https://api-inference.huggingface.co/models/{model_id}"
+            api_url = huggingface_url(model_id)
             
-            response = requests.post(
+            response = guarded_post(
                 api_url,
                 headers={},  # API 키 없이도 사용 가능 (제한적)
                 json={"inputs": text},
                 timeout=10
             )
             
-            if response.status_code == 200:
+            if response is not None and response.status_code == 200:
                 result = response.json()
                 if isinstance(result, list) and len(result) > 0:
                     translation = result[0].get('translation_text', '')
@@ -369,25 +460,23 @@ class ExcelTranslatorTemplate:
     def translate_with_ollama(self, text, direction):
         """Ollama 로컬 LLM으로 번역"""
         try:
-            import requests
-            
-            # Ollama가 로컬에서 실행 중인지 확인
+            # Ollama가 로컬에서 실행 중인지 확인 (꺼져 있으면 서킷 브레이커가 일정 시간 차단)
             target_lang = "중국어" if direction == 'ko-zh' else "한국어"
             source_lang = "한국어" if direction == 'ko-zh' else "중국어"
             
             prompt = f"다음 {source_lang} 텍스트를 {target_lang}로 번역해주세요. 번역 결과만 출력하세요:\n\n{text}"
             
-            response = requests.post(
-                "http://localhost:11434/api/generate",
+            response = guarded_post(
+                ollama_url(),
                 json={
-                    "model": "llama3.2:3b",  # 가벼운 모델
+                    "model": ollama_model(),  # 기본: 가벼운 모델 (llama3.2:3b)
                     "prompt": prompt,
                     "stream": False
                 },
                 timeout=15
             )
             
-            if response.status_code == 200:
+            if response is not None and response.status_code == 200:
                 result = response.json()
                 translation = result.get('response', '').strip()
                 if translation and translation != text:
@@ -415,16 +504,10 @@ class ExcelTranslatorTemplate:
                 return text  # 중국어가 없으면 번역하지 않음
         
         # 1단계: 번역 사전 먼저 시도 (빠르고 정확)
+        # 사전은 한 번만 컴파일하고, 가장 왼쪽-가장 긴 용어부터 한 번에 치환
         dictionary = self.ko_to_zh_dict if direction == 'ko-zh' else self.zh_to_ko_dict
-        sorted_keys = sorted(dictionary.keys(), key=len, reverse=True)
-        
-        translated = text_str
-        has_dict_translation = False
-        
-        for original in sorted_keys:
-            if original in translated:
-                translated = translated.replace(original, dictionary[original])
-                has_dict_translation = True
+        translated, replaced_count = get_glossary_matcher(dictionary).replace(text_str)
+        has_dict_translation = replaced_count > 0
         
         # 사전 번역 후에도 원본 언어가 남아있는지 확인
         still_has_original_lang = False
@@ -437,108 +520,303 @@ class ExcelTranslatorTemplate:
         if has_dict_translation and not still_has_original_lang:
             return translated
         
-        # 2단계: Google Translate 시도 (가장 안정적)
-        google_translation = self.translate_with_google(text_str, direction)
-        if google_translation:
-            return google_translation
+        # 2단계: 번역 메모리 확인 (네트워크 엔진 호출 전)
+        cached_translation = self.translation_memory.get(direction, text_str)
+        if cached_translation:
+            self.progress.add('cache_hits')
+            return cached_translation
         
-        # 3단계: LibreTranslate API 시도
+        # 3단계: 네트워크 엔진 (Google -> LibreTranslate -> Hugging Face -> Ollama)
+        # 기본은 순차 폴백, 경쟁 모드에서는 헤지 병렬 실행
         source_lang = 'ko' if direction == 'ko-zh' else 'zh'
         target_lang = 'zh' if direction == 'ko-zh' else 'ko'
         
-        api_translation = self.translate_with_libretranslate(text_str, source_lang, target_lang)
-        if api_translation:
-            return api_translation
-        
-        # 4단계: Hugging Face API 시도
-        hf_translation = self.translate_with_huggingface(text_str, direction)
-        if hf_translation:
-            return hf_translation
-        
-        # 5단계: Ollama 로컬 LLM 시도
-        ollama_translation = self.translate_with_ollama(text_str, direction)
-        if ollama_translation:
-            return ollama_translation
-        
-        # 6단계: 모든 방법 실패시 사전 번역 결과라도 반환
+        engines = [
+            ('google', lambda: self.translate_with_google(text_str, direction)),
+            ('libretranslate', lambda: self.translate_with_libretranslate(text_str, source_lang, target_lang)),
+            ('huggingface', lambda: self.translate_with_huggingface(text_str, direction)),
+            ('ollama', lambda: self.translate_with_ollama(text_str, direction))
+        ]
+        # 엔진 호출 시간은 작업자 스레드마다 합산 (번역 단계 경과 시간보다 클 수 있음)
+        with self.timings.measure('engine_calls'):
+            engine, engine_translation = run_engines(engines, race=self.race_mode)
+        if engine_translation:
+            self.translation_memory.put(direction, text_str, engine_translation, engine)
+            return engine_translation
+        
+        # 4단계: 모든 방법 실패시 사전 번역 결과라도 반환 (캐시/체크포인트에 남기지 않음 - 다음에 재시도)
+        self.progress.add('fallbacks')
+        self._fallback_state.used = True
         return translated
 
-    def translate_excel_file(self, input_path, output_path, direction='ko-zh', preserve_english=True, add_new_sheet=True, exclude_sheets=None, exclude_cells=None, exclude_patterns=None):
-        """템플릿 방식 엑셀 번역 - 원본 파일 복사 후 내용만 교체"""
+    def _translate_text_checked(self, text, direction, preserve_english=True):
+        """translate_text 결과와 엔진 실패로 대체 번역했는지 -> (번역문, is_fallback)"""
+        self._fallback_state.used = False
+        translated = self.translate_text(text, direction, preserve_english)
+        return translated, getattr(self._fallback_state, 'used', False)
+
+    def translate_excel_file(self, input_path, output_path, direction='ko-zh', preserve_english=True, add_new_sheet=True, exclude_sheets=None, exclude_cells=None, exclude_patterns=None,
+                             previous_source=None, previous_output=None, previous_manifest=None, manifest_path=None):
+        """템플릿 방식 엑셀 번역 - 원본 파일 복사 후 내용만 교체 (단계별 소요 시간은 self.timings)
+        sheet_processes가 2 이상이고 번역할 시트가 여러 개면 시트별 셀 수집/번역을 작업 프로세스로 나눠서 실행
+        
+        수정본 번역: previous_manifest(이전 실행의 매니페스트 파일) 또는 previous_source/previous_output(이전 원본/번역 파일)을 주면
+        시트명+좌표 기준으로 원문이 같은 셀은 이전 번역을 그대로 쓰고 바뀌거나 새로 생긴 셀만 번역 (셀 수는 self.cell_counts)
+        manifest_path를 주면 이번 결과의 매니페스트를 저장 (다음 수정본의 previous_manifest로 사용)"""
+        timings = self.timings
+        timings.reset()
+        self.cell_counts = {'reused': 0, 'translated': 0}
+        started = time.perf_counter()
         
-        self.progress_callback("원본 파일 복사 중...", 0)
+        with timings.measure('load_previous'):
+            previous = self.load_previous_translation(direction, preserve_english, previous_source, previous_output, previous_manifest)
+        manifest = TranslationManifest(direction, preserve_english) if manifest_path else None
+        
+        self.progress.stage('copy', "원본 파일 복사 중...", 0)
         
         # 1단계: 원본 파일을 출력 파일로 직접 복사
-        shutil.copy2(input_path, output_path)
+        with timings.measure('copy_file'):
+            shutil.copy2(input_path, output_path)
         
-        self.progress_callback("번역 작업 준비 중...", 10)
+        self.progress.stage('prepare', "번역 작업 준비 중...", 10)
+        
+        # 시트 단위 다중 프로세스: 작업 프로세스가 원본 시트를 읽어 번역하는 동안 이 프로세스는 통합 문서 불러오기/시트 복사
+        executor, sheet_futures = self.start_sheet_processes(input_path, direction, preserve_english, exclude_sheets, exclude_cells, exclude_patterns, previous)
+        try:
+            self._translate_workbook(output_path, direction, preserve_english, add_new_sheet, exclude_sheets, exclude_cells, exclude_patterns, sheet_futures, previous, manifest)
+        finally:
+            if executor is not None:
+                # 오류로 끝났으면 아직 시작하지 않은 시트는 취소 (shutdown(cancel_futures=)는 3.9부터라 하나씩 취소)
+                for future in sheet_futures:
+                    future.cancel()
+                executor.shutdown(wait=True)
+        
+        if manifest is not None:
+            with timings.measure('save_manifest'):
+                manifest.save(manifest_path)
+        if previous is not None:
+            print(f"이전 번역 재사용: 셀 {self.cell_counts['reused']}개, 새로 번역: 셀 {self.cell_counts['translated']}개")
+        
+        timings.add('total', time.perf_counter() - started)
+        self.progress.stage('done', "번역 완료!", 100)
+        return output_path
+
+    def load_previous_translation(self, direction, preserve_english, previous_source=None, previous_output=None, previous_manifest=None):
+        """이전 실행의 매니페스트 파일, 없으면 이전 원본/번역 파일 비교로 만든 매니페스트 (쓸 수 없으면 None)"""
+        if previous_manifest:
+            try:
+                manifest = TranslationManifest.load(previous_manifest)
+            except (OSError, ValueError) as e:
+                print(f"이전 매니페스트를 읽을 수 없어 전체를 번역합니다: {e}")
+                return None
+            if not manifest.is_compatible(direction, preserve_english):
+                print("이전 매니페스트의 번역 설정(방향/영문 유지)이 달라 전체를 번역합니다.")
+                return None
+            return manifest
+        if previous_source and previous_output:
+            return self.manifest_from_workbooks(previous_source, previous_output, direction)
+        return None
+
+    def manifest_from_workbooks(self, previous_source, previous_output, direction):
+        """이전 원본과 번역 파일을 같은 좌표끼리 비교하여 값이 바뀐(번역된) 셀만 매니페스트로 만듦
+        (값이 그대로인 셀은 제외 설정 때문인지 알 수 없으므로 다시 번역 대상으로 둠)
+        번역 시트는 새 시트 추가 방식의 이름(시트명_中文/시트명_한국어)을 먼저 찾고, 없으면 같은 이름의 시트 사용"""
+        manifest = TranslationManifest(direction)
+        source_workbook = openpyxl.load_workbook(previous_source, read_only=True)
+        output_workbook = openpyxl.load_workbook(previous_output, read_only=True)
+        try:
+            for sheet_name in source_workbook.sheetnames:
+                target_name = self.translated_sheet_name(sheet_name, direction)
+                if target_name not in output_workbook.sheetnames:
+                    target_name = sheet_name if sheet_name in output_workbook.sheetnames else None
+                if target_name is None:
+                    continue
+                source_values = {}
+                for row in source_workbook[sheet_name].iter_rows():
+                    for cell in row:
+                        if isinstance(cell.value, str):
+                            source_values[cell.coordinate] = cell.value
+                for row in output_workbook[target_name].iter_rows():
+                    for cell in row:
+                        if cell.value is None:
+                            continue
+                        source_value = source_values.get(cell.coordinate)
+                        if source_value is not None and cell.value != source_value:
+                            manifest.record(sheet_name, cell.coordinate, source_value, cell.value)
+        finally:
+            source_workbook.close()
+            output_workbook.close()
+        print(f"이전 번역 파일에서 번역된 셀 {len(manifest)}개를 찾음")
+        return manifest
+
+    def translated_sheet_name(self, sheet_name, direction):
+        """새 시트 추가 방식에서 번역 시트 이름"""
+        return f"{sheet_name}_中文" if direction == 'ko-zh' else f"{sheet_name}_한국어"
+
+    def reuse_previous_translations(self, cells, entries, sheet_name, manifest=None):
+        """원문이 이전 실행과 같은 셀은 이전 번역을 바로 반영하고, 번역이 필요한 셀 목록만 반환"""
+        remaining = []
+        for cell in cells:
+            translation = reuse_translation(entries, cell.coordinate, cell.value)
+            if translation is None:
+                remaining.append(cell)
+                continue
+            if manifest is not None:
+                manifest.record(sheet_name, cell.coordinate, cell.value, translation)
+            cell.value = translation
+        self.cell_counts['reused'] += len(cells) - len(remaining)
+        return remaining
+
+    def start_sheet_processes(self, input_path, direction, preserve_english, exclude_sheets=None, exclude_cells=None, exclude_patterns=None, previous=None):
+        """시트별 작업 제출 -> (프로세스 풀, {future: 원본 시트명}), 한 프로세스로 처리할 경우 (None, None)"""
+        if self.sheet_processes <= 1:
+            return None, None
+        workbook = openpyxl.load_workbook(input_path, read_only=True)
+        sheet_names = [name for name in workbook.sheetnames if not (exclude_sheets and name in exclude_sheets)]
+        workbook.close()
+        if len(sheet_names) < 2:
+            return None, None
+        
+        # 번역 서버처럼 스레드가 있는 프로세스에서도 안전하도록 fork 대신 spawn 사용 (Windows와 같은 방식)
+        processes = min(self.sheet_processes, len(sheet_names))
+        executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_sheet_worker,
+            initargs=(type(self), self.race_mode, self.max_workers, self.checkpoint.path if self.checkpoint is not None else None),
+        )
+        futures = {
+            executor.submit(_translate_sheet_unit, input_path, name, direction, preserve_english, exclude_cells, exclude_patterns,
+                            previous.sheet_entries(name) if previous is not None else None): name
+            for name in sheet_names
+        }
+        print(f"시트 {len(sheet_names)}개를 작업 프로세스 {processes}개로 나눠서 번역")
+        return executor, futures
+
+    def _translate_workbook(self, output_path, direction, preserve_english, add_new_sheet, exclude_sheets, exclude_cells, exclude_patterns, sheet_futures=None, previous=None, manifest=None):
+        timings = self.timings
         
         # 2단계: 복사된 파일에서 텍스트만 번역하여 교체
         # openpyxl로 열어서 텍스트만 교체 (서식은 건드리지 않음)
-        workbook = openpyxl.load_workbook(output_path, data_only=False)
+        with timings.measure('load_workbook'):
+            workbook = openpyxl.load_workbook(output_path, data_only=False)
+        
+        original_sheets = list(workbook.sheetnames)
+        total_sheets = len(original_sheets)
         
-        total_sheets = len(workbook.sheetnames)
+        # 번역할 시트 목록: (번역 대상 시트, 제외 체크용 원본 시트명)
+        target_sheets = []
         
-        if add_new_sheet:
-            # 새 시트 추가 방식
-            original_sheets = list(workbook.sheetnames)
+        for sheet_idx, sheet_name in enumerate(original_sheets):
+            # 제외할 시트인지 확인
+            if exclude_sheets and sheet_name in exclude_sheets:
+                self.progress_callback(f"시트 '{sheet_name}' 건너뜀 (제외 목록)", (sheet_idx / total_sheets) * 10 + 10)
+                continue
             
-            for sheet_idx, sheet_name in enumerate(original_sheets):
-                # 제외할 시트인지 확인
-                if exclude_sheets and sheet_name in exclude_sheets:
-                    self.progress_callback(f"시트 '{sheet_name}' 건너뜀 (제외 목록)", (sheet_idx / len(original_sheets)) * 40 + 20)
-                    continue
-                    
-                sheet = workbook[sheet_name]
-                sheet_progress = (sheet_idx / len(original_sheets)) * 40 + 20
-                
-                self.progress_callback(f"시트 '{sheet_name}' 복사 중...", sheet_progress)
+            sheet = workbook[sheet_name]
+            
+            if add_new_sheet:
+                # 새 시트 추가 방식
+                self.progress_callback(f"시트 '{sheet_name}' 복사 중...", (sheet_idx / total_sheets) * 10 + 10)
                 
                 # 시트 복사
-                new_sheet = workbook.copy_worksheet(sheet)
-                translated_sheet_name = f"{sheet_name}_中文" if direction == 'ko-zh' else f"{sheet_name}_한국어"
-                new_sheet.title = translated_sheet_name
+                with timings.measure('copy_worksheet'):
+                    new_sheet = workbook.copy_worksheet(sheet)
+                new_sheet.title = self.translated_sheet_name(sheet_name, direction)
                 
                 # 복사된 시트에서만 번역 (원본 시트명을 사용해서 제외 체크)
-                self.translate_sheet_content_only(new_sheet, direction, preserve_english, sheet_idx, len(original_sheets), exclude_cells, exclude_patterns, original_sheet_name=sheet_name)
-        else:
-            # 원본 시트에서 직접 번역
-            for sheet_idx, sheet_name in enumerate(workbook.sheetnames):
-                # 제외할 시트인지 확인
-                if exclude_sheets and sheet_name in exclude_sheets:
-                    self.progress_callback(f"시트 '{sheet_name}' 건너뜀 (제외 목록)", (sheet_idx / total_sheets) * 60 + 20)
-                    continue
-                    
-                sheet = workbook[sheet_name]
-                self.translate_sheet_content_only(sheet, direction, preserve_english, sheet_idx, total_sheets, exclude_cells, exclude_patterns)
-        
-        self.progress_callback("변경사항 저장 중...", 90)
-        
-        # 3단계: 저장 (서식은 그대로, 텍스트만 변경됨)
-        workbook.save(output_path)
-        workbook.close()
+                target_sheets.append((new_sheet, sheet_name))
+            else:
+                # 원본 시트에서 직접 번역
+                target_sheets.append((sheet, sheet_name))
         
-        self.progress_callback("번역 완료!", 100)
-        return output_path
+        if sheet_futures:
+            # 3-4단계 (다중 프로세스): 시트별 번역 결과를 끝나는 순서대로 대상 시트에 반영
+            self.apply_sheet_results(sheet_futures, {name: sheet for sheet, name in target_sheets}, 20, 85, manifest)
+        else:
+            # 3단계: 워크북 전체에서 번역할 셀을 수집하고 문자열 단위로 묶기
+            self.progress.stage('collect', "번역할 텍스트 수집 중...", 20)
+            with timings.measure('collect'):
+                exclusions = self.compile_exclusions(exclude_cells, exclude_patterns)
+                cell_groups = {}
+                for sheet, sheet_name in target_sheets:
+                    cells = self.collect_translatable_cells(sheet, exclude_cells, exclude_patterns, original_sheet_name=sheet_name, exclusions=exclusions)
+                    if previous is not None:
+                        cells = self.reuse_previous_translations(cells, previous.sheet_entries(sheet_name), sheet_name, manifest)
+                    self.cell_counts['translated'] += len(cells)
+                    self.group_cells_by_text(cells, cell_groups)
+            
+            # 4단계: 고유 문자열마다 한 번씩만 번역하여 모든 셀에 반영
+            with timings.measure('translate'):
+                self.translate_cell_groups(cell_groups, direction, preserve_english, 20, 85)
+            
+            if manifest is not None:
+                original_names = {sheet.title: sheet_name for sheet, sheet_name in target_sheets}
+                for original_value, cells in cell_groups.items():
+                    for cell in cells:
+                        manifest.record(original_names[cell.parent.title], cell.coordinate, original_value, cell.value)
+        
+        self.progress.stage('save', "변경사항 저장 중...", 90)
+        
+        # 5단계: 저장 (서식은 그대로, 텍스트만 변경됨)
+        with timings.measure('save'):
+            workbook.save(output_path)
+            workbook.close()
 
-    def translate_sheet_content_only(self, sheet, direction, preserve_english, sheet_idx, total_sheets, exclude_cells=None, exclude_patterns=None, original_sheet_name=None):
-        """시트 내용만 번역 (서식은 건드리지 않음)"""
+    def apply_sheet_results(self, sheet_futures, sheets_by_name, progress_start, progress_end, manifest=None):
+        """작업 프로세스의 시트별 (좌표, 번역문) 목록을 대상 시트에 반영 (manifest를 주면 원문과 함께 기록)
+        작업 프로세스의 수집/번역/엔진 호출 시간은 프로세스마다 합산 (경과 시간보다 클 수 있음)"""
+        total_sheets = len(sheet_futures)
+        self.progress.stage('translate', f"시트별 번역 중... (시트 {total_sheets}개)", progress_start, total=total_sheets, unique=0)
+        unique = 0
+        with self.timings.measure('sheet_processes'):
+            for done_count, future in enumerate(as_completed(sheet_futures), 1):
+                result = future.result()
+                sheet = sheets_by_name[result['sheet']]
+                with self.timings.measure('apply'):
+                    for coordinate, translated_value in result['changes']:
+                        cell = sheet[coordinate]
+                        if manifest is not None:
+                            manifest.record(result['sheet'], coordinate, cell.value, translated_value)
+                        cell.value = translated_value
+                    if manifest is not None:
+                        for coordinate in result['unchanged']:
+                            value = sheet[coordinate].value
+                            manifest.record(result['sheet'], coordinate, value, value)
+                self.cell_counts['reused'] += result['reused']
+                self.cell_counts['translated'] += result['translated']
+                for stage, seconds in result['timings'].items():
+                    self.timings.add(stage, seconds)
+                unique += result['unique']
+                self.progress.add('cache_hits', result['cache_hits'])
+                self.progress.add('fallbacks', result['fallbacks'])
+                total_progress = progress_start + (done_count / total_sheets) * (progress_end - progress_start)
+                self.progress.update(f"시트 '{result['sheet']}' 번역 완료 ({done_count}/{total_sheets} 시트)", total_progress, done=done_count, unique=unique)
+
+    def collect_translatable_cells(self, sheet, exclude_cells=None, exclude_patterns=None, original_sheet_name=None, exclusions=None):
+        """번역할 셀 수집 (제외 셀/패턴 적용, exclusions: 미리 컴파일된 ExclusionIndex)"""
         
         # 원본 시트명 (새 시트 추가 모드에서 사용)
         sheet_name_for_exclusion = original_sheet_name or sheet.title
         
-        print(f"시트 '{sheet.title}' 번역 시작 (제외 체크용 시트명: '{sheet_name_for_exclusion}')")
+        debug_logger.debug("시트 '%s' 셀 수집 시작 (제외 체크용 시트명: '%s')", sheet.title, sheet_name_for_exclusion)
         if exclude_cells:
-            print(f"  제외할 셀: {len(exclude_cells)}개 - {exclude_cells[:3]}{'...' if len(exclude_cells) > 3 else ''}")
+            debug_logger.debug("  제외할 셀: %d개 - %s", len(exclude_cells), exclude_cells[:3])
         if exclude_patterns:
-            print(f"  제외할 패턴: {exclude_patterns}")
+            debug_logger.debug("  제외할 패턴: %s", exclude_patterns)
+        # 셀 단위 로그는 디버그 로거가 켜져 있을 때만 기록
+        log_cells = is_debug_enabled()
+        
+        if exclusions is None:
+            exclusions = self.compile_exclusions(exclude_cells, exclude_patterns)
+        # 이 시트에 적용되는 제외 범위가 없으면 셀별 범위 검사 생략
+        check_cells = exclusions.sheet_has_cells(sheet_name_for_exclusion)
+        check_patterns = exclusions.has_patterns
         
-        # 시트의 모든 셀을 순회하면서 값만 변경
         total_cells = 0
         cells_to_translate = []
-        
-        # 먼저 번역할 셀들 수집
         excluded_count = 0
+        
         for row in sheet.iter_rows():
             for cell in row:
                 total_cells += 1
@@ -546,35 +824,120 @@ class ExcelTranslatorTemplate:
                 # 값이 있는 셀만 처리
                 if cell.value and isinstance(cell.value, str) and cell.value.strip():
                     # 제외할 셀 범위 확인 (원본 시트명 사용)
-                    if exclude_cells and self.is_cell_excluded(cell, exclude_cells, sheet_name_for_exclusion):
+                    if check_cells and exclusions.is_cell_excluded(sheet_name_for_exclusion, cell.row, cell.column):
                         excluded_count += 1
-                        print(f"  제외: {sheet_name_for_exclusion}!{cell.coordinate} = '{cell.value}'")
+                        if log_cells:
+                            debug_logger.debug("  제외: %s!%s = '%s'", sheet_name_for_exclusion, cell.coordinate, cell.value)
                         continue
                     
                     # 제외할 패턴 확인
-                    if exclude_patterns and self.is_text_excluded(cell.value, exclude_patterns):
+                    if check_patterns and exclusions.is_text_excluded(cell.value):
                         excluded_count += 1
-                        print(f"  패턴 제외: {sheet_name_for_exclusion}!{cell.coordinate} = '{cell.value}'")
+                        if log_cells:
+                            debug_logger.debug("  패턴 제외: %s!%s = '%s'", sheet_name_for_exclusion, cell.coordinate, cell.value)
                         continue
                         
                     cells_to_translate.append(cell)
         
-        print(f"  총 {total_cells}개 셀 중 {len(cells_to_translate)}개 번역 예정 ({excluded_count}개 제외)")
-        
-        # 번역 작업
-        for idx, cell in enumerate(cells_to_translate):
-            if idx % 10 == 0 or idx == len(cells_to_translate) - 1:
-                sheet_base = (sheet_idx / total_sheets) * 60 + 20
-                cell_progress = (idx / len(cells_to_translate)) * (60 / total_sheets) if cells_to_translate else 0
-                total_progress = min(85, sheet_base + cell_progress)
-                self.progress_callback(f"시트 번역 중... ({idx + 1}/{len(cells_to_translate)} 텍스트)", total_progress)
+        print(f"시트 '{sheet.title}': 총 {total_cells}개 셀 중 {len(cells_to_translate)}개 번역 예정 ({excluded_count}개 제외)")
+        return cells_to_translate
+
+    def group_cells_by_text(self, cells, cell_groups=None):
+        """셀을 값(정확히 같은 문자열) 기준으로 묶기 - {문자열: [셀, ...]}"""
+        if cell_groups is None:
+            cell_groups = {}
+        for cell in cells:
+            cell_groups.setdefault(cell.value, []).append(cell)
+        return cell_groups
+
+    def translate_unique_texts(self, unique_texts, direction, preserve_english, progress_start, progress_end, on_translated=None):
+        """고유 문자열 목록 번역 - {원문: 번역문} 반환
+        on_translated(원문, 번역문)은 완료 순서대로 호출 스레드에서 실행됨
+        self.checkpoint가 있으면 이미 기록된 문자열은 번역하지 않고, 엔진이 번역한 결과만 체크포인트에 기록"""
+        unique_texts = list(unique_texts)
+        total_unique = len(unique_texts)
+        translations = {}
+        checkpoint = self.checkpoint
+        self.progress.stage('translate', f"번역 중... (고유 텍스트 {total_unique}개)", progress_start, total=total_unique, unique=total_unique)
+        
+        def apply_translation(original_value, translated_value, done_count, record=True):
+            translations[original_value] = translated_value
+            if on_translated:
+                on_translated(original_value, translated_value)
+            if record and checkpoint is not None:
+                checkpoint.record(original_value, translated_value)
             
-            original_value = cell.value
-            translated_value = self.translate_text(original_value, direction, preserve_english)
+            # 완료된 개수 기준이므로 병렬 실행에서도 진행률이 줄어들지 않음 (전달 빈도는 보고기가 시간 기준으로 제한)
+            total_progress = progress_start + (done_count / total_unique) * (progress_end - progress_start)
+            self.progress.update(f"시트 번역 중... ({done_count}/{total_unique} 고유 텍스트)", total_progress, done=done_count)
+        
+        # 재시작된 작업: 체크포인트에 있는 문자열은 바로 반영
+        done_count = 0
+        if checkpoint is not None:
+            restored = checkpoint.restore(unique_texts)
+            if restored:
+                print(f"체크포인트에서 번역 {len(restored)}개 복원 (남은 고유 텍스트 {total_unique - len(restored)}개)")
+                for original_value, translated_value in restored.items():
+                    done_count += 1
+                    apply_translation(original_value, translated_value, done_count, record=False)
+                unique_texts = [text for text in unique_texts if text not in restored]
+        
+        try:
+            if self.max_workers <= 1 or len(unique_texts) <= 1:
+                for original_value in unique_texts:
+                    translated_value, is_fallback = self._translate_text_checked(original_value, direction, preserve_english)
+                    done_count += 1
+                    apply_translation(original_value, translated_value, done_count, record=not is_fallback)
+                return translations
             
-            # 값이 실제로 변경된 경우에만 업데이트
+            # 고유 문자열을 작업자 풀에서 동시에 번역하고, 결과는 완료 순서대로 이 스레드에서 반영
+            # 스택 덤프에서 어느 작업의 풀인지 알 수 있도록 호출한 작업 스레드 이름을 붙임
+            thread_name_prefix = f'{threading.current_thread().name}/cell-translate'
+            translate = self._translate_text_checked if self.profiler is None else self.profiler.wrap(self._translate_text_checked)
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=thread_name_prefix) as executor:
+                futures = {
+                    executor.submit(translate, original_value, direction, preserve_english): original_value
+                    for original_value in unique_texts
+                }
+                for done_count, future in enumerate(as_completed(futures), done_count + 1):
+                    original_value = futures[future]
+                    try:
+                        translated_value, is_fallback = future.result()
+                    except Exception as e:
+                        # 일시적인 오류일 수 있으므로 체크포인트에 남기지 않음 (재시작 시 다시 번역)
+                        print(f"  번역 오류 ('{original_value}'): {e}")
+                        self.progress.add('fallbacks')
+                        apply_translation(original_value, original_value, done_count, record=False)
+                        continue
+                    # 엔진 실패로 대체 번역한 문자열도 체크포인트에 남기지 않음 (재시작 시 다시 번역)
+                    apply_translation(original_value, translated_value, done_count, record=not is_fallback)
+            return translations
+        finally:
+            if checkpoint is not None:
+                checkpoint.flush()
+
+    def translate_cell_groups(self, cell_groups, direction, preserve_english, progress_start, progress_end):
+        """고유 문자열을 한 번씩만 번역하고 결과를 해당 문자열을 가진 모든 셀에 반영"""
+        total_cells = sum(len(cells) for cells in cell_groups.values())
+        
+        print(f"번역 대상: 셀 {total_cells}개, 고유 텍스트 {len(cell_groups)}개 (작업자 {self.max_workers}개)")
+        
+        def apply_to_cells(original_value, translated_value):
+            # 값이 실제로 변경된 경우에만 업데이트 (openpyxl 셀은 호출 스레드에서만 수정)
             if translated_value != original_value:
-                cell.value = translated_value
+                for cell in cell_groups[original_value]:
+                    cell.value = translated_value
+        
+        self.translate_unique_texts(cell_groups.keys(), direction, preserve_english, progress_start, progress_end, apply_to_cells)
+
+    def translate_sheet_content_only(self, sheet, direction, preserve_english, sheet_idx, total_sheets, exclude_cells=None, exclude_patterns=None, original_sheet_name=None, exclusions=None):
+        """시트 내용만 번역 (서식은 건드리지 않음)"""
+        cells_to_translate = self.collect_translatable_cells(sheet, exclude_cells, exclude_patterns, original_sheet_name, exclusions)
+        cell_groups = self.group_cells_by_text(cells_to_translate)
+        
+        # 시트 단위 진행률 구간 (20-80%를 시트 수로 나눔)
+        sheet_base = (sheet_idx / total_sheets) * 60 + 20
+        self.translate_cell_groups(cell_groups, direction, preserve_english, sheet_base, min(85, sheet_base + 60 / total_sheets))
 
 if __name__ == "__main__":
     def test_progress(msg, pct):
@@ -7,19 +7,20 @@ openpyxl을 사용하여 원본 엑셀 파일의 모든 서식을 유지하면
 import openpyxl
 from openpyxl.utils import get_column_letter
 from copy import copy
-import requests
+from engine_registry import get_engine_registry
 import re
 import os
 import time
+from translation_memory import get_translation_memory
+from progress_reporter import as_progress_reporter
+from engine_endpoints import libretranslate_urls
 
 class ExcelTranslatorWithProgress:
     def __init__(self, progress_callback=None):
-        self.progress_callback = progress_callback or (lambda msg, pct: None)
-        self.libretranslate_urls = [
-            "https://libretranslate.de/translate",
-            "https://translate.argosopentech.com/translate",
-            "https://libretranslate.com/translate"
-        ]
+        # 진행률 보고기 (셀 단위 진행률은 시간 간격으로 합쳐서 전달)
+        self.progress = as_progress_reporter(progress_callback)
+        self.progress_callback = self.progress
+        self.libretranslate_urls = libretranslate_urls()
         
         # 발주서 전용 번역 사전
         self.ko_to_zh_dict = {
@@ -78,7 +79,8 @@ class ExcelTranslatorWithProgress:
         return bool(re.match(r'^[a-zA-Z0-9\s\.\,\-\(\)\[\]\{\}@:\/]+$', text.strip()))
 
     def translate_with_api(self, text, source_lang, target_lang):
-        """LibreTranslate API로 번역"""
+        """LibreTranslate API로 번역 (프로세스 공유 세션의 연결 풀 사용)"""
+        session = get_engine_registry().session()
         for url in self.libretranslate_urls:
             try:
                 data = {
@@ -88,7 +90,7 @@ class ExcelTranslatorWithProgress:
                     "format": "text"
                 }
                 
-                response = requests.post(url, json=data, timeout=10)
+                response = session.post(url, json=data, timeout=10)
                 if response.status_code == 200:
                     result = response.json()
                     if 'translatedText' in result:
@@ -128,8 +130,16 @@ class ExcelTranslatorWithProgress:
         source_lang = 'ko' if direction == 'ko-zh' else 'zh'
         target_lang = 'zh' if direction == 'ko-zh' else 'ko'
         
+        # 번역 메모리 확인 (API 호출 전)
+        memory = get_translation_memory()
+        cached_result = memory.get(direction, text)
+        if cached_result:
+            self.progress.add('cache_hits')
+            return cached_result
+        
         api_result = self.translate_with_api(text, source_lang, target_lang)
         if api_result:
+            memory.put(direction, text, api_result, 'libretranslate')
             return api_result
         
         # 백업 사전 사용
@@ -172,7 +182,7 @@ class ExcelTranslatorWithProgress:
 
     def translate_excel_file(self, input_path, output_path, direction='ko-zh', preserve_english=True, add_new_sheet=True):
         """진행률 콜백이 포함된 엑셀 파일 번역"""
-        self.progress_callback("파일 열기 중...", 0)
+        self.progress.stage('open', "파일 열기 중...", 0)
         workbook = openpyxl.load_workbook(input_path)
         
         total_sheets = len(workbook.sheetnames)
@@ -187,7 +197,7 @@ class ExcelTranslatorWithProgress:
                 target_ws = workbook.create_sheet(title=translated_sheet_name)
                 
                 # 완전한 시트 복사
-                self.progress_callback(f"시트 '{sheet_name}' 복사 중...", sheet_idx / total_sheets * 20)
+                self.progress.stage('copy', f"시트 '{sheet_name}' 복사 중...", sheet_idx / total_sheets * 20)
                 self.copy_worksheet(source_ws, target_ws)
                 
                 # 텍스트만 번역하여 업데이트
@@ -198,29 +208,29 @@ class ExcelTranslatorWithProgress:
                 source_ws = workbook[sheet_name]
                 self.translate_worksheet_with_progress(source_ws, direction, preserve_english, sheet_idx, total_sheets)
 
-        self.progress_callback("파일 저장 중...", 95)
+        self.progress.stage('save', "파일 저장 중...", 95)
         workbook.save(output_path)
         workbook.close()
         
-        self.progress_callback("번역 완료!", 100)
+        self.progress.stage('done', "번역 완료!", 100)
         return output_path
 
     def translate_worksheet_with_progress(self, worksheet, direction, preserve_english, sheet_idx, total_sheets):
         """진행률 표시와 함께 워크시트 번역"""
         total_cells = worksheet.max_row * worksheet.max_column if worksheet.max_row and worksheet.max_column else 1
         current_cell = 0
+        self.progress.stage('translate', "시트 번역 중...", 20 + (sheet_idx / total_sheets) * 70, total=total_cells)
         
         for row in worksheet.iter_rows():
             for cell in row:
                 current_cell += 1
                 
-                # 20셀마다 진행률 업데이트
-                if current_cell % 20 == 0 or current_cell == total_cells:
-                    # 전체 진행률 = 시트 진행률(20-90%) + 셀 번역 진행률
-                    sheet_base = 20 + (sheet_idx / total_sheets) * 70
-                    cell_progress = (current_cell / total_cells) * (70 / total_sheets)
-                    total_progress = min(90, sheet_base + cell_progress)
-                    self.progress_callback(f"시트 번역 중... ({current_cell}/{total_cells} 셀)", total_progress)
+                # 진행률 업데이트 (전달 빈도는 보고기가 시간 기준으로 제한)
+                # 전체 진행률 = 시트 진행률(20-90%) + 셀 번역 진행률
+                sheet_base = 20 + (sheet_idx / total_sheets) * 70
+                cell_progress = (current_cell / total_cells) * (70 / total_sheets)
+                total_progress = min(90, sheet_base + cell_progress)
+                self.progress.update(f"시트 번역 중... ({current_cell}/{total_cells} 셀)", total_progress, done=current_cell)
                 
                 if cell.value and isinstance(cell.value, str):
                     translated = self.translate_text(cell.value, direction, preserve_english)
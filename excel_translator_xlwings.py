@@ -9,10 +9,13 @@ import os
 import re
 import requests
 import time
+from progress_reporter import as_progress_reporter
 
 class ExcelTranslatorXlwings:
     def __init__(self, progress_callback=None):
-        self.progress_callback = progress_callback or (lambda msg, pct: None)
+        # 진행률 보고기 (셀 단위 진행률은 시간 간격으로 합쳐서 전달)
+        self.progress = as_progress_reporter(progress_callback)
+        self.progress_callback = self.progress
         
         # 발주서 전용 번역 사전
         self.ko_to_zh_dict = {
@@ -93,7 +96,7 @@ class ExcelTranslatorXlwings:
     def translate_excel_file(self, input_path, output_path, direction='ko-zh', preserve_english=True, add_new_sheet=True):
         """xlwings를 사용한 엑셀 파일 번역 (100% 서식 보존)"""
         try:
-            self.progress_callback("Excel 애플리케이션 시작 중...", 0)
+            self.progress.stage('open', "Excel 애플리케이션 시작 중...", 0)
             
             # Excel 애플리케이션 시작 (보이지 않게)
             app = xw.App(visible=False)
@@ -132,7 +135,7 @@ class ExcelTranslatorXlwings:
                     # 원본 시트에서 직접 번역
                     self.translate_worksheet_xlwings(sheet, direction, preserve_english, sheet_idx, total_sheets)
             
-            self.progress_callback("파일 저장 중...", 90)
+            self.progress.stage('save', "파일 저장 중...", 90)
             
             # 파일 저장
             wb.save(output_path)
@@ -141,7 +144,7 @@ class ExcelTranslatorXlwings:
             self.progress_callback("Excel 종료 중...", 95)
             app.quit()
             
-            self.progress_callback("번역 완료!", 100)
+            self.progress.stage('done', "번역 완료!", 100)
             return output_path
             
         except Exception as e:
@@ -177,6 +180,7 @@ class ExcelTranslatorXlwings:
             
             total_cells = len(values) * len(values[0]) if values else 0
             current_cell = 0
+            self.progress.stage('translate', "시트 번역 중...", (sheet_idx / total_sheets) * 70 + 10, total=total_cells)
             
             # 번역된 값들을 저장할 배열
             translated_values = []
@@ -187,12 +191,11 @@ class ExcelTranslatorXlwings:
                 for col_idx, cell_value in enumerate(row):
                     current_cell += 1
                     
-                    # 20셀마다 진행률 업데이트
-                    if current_cell % 20 == 0 or current_cell == total_cells:
-                        sheet_base = (sheet_idx / total_sheets) * 70 + 10
-                        cell_progress = (current_cell / total_cells) * (70 / total_sheets)
-                        total_progress = min(85, sheet_base + cell_progress)
-                        self.progress_callback(f"시트 번역 중... ({current_cell}/{total_cells} 셀)", total_progress)
+                    # 진행률 업데이트 (전달 빈도는 보고기가 시간 기준으로 제한)
+                    sheet_base = (sheet_idx / total_sheets) * 70 + 10
+                    cell_progress = (current_cell / total_cells) * (70 / total_sheets)
+                    total_progress = min(85, sheet_base + cell_progress)
+                    self.progress.update(f"시트 번역 중... ({current_cell}/{total_cells} 셀)", total_progress, done=current_cell)
                     
                     # 텍스트인 경우에만 번역
                     if cell_value and isinstance(cell_value, str):
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+번역 제외 인덱스 - 제외 셀/범위와 제외 패턴을 작업당 한 번만 컴파일
+셀 범위는 시트별·행별로 병합된 열 구간으로 저장하여 셀마다 제외 목록 전체를 다시 파싱하지 않음
+제외 패턴은 하나의 정규식으로 합쳐서 텍스트를 한 번만 검사
+"""
+
+import re
+from bisect import bisect_right
+
+from openpyxl.utils import range_boundaries
+
+# 이 행 수보다 큰 범위는 행별로 펼치지 않고 사각형 그대로 보관 (예: A:A 같은 열 전체 범위)
+ROW_EXPAND_LIMIT = 1000
+# 행/열 제한이 없는 범위의 끝 값
+UNBOUNDED = float('inf')
+
+
+def _merge_intervals(intervals):
+    """겹치거나 맞닿은 [시작, 끝] 구간 병합"""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return merged
+
+
+class _SheetExclusions:
+    """시트 하나의 제외 범위 (행별 열 구간 + 큰 사각형 범위)"""
+
+    def __init__(self):
+        self._row_intervals = {}
+        self.rectangles = []
+        # 행별 (구간 시작 목록, 구간 끝 목록) - bisect 조회용
+        self._rows = {}
+
+    def add(self, min_row, max_row, min_col, max_col):
+        if max_row - min_row + 1 > ROW_EXPAND_LIMIT:
+            self.rectangles.append((min_row, max_row, min_col, max_col))
+            return
+        for row in range(min_row, max_row + 1):
+            self._row_intervals.setdefault(row, []).append((min_col, max_col))
+
+    def freeze(self):
+        for row, intervals in self._row_intervals.items():
+            merged = _merge_intervals(intervals)
+            self._rows[row] = ([start for start, _ in merged], [end for _, end in merged])
+        self._row_intervals = {}
+
+    def contains(self, row, column):
+        entry = self._rows.get(row)
+        if entry is not None:
+            starts, ends = entry
+            index = bisect_right(starts, column) - 1
+            if index >= 0 and column <= ends[index]:
+                return True
+        for min_row, max_row, min_col, max_col in self.rectangles:
+            if min_row <= row <= max_row and min_col <= column <= max_col:
+                return True
+        return False
+
+
+class ExclusionIndex:
+    def __init__(self, exclude_cells=None, exclude_patterns=None):
+        # 시트명 -> _SheetExclusions (None: 시트명 없이 지정되어 모든 시트에 적용)
+        self._sheets = {}
+        self.invalid_entries = []
+
+        for entry in exclude_cells or []:
+            self._add_entry(entry)
+        for sheet in self._sheets.values():
+            sheet.freeze()
+
+        patterns = {str(pattern).strip().lower() for pattern in exclude_patterns or []}
+        patterns.discard('')
+        self.patterns = sorted(patterns)
+        self._pattern_re = re.compile('|'.join(re.escape(pattern) for pattern in self.patterns)) if patterns else None
+
+    def _add_entry(self, entry):
+        entry = str(entry).strip()
+        if not entry:
+            return
+
+        # 시트명이 포함된 경우 (Sheet1!A1 형식, 셀 주소에는 '!'가 없으므로 마지막 '!' 기준)
+        raw_entry = entry
+        sheet_name = None
+        if '!' in entry:
+            sheet_name, _, entry = entry.rpartition('!')
+
+        try:
+            min_col, min_row, max_col, max_row = range_boundaries(entry.upper())
+        except (TypeError, ValueError):
+            min_col = min_row = None
+            max_col = max_row = 0
+
+        # 단일 셀은 행과 열이 모두 있어야 함 (열 전체/행 전체는 A:C, 2:5처럼 ':'로 지정)
+        if (min_col is None and min_row is None) or (':' not in entry and (min_col is None or min_row is None)):
+            self.invalid_entries.append(raw_entry)
+            return
+
+        # 열 전체(A:C) / 행 전체(2:5) 범위
+        min_row, max_row = (min(min_row, max_row), max(min_row, max_row)) if min_row else (1, UNBOUNDED)
+        min_col, max_col = (min(min_col, max_col), max(min_col, max_col)) if min_col else (1, UNBOUNDED)
+
+        sheet = self._sheets.get(sheet_name)
+        if sheet is None:
+            sheet = self._sheets[sheet_name] = _SheetExclusions()
+        sheet.add(min_row, max_row, min_col, max_col)
+
+    @property
+    def has_cells(self):
+        return bool(self._sheets)
+
+    @property
+    def has_patterns(self):
+        return self._pattern_re is not None
+
+    def sheet_has_cells(self, sheet_name):
+        """해당 시트에 적용되는 제외 범위가 있는지 (없으면 셀별 검사 생략 가능)"""
+        return sheet_name in self._sheets or None in self._sheets
+
+    def is_cell_excluded(self, sheet_name, row, column):
+        """셀(행, 열 번호)이 제외 범위에 포함되는지 확인"""
+        for key in (sheet_name, None):
+            sheet = self._sheets.get(key)
+            if sheet is not None and sheet.contains(row, column):
+                return True
+        return False
+
+    def is_text_excluded(self, text):
+        """텍스트에 제외 패턴이 포함되는지 확인 (대소문자 무시)"""
+        if self._pattern_re is None:
+            return False
+        return self._pattern_re.search(str(text).lower()) is not None
+
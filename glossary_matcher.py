@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+번역 사전 매칭기 - Aho-Corasick 오토마톤
+사전을 한 번만 컴파일해 두고, 문자열을 한 번만 훑으면서 가장 왼쪽-가장 긴 용어부터 치환
+(용어마다 str.replace를 반복하던 방식 대체)
+"""
+
+import threading
+from collections import OrderedDict, deque
+
+# 컴파일된 오토마톤 캐시 크기
+MATCHER_CACHE_SIZE = 16
+
+
+class GlossaryMatcher:
+    def __init__(self, glossary):
+        self.glossary = dict(glossary)
+
+        # 트라이 노드: 전이(goto), 실패 링크(fail), 노드에서 끝나는 용어 길이(term_len, 없으면 0),
+        # 실패 링크를 따라 만나는 가장 가까운 용어 노드(dict_link)
+        self._goto = [{}]
+        self._fail = [0]
+        self._term_len = [0]
+        self._dict_link = [0]
+
+        for term in self.glossary:
+            if term:
+                self._add_term(term)
+        self._build_links()
+
+    def _add_term(self, term):
+        node = 0
+        for ch in term:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._term_len.append(0)
+                self._dict_link.append(0)
+                self._goto[node][ch] = next_node
+            node = next_node
+        self._term_len[node] = len(term)
+
+    def _build_links(self):
+        """BFS로 실패 링크와 사전 링크 계산"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(ch, 0)
+                if fail == child:
+                    fail = 0
+                self._fail[child] = fail
+                self._dict_link[child] = fail if self._term_len[fail] else self._dict_link[fail]
+                queue.append(child)
+
+    def longest_matches(self, text):
+        """시작 위치별 가장 긴 용어 길이 {시작 위치: 길이}"""
+        goto = self._goto
+        fail = self._fail
+        term_len = self._term_len
+        dict_link = self._dict_link
+
+        longest = {}
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            match = node if term_len[node] else dict_link[node]
+            while match:
+                length = term_len[match]
+                start = i - length + 1
+                if length > longest.get(start, 0):
+                    longest[start] = length
+                match = dict_link[match]
+        return longest
+
+    def replace(self, text):
+        """가장 왼쪽-가장 긴 용어부터 겹치지 않게 한 번에 치환. (치환 결과, 치환 횟수) 반환"""
+        longest = self.longest_matches(text)
+        if not longest:
+            return text, 0
+
+        parts = []
+        replaced = 0
+        position = 0
+        last = 0
+        text_length = len(text)
+        while position < text_length:
+            length = longest.get(position)
+            if length:
+                parts.append(text[last:position])
+                parts.append(self.glossary[text[position:position + length]])
+                replaced += 1
+                position += length
+                last = position
+            else:
+                position += 1
+        parts.append(text[last:])
+        return ''.join(parts), replaced
+
+
+# 내용 기준 캐시 (같은 내용의 사전은 인스턴스가 달라도 오토마톤 공유)
+_matcher_cache = OrderedDict()
+# 객체 기준 캐시 (같은 사전 객체로 반복 호출될 때 내용 해시 계산 생략)
+_identity_cache = OrderedDict()
+_matcher_cache_lock = threading.Lock()
+
+
+def _remember(cache, key, value):
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > MATCHER_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def get_glossary_matcher(glossary):
+    """컴파일된 오토마톤 반환 - 사전이 바뀐 경우에만 새로 컴파일
+    (같은 사전 객체는 크기만 비교하므로, 크기가 같은 제자리 수정 후에는 invalidate_glossary_matchers 호출)"""
+    with _matcher_cache_lock:
+        entry = _identity_cache.get(id(glossary))
+        if entry is not None and entry[0] is glossary and entry[1] == len(glossary):
+            return entry[2]
+
+    fingerprint = hash(frozenset(glossary.items()))
+
+    with _matcher_cache_lock:
+        matcher = _matcher_cache.get(fingerprint)
+        if matcher is not None and matcher.glossary == glossary:
+            _matcher_cache.move_to_end(fingerprint)
+        else:
+            matcher = None
+
+    if matcher is None:
+        matcher = GlossaryMatcher(glossary)
+
+    with _matcher_cache_lock:
+        _remember(_matcher_cache, fingerprint, matcher)
+        # 사전 객체를 함께 보관하여 id가 다른 객체에 재사용되지 않게 함
+        _remember(_identity_cache, id(glossary), (glossary, len(glossary), matcher))
+    return matcher
+
+
+def invalidate_glossary_matchers():
+    """캐시된 오토마톤 모두 삭제 (사전을 제자리에서 수정한 경우)"""
+    with _matcher_cache_lock:
+        _matcher_cache.clear()
+        _identity_cache.clear()
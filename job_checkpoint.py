@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+번역 작업 체크포인트 - 작업 중 번역이 끝난 원문 -> 번역문을 주기적으로 파일에 추가 기록
+서버가 작업 도중 종료되어도 재시작 후 같은 작업을 이어서 실행할 때 기록된 문자열은 다시 번역하지 않음
+(JSON Lines 추가 기록 - 마지막 줄이 쓰다가 끊겼으면 그 줄만 무시)
+"""
+
+import json
+import os
+import threading
+import time
+
+# 버퍼를 파일에 기록하는 최소 간격 (초)과 한 번에 모아 둘 최대 항목 수
+DEFAULT_CHECKPOINT_INTERVAL = 5.0
+DEFAULT_CHECKPOINT_BATCH = 500
+
+
+class TranslationCheckpoint:
+    def __init__(self, path, interval=None, batch_size=DEFAULT_CHECKPOINT_BATCH):
+        self.path = path
+        if interval is None:
+            interval = float(os.environ.get('TRANSLATION_CHECKPOINT_INTERVAL', DEFAULT_CHECKPOINT_INTERVAL))
+        self.interval = interval
+        self.batch_size = batch_size
+
+        self._lock = threading.Lock()
+        self._pending = []
+        self._last_flush = time.monotonic()
+        self._mappings = self._load()
+
+    def _load(self):
+        mappings = {}
+        if not os.path.exists(self.path):
+            return mappings
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    source, target = json.loads(line)
+                except ValueError:
+                    continue
+                mappings[source] = target
+        return mappings
+
+    def __len__(self):
+        return len(self._mappings)
+
+    def restore(self, texts):
+        """이미 번역이 끝난 문자열의 {원문: 번역문}"""
+        return {text: self._mappings[text] for text in texts if text in self._mappings}
+
+    def record(self, source, target):
+        """번역 결과 기록 - 간격/개수를 넘으면 파일에 추가 (번역 결과를 반영하는 스레드에서 호출)"""
+        with self._lock:
+            self._mappings[source] = target
+            self._pending.append((source, target))
+            due = len(self._pending) >= self.batch_size or time.monotonic() - self._last_flush >= self.interval
+        if due:
+            self.flush()
+
+    def flush(self):
+        """모아 둔 항목을 한 번의 쓰기로 추가 (시트 단위 작업 프로세스가 같은 파일에 추가해도 줄이 섞이지 않음)"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+            if not pending:
+                return
+            data = ''.join(json.dumps([source, target], ensure_ascii=False) + '\n' for source, target in pending)
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, data.encode('utf-8'))
+            finally:
+                os.close(fd)
+
+    def remove(self):
+        """작업이 끝나면 체크포인트 파일 삭제"""
+        with self._lock:
+            self._pending = []
+            if os.path.exists(self.path):
+                os.remove(self.path)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+번역 작업 진단 도구 - 작업별 cProfile 기록 + 실행 중인 스레드의 스택 덤프
+Python 3.11 이하: cProfile은 스레드마다 따로 켜야 하므로 작업 스레드와 번역 작업자 풀 스레드에서 각각 기록한 뒤 합쳐서 저장
+(경쟁 모드의 공유 엔진 실행기 스레드는 기록되지 않음)
+Python 3.12 이상: cProfile은 프로세스에 하나만 켤 수 있고 모든 스레드를 기록하므로 작업 스레드에서만 켬
+(같은 시간에 실행된 다른 작업의 스레드도 함께 기록되고, 다른 프로파일러가 이미 켜져 있으면 기록하지 않고 그대로 실행)
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import traceback
+
+PROFILE_SORT_KEYS = ('cumulative', 'tottime', 'calls', 'ncalls', 'time')
+DEFAULT_PROFILE_LIMIT = 60
+# 3.12부터 cProfile은 sys.monitoring 기반 (프로세스 전체에서 하나, 모든 스레드 기록)
+PROCESS_WIDE_PROFILER = sys.version_info >= (3, 12)
+
+
+def is_profiling_enabled(requested=None):
+    """작업 요청의 profile 값이 우선, 없으면 TRANSLATION_PROFILE 환경 변수 (모든 작업 기록)"""
+    if requested:
+        return str(requested).lower() in ('1', 'true', 'yes', 'on')
+    return os.environ.get('TRANSLATION_PROFILE', '').lower() in ('1', 'true', 'yes', 'on')
+
+
+class JobProfiler:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profiles = []
+        # 다른 프로파일러가 이미 켜져 있어서 기록하지 못한 횟수
+        self.unavailable = 0
+
+    def run(self, func, *args, **kwargs):
+        """현재 스레드에서 func를 기록하며 실행 (이미 기록 중인 스레드면 그대로 실행)
+        프로파일러를 켤 수 없으면 기록 없이 실행 - 프로파일링 실패가 작업 결과를 바꾸지 않음"""
+        if getattr(self._local, 'active', False):
+            return func(*args, **kwargs)
+        profile = getattr(self._local, 'profile', None) or cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # 3.12 이상: 같은 프로세스에서 다른 작업의 프로파일러가 이미 켜져 있음
+            with self._lock:
+                self.unavailable += 1
+            print(f"프로파일러를 켤 수 없어 기록 없이 실행: {e}")
+            return func(*args, **kwargs)
+        if getattr(self._local, 'profile', None) is None:
+            self._local.profile = profile
+            with self._lock:
+                self._profiles.append(profile)
+        self._local.active = True
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+            self._local.active = False
+
+    def wrap(self, func):
+        """작업자 풀에 넘길 함수를 실행 스레드에서 기록하도록 감쌈
+        (3.12 이상은 작업 스레드의 프로파일러가 작업자 스레드도 기록하므로 그대로 반환)"""
+        if PROCESS_WIDE_PROFILER:
+            return func
+
+        def profiled(*args, **kwargs):
+            return self.run(func, *args, **kwargs)
+        return profiled
+
+    def dump(self, path):
+        """스레드별 기록을 합쳐서 pstats 파일로 저장"""
+        with self._lock:
+            profiles = list(self._profiles)
+        if not profiles:
+            return None
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        stats.dump_stats(path)
+        return path
+
+
+def format_profile(path, sort='cumulative', limit=DEFAULT_PROFILE_LIMIT):
+    """저장된 pstats 파일을 사람이 읽을 수 있는 표로 변환"""
+    if sort not in PROFILE_SORT_KEYS:
+        raise ValueError(f"정렬 기준은 {', '.join(PROFILE_SORT_KEYS)} 중 하나여야 합니다.")
+    output = io.StringIO()
+    stats = pstats.Stats(path, stream=output)
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    return output.getvalue()
+
+
+def format_thread_stacks(thread_names=None):
+    """실행 중인 스레드의 현재 스택 (thread_names를 주면 이름이 그 값으로 시작하는 스레드만)"""
+    threads = {thread.ident: thread for thread in threading.enumerate()}
+    sections = []
+    for ident, frame in sys._current_frames().items():
+        thread = threads.get(ident)
+        name = thread.name if thread else f'thread-{ident}'
+        if thread_names is not None and not any(name.startswith(prefix) for prefix in thread_names):
+            continue
+        daemon = ' (daemon)' if thread is not None and thread.daemon else ''
+        sections.append(f'Thread {name} [{ident}]{daemon}\n' + ''.join(traceback.format_stack(frame)))
+    return '\n'.join(sorted(sections))
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+번역 작업 스케줄러 - 고정된 수의 작업자 스레드 + 크기 제한이 있는 대기열
+업로드마다 스레드를 새로 만들지 않고, 동시에 실행되는 엑셀 번역 작업 수를 제한
+대기열이 가득 차면 QueueFullError를 발생시켜 서버가 429(Retry-After)로 응답할 수 있게 함
+"""
+
+import math
+import os
+import threading
+import time
+from collections import deque
+
+# 동시에 실행되는 번역 작업 수
+DEFAULT_JOB_WORKERS = 2
+# 실행을 기다릴 수 있는 작업 수 (실행 중인 작업 제외)
+DEFAULT_JOB_QUEUE_SIZE = 20
+# 완료된 작업이 없어 소요 시간을 모를 때 사용하는 작업당 예상 시간 (초)
+DEFAULT_JOB_SECONDS = 30
+# 소요 시간 평균에 사용하는 최근 작업 수
+DURATION_SAMPLE_SIZE = 50
+
+
+class QueueFullError(Exception):
+    """대기열이 가득 참 (retry_after: 다시 시도하기까지 권장 대기 시간(초))"""
+
+    def __init__(self, retry_after):
+        super().__init__(f'번역 대기열이 가득 찼습니다. {retry_after}초 후 다시 시도하세요.')
+        self.retry_after = retry_after
+
+
+class JobScheduler:
+    def __init__(self, workers=DEFAULT_JOB_WORKERS, max_queue=DEFAULT_JOB_QUEUE_SIZE):
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+
+        self._condition = threading.Condition()
+        self._queue = deque()
+        # 실행 중인 작업 ID -> 실행 스레드 이름 (스택 덤프용)
+        self._running = {}
+        self._durations = deque(maxlen=DURATION_SAMPLE_SIZE)
+        self._threads = []
+        self.submitted = 0
+        self.rejected = 0
+        self.completed = 0
+        self.failed = 0
+
+    def _start_workers(self):
+        """첫 작업이 들어올 때 작업자 스레드 시작"""
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._worker, name=f'translation-job-{len(self._threads) + 1}', daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def submit(self, job_id, func, *args, **kwargs):
+        """작업 등록 - 대기열이 가득 차면 QueueFullError 발생. 등록 직후 대기 순번 반환 (0: 바로 실행)"""
+        with self._condition:
+            self._check_capacity_locked()
+            idle_workers = self.workers - len(self._running)
+            self._start_workers()
+            self._queue.append((job_id, func, args, kwargs))
+            self.submitted += 1
+            self._condition.notify()
+            return max(0, len(self._queue) - idle_workers)
+
+    def check_capacity(self):
+        """대기열에 자리가 없으면 QueueFullError 발생 (업로드 파일을 저장하기 전 확인용)"""
+        with self._condition:
+            self._check_capacity_locked()
+
+    def _check_capacity_locked(self):
+        waiting = len(self._queue) - (self.workers - len(self._running))
+        if waiting >= self.max_queue:
+            self.rejected += 1
+            raise QueueFullError(self._retry_after_locked())
+
+    def _retry_after_locked(self):
+        """대기 중인 작업이 빠지기까지 걸릴 예상 시간 (최근 작업 평균 소요 시간 기준)"""
+        average = sum(self._durations) / len(self._durations) if self._durations else DEFAULT_JOB_SECONDS
+        # 작업자 중 하나라도 작업을 끝내면 대기열에 자리가 생김
+        return max(1, math.ceil(average / self.workers))
+
+    def position(self, job_id):
+        """대기 순번 (1부터, 실행 중이면 0, 스케줄러에 없으면 None)"""
+        with self._condition:
+            if job_id in self._running:
+                return 0
+            # 쉬고 있는 작업자가 곧 가져갈 작업은 실행 중으로 취급
+            idle_workers = self.workers - len(self._running)
+            for index, queued in enumerate(self._queue):
+                if queued[0] == job_id:
+                    return max(0, index + 1 - idle_workers)
+            return None
+
+    def running_thread(self, job_id):
+        """작업을 실행 중인 스레드 이름 (이 프로세스에서 실행 중이 아니면 None)"""
+        with self._condition:
+            return self._running.get(job_id)
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+                job_id, func, args, kwargs = self._queue.popleft()
+                self._running[job_id] = threading.current_thread().name
+
+            started = time.monotonic()
+            success = False
+            try:
+                func(*args, **kwargs)
+                success = True
+            except Exception as e:
+                print(f"번역 작업 오류 (Job {job_id}): {e}")
+            finally:
+                with self._condition:
+                    self._running.pop(job_id, None)
+                    self._durations.append(time.monotonic() - started)
+                    if success:
+                        self.completed += 1
+                    else:
+                        self.failed += 1
+
+    def snapshot(self):
+        with self._condition:
+            return {
+                'workers': self.workers,
+                'max_queue': self.max_queue,
+                'running': len(self._running),
+                'queued': len(self._queue),
+                'submitted': self.submitted,
+                'rejected': self.rejected,
+                'completed': self.completed,
+                'failed': self.failed,
+                'avg_job_seconds': round(sum(self._durations) / len(self._durations), 2) if self._durations else None
+            }
+
+
+# 프로세스 전역 공유 인스턴스
+_shared_scheduler = None
+_shared_lock = threading.Lock()
+
+
+def get_job_scheduler():
+    """프로세스 전역 작업 스케줄러 (환경 변수로 작업자 수/대기열 크기 설정 가능)"""
+    global _shared_scheduler
+    with _shared_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = JobScheduler(
+                workers=int(os.environ.get('TRANSLATION_JOB_WORKERS', DEFAULT_JOB_WORKERS)),
+                max_queue=int(os.environ.get('TRANSLATION_JOB_QUEUE_SIZE', DEFAULT_JOB_QUEUE_SIZE))
+            )
+        return _shared_scheduler
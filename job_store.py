@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+번역 작업 저장소 - SQLite 기반 작업 상태 저장 + TTL 만료 정리
+작업 상태는 한 번의 UPDATE로 원자적으로 갱신되고, 서버를 재시작해도 유지됨
+만료된 작업은 백그라운드 정리 스레드가 기록과 입력/출력 파일을 함께 삭제
+작업을 맡은 작업자 프로세스(owner_pid)가 종료되었으면 정리 스레드가 이어서 실행 대기(interrupted) 또는 오류로 표시
+작업이 바뀔 때마다 대기 중인 스레드(SSE 진행률 스트림)를 깨움
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'translation_jobs.db')
+# 끝난 작업(완료/오류)을 보관하는 시간 (초)
+DEFAULT_JOB_TTL = 3600
+# 끝나지 않은 작업도 이 시간 동안 갱신이 없으면 정리 (초)
+DEFAULT_STALE_JOB_TTL = 24 * 3600
+# 만료 작업 정리 주기 (초)
+DEFAULT_REAPER_INTERVAL = 60
+
+FINISHED_STATUSES = ('completed', 'error')
+# 서버 재시작으로 중단되어 이어서 실행을 기다리는 작업 (서버 프로세스 하나가 가져가면 queued로 바뀜)
+INTERRUPTED_STATUS = 'interrupted'
+# 서버 재시작으로 중단된 작업에 남기는 오류 메시지 (이어서 실행할 수 없는 작업)
+INTERRUPTED_JOB_MESSAGE = '서버가 재시작되어 번역 작업이 중단되었습니다. 다시 시도해 주세요.'
+RESUMING_JOB_MESSAGE = '서버가 재시작되어 체크포인트부터 이어서 번역합니다.'
+
+JOB_FIELDS = (
+    'status', 'progress', 'message', 'error', 'input_path', 'output_filename',
+    'original_filename', 'result_path', 'details', 'profile_path', 'manifest_path', 'params', 'checkpoint_path', 'owner_pid'
+)
+
+# 처음 만든 뒤에 추가된 열 (기존 DB 파일에 없으면 추가)
+ADDED_COLUMNS = {
+    'details': 'TEXT',
+    'profile_path': 'TEXT',
+    'manifest_path': 'TEXT',
+    'params': 'TEXT',
+    'checkpoint_path': 'TEXT',
+    'owner_pid': 'INTEGER'
+}
+
+
+def is_resume_enabled():
+    """재시작 후 끝나지 않은 작업을 이어서 실행할지 (TRANSLATION_RESUME_JOBS, 기본: 사용)"""
+    return os.environ.get('TRANSLATION_RESUME_JOBS', '1').lower() not in ('0', 'false', 'no', 'off')
+
+
+def is_process_alive(pid):
+    """같은 호스트의 프로세스가 살아 있는지 (Windows는 os.kill(pid, 0)이 신호를 보내므로 확인하지 않고 True)"""
+    if os.name == 'nt':
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobStore:
+    def __init__(self, db_path=None, ttl=DEFAULT_JOB_TTL, stale_ttl=DEFAULT_STALE_JOB_TTL):
+        self.db_path = db_path or DEFAULT_DB_PATH
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.evicted = 0
+
+        self._lock = threading.Lock()
+        self._reaper = None
+        # 종료된 작업자의 작업을 interrupted로 표시한 뒤 호출 (번역 서버가 가져가서 이어서 실행)
+        self.on_orphaned = None
+        # 변경 알림 (작업이 바뀔 때마다 버전 증가)
+        self._changed = threading.Condition()
+        self._version = 0
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS jobs ('
+            ' job_id TEXT PRIMARY KEY,'
+            ' status TEXT NOT NULL,'
+            ' progress REAL NOT NULL DEFAULT 0,'
+            ' message TEXT,'
+            ' error TEXT,'
+            ' input_path TEXT,'
+            ' output_filename TEXT,'
+            ' original_filename TEXT,'
+            ' result_path TEXT,'
+            ' created_at REAL NOT NULL,'
+            ' updated_at REAL NOT NULL,'
+            ' finished_at REAL)'
+        )
+        existing_columns = {row[1] for row in self._conn.execute('PRAGMA table_info(jobs)')}
+        for column, column_type in ADDED_COLUMNS.items():
+            if column not in existing_columns:
+                self._conn.execute(f'ALTER TABLE jobs ADD COLUMN {column} {column_type}')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_finished_at ON jobs (finished_at)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_updated_at ON jobs (updated_at)')
+        self._conn.commit()
+
+    def _notify(self):
+        with self._changed:
+            self._version += 1
+            self._changed.notify_all()
+
+    @property
+    def version(self):
+        with self._changed:
+            return self._version
+
+    def wait_for_change(self, version, timeout=None):
+        """version 이후 작업이 바뀔 때까지(또는 timeout초) 대기 후 현재 버전 반환
+        다른 프로세스에서 바뀐 작업은 알림이 오지 않으므로 호출하는 쪽에서 timeout마다 다시 조회"""
+        with self._changed:
+            if self._version == version:
+                self._changed.wait(timeout)
+            return self._version
+
+    def _check_fields(self, fields):
+        unknown = set(fields) - set(JOB_FIELDS)
+        if unknown:
+            raise ValueError(f"알 수 없는 작업 필드: {', '.join(sorted(unknown))}")
+
+    def create(self, job_id, **fields):
+        """새 작업 등록 (기본 상태: queued)"""
+        self._check_fields(fields)
+        fields.setdefault('status', 'queued')
+        fields.setdefault('progress', 0)
+        now = time.time()
+        columns = ['job_id'] + list(fields) + ['created_at', 'updated_at']
+        values = [job_id] + list(fields.values()) + [now, now]
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO jobs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                values
+            )
+            self._conn.commit()
+        self._notify()
+
+    def update(self, job_id, **fields):
+        """작업 상태 갱신 (한 번의 UPDATE로 원자적으로 반영, 끝난 상태가 되면 만료 시각 기준 기록)"""
+        self._check_fields(fields)
+        if not fields:
+            return False
+        now = time.time()
+        assignments = [f'{name} = ?' for name in fields] + ['updated_at = ?']
+        values = list(fields.values()) + [now]
+        if fields.get('status') in FINISHED_STATUSES:
+            assignments.append('finished_at = ?')
+            values.append(now)
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE jobs SET {', '.join(assignments)} WHERE job_id = ?",
+                values + [job_id]
+            )
+            self._conn.commit()
+        self._notify()
+        return cursor.rowcount > 0
+
+    def get(self, job_id):
+        """작업 정보 dict 반환, 없으면 None"""
+        with self._lock:
+            row = self._conn.execute('SELECT * FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def delete(self, job_id):
+        with self._lock:
+            self._conn.execute('DELETE FROM jobs WHERE job_id = ?', (job_id,))
+            self._conn.commit()
+        self._notify()
+
+    def fail_unfinished(self, message):
+        """이전 프로세스에서 끝나지 않은 작업을 오류로 표시 (서버 시작 시 호출)"""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                'UPDATE jobs SET status = ?, error = ?, updated_at = ?, finished_at = ? '
+                f"WHERE status NOT IN ({', '.join('?' * len(FINISHED_STATUSES))})",
+                ('error', message, now, now) + FINISHED_STATUSES
+            )
+            self._conn.commit()
+        self._notify()
+        return cursor.rowcount
+
+    def interrupt_unfinished(self, message):
+        """이전 프로세스에서 끝나지 않은 작업 중 실행 정보(params)와 입력 파일이 남아 있는 작업은 interrupted로,
+        나머지는 오류로 표시 (서버 시작 시 한 번 호출) -> (이어서 실행할 작업 수, 오류로 표시한 작업 수)"""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT job_id, params, input_path FROM jobs '
+                f"WHERE status NOT IN ({', '.join('?' * (len(FINISHED_STATUSES) + 1))})",
+                FINISHED_STATUSES + (INTERRUPTED_STATUS,)
+            ).fetchall()
+            result = self._interrupt_locked(rows, message, now)
+        self._notify()
+        return result
+
+    def _interrupt_locked(self, rows, message, now, resume=True, owner_pids=None):
+        """rows의 작업 중 실행 정보(params)와 입력 파일이 남아 있는 작업은 interrupted로, 나머지는 오류로 표시
+        owner_pids: {작업 ID: 작업자 pid} - 그 사이에 다른 프로세스가 가져간 작업은 건드리지 않음"""
+        resumable = [row['job_id'] for row in rows
+                     if resume and row['params'] and row['input_path'] and os.path.exists(row['input_path'])]
+        failed = [row['job_id'] for row in rows if row['job_id'] not in resumable]
+        condition = ''
+        if owner_pids is not None:
+            condition = f" AND owner_pid = ? AND status NOT IN ({', '.join('?' * (len(FINISHED_STATUSES) + 1))})"
+
+        def guard(job_id):
+            return (job_id, owner_pids[job_id]) + FINISHED_STATUSES + (INTERRUPTED_STATUS,) if owner_pids is not None else (job_id,)
+
+        resumed = self._conn.executemany(
+            'UPDATE jobs SET status = ?, message = ?, updated_at = ? WHERE job_id = ?' + condition,
+            [(INTERRUPTED_STATUS, RESUMING_JOB_MESSAGE, now) + guard(job_id) for job_id in resumable]
+        ).rowcount
+        errors = self._conn.executemany(
+            'UPDATE jobs SET status = ?, error = ?, updated_at = ?, finished_at = ? WHERE job_id = ?' + condition,
+            [('error', message, now, now) + guard(job_id) for job_id in failed]
+        ).rowcount
+        self._conn.commit()
+        return max(resumed, 0), max(errors, 0)
+
+    def interrupt_orphaned(self, message, resume=True):
+        """작업을 맡은 작업자 프로세스(owner_pid)가 종료된 미완료 작업을 interrupt_unfinished와 같은 기준으로 표시
+        (gunicorn 작업자가 죽으면 그 작업자의 대기/실행 중 작업은 아무도 갱신하지 않으므로 정리 스레드에서 주기적으로 호출)
+        resume=False면 모두 오류로 표시 -> (이어서 실행할 작업 수, 오류로 표시한 작업 수)"""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT job_id, params, input_path, owner_pid FROM jobs '
+                f"WHERE owner_pid IS NOT NULL AND owner_pid != ? AND status NOT IN ({', '.join('?' * (len(FINISHED_STATUSES) + 1))})",
+                (os.getpid(),) + FINISHED_STATUSES + (INTERRUPTED_STATUS,)
+            ).fetchall()
+            rows = [row for row in rows if not is_process_alive(row['owner_pid'])]
+            if not rows:
+                return 0, 0
+            result = self._interrupt_locked(rows, message, now, resume, {row['job_id']: row['owner_pid'] for row in rows})
+        self._notify()
+        return result
+
+    def claim_interrupted(self):
+        """interrupted 작업을 queued로 바꾸며 가져감 - 여러 서버 프로세스가 동시에 호출해도 작업마다 한 프로세스만 가져감
+        가져간 작업의 owner_pid는 이 프로세스로 바뀜"""
+        claimed = []
+        with self._lock:
+            rows = self._conn.execute('SELECT job_id FROM jobs WHERE status = ? ORDER BY created_at', (INTERRUPTED_STATUS,)).fetchall()
+            for row in rows:
+                cursor = self._conn.execute(
+                    'UPDATE jobs SET status = ?, owner_pid = ?, updated_at = ? WHERE job_id = ? AND status = ?',
+                    ('queued', os.getpid(), time.time(), row['job_id'], INTERRUPTED_STATUS)
+                )
+                self._conn.commit()
+                if cursor.rowcount:
+                    claimed.append(dict(self._conn.execute('SELECT * FROM jobs WHERE job_id = ?', (row['job_id'],)).fetchone()))
+        if claimed:
+            self._notify()
+        return claimed
+
+    def evict_expired(self, now=None):
+        """만료된 작업 기록과 입력/출력 파일 삭제. 삭제한 작업 수 반환"""
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT job_id, input_path, result_path, profile_path, manifest_path, checkpoint_path FROM jobs '
+                'WHERE (finished_at IS NOT NULL AND finished_at < ?) OR updated_at < ?',
+                (now - self.ttl, now - self.stale_ttl)
+            ).fetchall()
+            if not rows:
+                return 0
+            self._conn.executemany('DELETE FROM jobs WHERE job_id = ?', [(row['job_id'],) for row in rows])
+            self._conn.commit()
+            self.evicted += len(rows)
+        self._notify()
+
+        for row in rows:
+            for path in (row['input_path'], row['result_path'], row['profile_path'], row['manifest_path'], row['checkpoint_path']):
+                if path and os.path.exists(path):
+                    try:
+                        os.remove(path)
+                    except OSError as e:
+                        print(f"만료 작업 파일 삭제 오류 ({path}): {e}")
+        return len(rows)
+
+    def start_reaper(self, interval=DEFAULT_REAPER_INTERVAL):
+        """만료 작업과 종료된 작업자의 작업을 주기적으로 정리하는 백그라운드 스레드 시작 (한 번만 시작됨)"""
+        with self._lock:
+            if self._reaper is not None:
+                return
+            self._reaper = threading.Thread(target=self._reap_forever, args=(interval,), name='job-reaper', daemon=True)
+            self._reaper.start()
+
+    def _reap_forever(self, interval):
+        while True:
+            try:
+                evicted = self.evict_expired()
+                if evicted:
+                    print(f"만료된 번역 작업 {evicted}개 정리")
+                self._reap_orphaned()
+            except sqlite3.Error as e:
+                print(f"만료 작업 정리 오류: {e}")
+            time.sleep(interval)
+
+    def _reap_orphaned(self):
+        resumed, failed = self.interrupt_orphaned(INTERRUPTED_JOB_MESSAGE, resume=is_resume_enabled())
+        if resumed or failed:
+            print(f"종료된 작업자 프로세스의 번역 작업 정리: 이어서 실행 {resumed}개, 오류 {failed}개")
+        if resumed and self.on_orphaned is not None:
+            try:
+                self.on_orphaned()
+            except Exception as e:
+                print(f"중단된 작업 이어서 실행 오류: {e}")
+
+    def stats(self):
+        with self._lock:
+            rows = self._conn.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        return {
+            'jobs': {row[0]: row[1] for row in rows},
+            'evicted': self.evicted,
+            'ttl': self.ttl,
+            'db_path': self.db_path
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# 프로세스 전역 공유 인스턴스
+_shared_store = None
+_shared_lock = threading.Lock()
+
+
+def get_job_store():
+    """프로세스 전역 작업 저장소 (환경 변수로 경로/보관 시간 설정 가능, 정리 스레드 자동 시작)"""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = JobStore(
+                db_path=os.environ.get('TRANSLATION_JOB_DB') or None,
+                ttl=float(os.environ.get('TRANSLATION_JOB_TTL', DEFAULT_JOB_TTL)),
+                stale_ttl=float(os.environ.get('TRANSLATION_STALE_JOB_TTL', DEFAULT_STALE_JOB_TTL))
+            )
+            _shared_store.start_reaper(float(os.environ.get('TRANSLATION_JOB_REAPER_INTERVAL', DEFAULT_REAPER_INTERVAL)))
+        return _shared_store
+
+
+def recover_unfinished_jobs(message=INTERRUPTED_JOB_MESSAGE):
+    """공유 인스턴스를 만들지 않고 끝나지 않은 작업을 이어서 실행 대기(interrupted) 또는 오류로 표시
+    (serve.py가 작업자 프로세스를 띄우기 전에 한 번만 호출 - 포크 전에 연결/정리 스레드를 만들지 않기 위함)
+    interrupted 작업은 각 작업자 프로세스가 시작할 때 claim_interrupted()로 나눠 가져감"""
+    store = JobStore(db_path=os.environ.get('TRANSLATION_JOB_DB') or None)
+    try:
+        if is_resume_enabled():
+            return store.interrupt_unfinished(message)
+        return 0, store.fail_unfinished(message)
+    finally:
+        store.close()
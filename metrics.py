@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+성능 측정 도구 - 작업 단계별 소요 시간 + Prometheus 텍스트 형식 지표
+외부 패키지 없이 카운터/게이지/히스토그램을 기록하고 /metrics 응답으로 내보냄
+지표는 프로세스별로 집계됨 (serve.py 다중 작업자에서는 응답한 작업자의 값)
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+# 엔진 호출/작업 단계 지연 시간 히스토그램 구간 (초)
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_STAGE_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0)
+
+
+class StageTimings:
+    """작업 단계별 소요 시간 (초) - 같은 단계를 여러 번 재면 합산, 여러 스레드에서 기록 가능"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seconds = {}
+
+    @contextmanager
+    def measure(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - started)
+
+    def add(self, stage, seconds):
+        with self._lock:
+            self._seconds[stage] = self._seconds.get(stage, 0.0) + seconds
+
+    def reset(self):
+        with self._lock:
+            self._seconds = {}
+
+    def as_dict(self):
+        with self._lock:
+            return {stage: round(seconds, 4) for stage, seconds in self._seconds.items()}
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(label_names, label_values, extra=None):
+    pairs = list(zip(label_names, label_values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = None
+
+    def __init__(self, name, help_text, label_names=()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name}: 레이블은 {', '.join(self.label_names) or '(없음)'}이어야 합니다.")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} {self.type_name}']
+        with self._lock:
+            for key in sorted(self._values):
+                lines.extend(self._render_value(key, self._values[key]))
+        return lines
+
+    def _render_value(self, key, value):
+        return [f'{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}']
+
+
+class Counter(_Metric):
+    type_name = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """수집 시점에 값을 채우는 게이지 (레이블 조합이 바뀌는 경우 clear()로 이전 값 삭제)"""
+    type_name = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def clear(self):
+        with self._lock:
+            self._values = {}
+
+
+class CollectedCounter(Gauge):
+    """다른 객체가 이미 세고 있는 누적값을 수집 시점에 그대로 채우는 카운터 (예: 번역 메모리 적중 수)"""
+    type_name = 'counter'
+
+
+class Histogram(_Metric):
+    type_name = 'histogram'
+
+    def __init__(self, name, help_text, label_names=(), buckets=DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry['buckets'][index] += 1
+            entry['sum'] += value
+            entry['count'] += 1
+
+    def _render_value(self, key, entry):
+        lines = [
+            f'{self.name}_bucket{_format_labels(self.label_names, key, ("le", _format_value(bound)))} {count}'
+            for bound, count in zip(self.buckets, entry['buckets'])
+        ]
+        labels = _format_labels(self.label_names, key)
+        lines.append(f'{self.name}_sum{labels} {_format_value(round(entry["sum"], 6))}')
+        lines.append(f'{self.name}_count{labels} {entry["count"]}')
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+        self._collectors = []
+
+    def _get_or_create(self, metric_class, name, help_text, label_names, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, help_text, label_names, **kwargs)
+            elif type(metric) is not metric_class:
+                raise ValueError(f'{name}: 이미 다른 형식의 지표로 등록되어 있습니다.')
+            return metric
+
+    def counter(self, name, help_text, label_names=()):
+        return self._get_or_create(Counter, name, help_text, label_names)
+
+    def gauge(self, name, help_text, label_names=()):
+        return self._get_or_create(Gauge, name, help_text, label_names)
+
+    def collected_counter(self, name, help_text, label_names=()):
+        return self._get_or_create(CollectedCounter, name, help_text, label_names)
+
+    def histogram(self, name, help_text, label_names=(), buckets=DEFAULT_LATENCY_BUCKETS):
+        return self._get_or_create(Histogram, name, help_text, label_names, buckets=buckets)
+
+    def add_collector(self, collector):
+        """/metrics 응답 직전에 호출할 함수 등록 (대기열 길이처럼 그 시점의 값을 게이지에 채움)"""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def render(self):
+        """Prometheus 텍스트 형식 (text/plain; version=0.0.4)"""
+        with self._lock:
+            collectors = list(self._collectors)
+        for collector in collectors:
+            try:
+                collector(self)
+            except Exception as e:
+                print(f"지표 수집 오류: {e}")
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+# 프로세스 전역 공유 인스턴스
+_shared_registry = MetricsRegistry()
+
+
+def get_metrics():
+    """프로세스 전역 지표 저장소"""
+    return _shared_registry
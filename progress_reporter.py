@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+번역 진행률 보고기 - 시간 기준으로 합쳐서 전달하는 진행률 이벤트
+단계(stage) 변경은 바로 전달하고, 셀/문자열 단위 진행률은 최소 간격마다 최신 값만 전달
+진행률에 단계, 완료/전체 개수, 고유 문자열 수, 캐시 적중 수, 엔진 실패로 사전/원문을 쓴 문자열 수(fallbacks)를 함께 담아 전달
+셀 단위 상세 로그는 기본적으로 꺼져 있는 디버그 로거로 보냄 (TRANSLATION_DEBUG=1로 켜기)
+"""
+
+import logging
+import os
+import threading
+import time
+
+# 진행률 전달 최소 간격 (초)
+DEFAULT_MIN_INTERVAL = 0.2
+
+STRUCTURED_FIELDS = ('stage', 'done', 'total', 'unique', 'cache_hits', 'fallbacks')
+
+# 셀 단위 상세 로그용 로거 (기본: 꺼짐)
+debug_logger = logging.getLogger('file_translator')
+if os.environ.get('TRANSLATION_DEBUG', '').lower() in ('1', 'true', 'yes', 'on'):
+    debug_logger.setLevel(logging.DEBUG)
+    if not debug_logger.handlers:
+        _handler = logging.StreamHandler()
+        _handler.setFormatter(logging.Formatter('%(asctime)s [%(threadName)s] %(message)s'))
+        debug_logger.addHandler(_handler)
+
+
+def is_debug_enabled():
+    """셀 단위 로그 문자열을 만들기 전에 확인 (꺼져 있으면 포맷 비용도 들지 않게)"""
+    return debug_logger.isEnabledFor(logging.DEBUG)
+
+
+class ProgressReporter:
+    """progress_callback(메시지, 진행률) 호환 진행률 보고기
+    on_event(이벤트 dict)를 주면 단계/개수/캐시 적중 정보를 함께 전달"""
+
+    def __init__(self, callback=None, on_event=None, min_interval=None):
+        self.callback = callback or (lambda msg, pct: None)
+        self.on_event = on_event
+        if min_interval is None:
+            min_interval = float(os.environ.get('TRANSLATION_PROGRESS_INTERVAL', DEFAULT_MIN_INTERVAL))
+        self.min_interval = min_interval
+
+        self._lock = threading.Lock()
+        self._fields = {'stage': None, 'done': 0, 'total': 0, 'unique': 0, 'cache_hits': 0, 'fallbacks': 0}
+        self._last_emit = 0.0
+        self.emitted = 0
+        self.skipped = 0
+
+    def __call__(self, message, percentage):
+        """기존 progress_callback 호출 방식 - 항상 전달 (단계 안내 메시지용)"""
+        self._emit(message, percentage)
+
+    def stage(self, stage, message, percentage, **fields):
+        """새 단계 시작 - 항상 전달 (total을 주면 완료 개수를 0부터 다시 셈)"""
+        with self._lock:
+            self._fields['stage'] = stage
+            if 'total' in fields:
+                self._fields['done'] = 0
+            self._set_fields(fields)
+        self._emit(message, percentage)
+
+    def update(self, message, percentage, **fields):
+        """셀/문자열 단위 진행률 - 최소 간격보다 자주 호출되면 건너뜀 (마지막 항목은 항상 전달)"""
+        with self._lock:
+            self._set_fields(fields)
+            finished = self._fields['total'] and self._fields['done'] >= self._fields['total']
+            if not finished and time.monotonic() - self._last_emit < self.min_interval:
+                self.skipped += 1
+                return
+        self._emit(message, percentage)
+
+    def add(self, field, count=1):
+        """개수 필드 증가 (예: 캐시 적중) - 여러 작업자 스레드에서 호출 가능"""
+        with self._lock:
+            self._fields[field] = self._fields.get(field, 0) + count
+
+    def _set_fields(self, fields):
+        for name, value in fields.items():
+            if name not in STRUCTURED_FIELDS:
+                raise ValueError(f"알 수 없는 진행률 필드: {name}")
+            self._fields[name] = value
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._fields)
+
+    def _emit(self, message, percentage):
+        with self._lock:
+            self._last_emit = time.monotonic()
+            self.emitted += 1
+            event = dict(self._fields, message=message, percentage=percentage)
+        self.callback(message, percentage)
+        if self.on_event:
+            self.on_event(event)
+
+
+def as_progress_reporter(progress_callback):
+    """progress_callback이 이미 ProgressReporter면 그대로, 아니면 감싸서 반환"""
+    if isinstance(progress_callback, ProgressReporter):
+        return progress_callback
+    return ProgressReporter(progress_callback)
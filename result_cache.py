@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+번역 결과 캐시 - 업로드 파일 내용 + 번역 설정의 해시를 키로 번역 결과 파일을 보관
+같은 파일을 같은 설정으로 다시 올리면 번역하지 않고 보관된 결과를 바로 돌려줌
+(엔진 실패로 사전 번역/원문을 쓴 문자열이 있는 결과는 보관하지 않음)
+전체 크기 상한을 넘으면 가장 오래 쓰이지 않은 결과부터 삭제 (LRU)
+색인은 SQLite라서 serve.py 다중 작업자 프로세스가 같은 캐시를 공유
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, 'result_cache')
+DEFAULT_MAX_MB = 500
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def stream_sha256(stream):
+    """파일 객체 내용 해시 (업로드 스트림은 저장하기 전에 해시하고 처음 위치로 되돌림)"""
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def make_cache_key(content_digest, options):
+    """파일 내용 해시 + 번역 설정(방향, 영문 유지, 새 시트, 제외 설정, 번역기, 사용할 네트워크 엔진)을 합친 키"""
+    canonical = json.dumps(options, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(f'{content_digest}\n{canonical}'.encode('utf-8')).hexdigest()
+
+
+def link_or_copy(source, destination):
+    """가능하면 하드 링크 (복사 없이 즉시), 다른 파일 시스템이면 복사
+    캐시와 작업 파일이 서로 다른 이름이므로 한쪽을 지워도 다른 쪽은 남음"""
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+    return destination
+
+
+class ResultCache:
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+        self._lock = threading.Lock()
+        # isolation_level=None: 색인 갱신과 정리를 BEGIN IMMEDIATE로 직접 묶음 (여러 프로세스 동시 저장)
+        self._conn = sqlite3.connect(os.path.join(self.cache_dir, 'index.db'), check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            ' cache_key TEXT PRIMARY KEY,'
+            ' output_path TEXT NOT NULL,'
+            ' manifest_path TEXT,'
+            ' details TEXT,'
+            ' size INTEGER NOT NULL,'
+            ' created_at REAL NOT NULL,'
+            ' last_used_at REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS results_last_used_at ON results (last_used_at)')
+
+    def get(self, key):
+        """보관된 결과 {'output_path', 'manifest_path', 'details'} 반환 (없거나 파일이 사라졌으면 None)"""
+        with self._lock:
+            row = self._conn.execute('SELECT * FROM results WHERE cache_key = ?', (key,)).fetchone()
+            if row is not None and os.path.exists(row['output_path']):
+                self._conn.execute('UPDATE results SET last_used_at = ? WHERE cache_key = ?', (time.time(), key))
+                self.hits += 1
+                return {
+                    'output_path': row['output_path'],
+                    'manifest_path': row['manifest_path'] if row['manifest_path'] and os.path.exists(row['manifest_path']) else None,
+                    'details': json.loads(row['details']) if row['details'] else {},
+                }
+            if row is not None:
+                self._conn.execute('DELETE FROM results WHERE cache_key = ?', (key,))
+            self.misses += 1
+            return None
+
+    def put(self, key, output_path, manifest_path=None, details=None):
+        """작업 결과 파일을 캐시에 보관 (상한보다 큰 결과는 보관하지 않음), 보관했으면 True"""
+        files = [(output_path, os.path.join(self.cache_dir, f'{key}{os.path.splitext(output_path)[1]}'))]
+        if manifest_path and os.path.exists(manifest_path):
+            files.append((manifest_path, os.path.join(self.cache_dir, f'{key}.manifest.json')))
+        size = sum(os.path.getsize(source) for source, _ in files)
+        if size > self.max_bytes:
+            return False
+
+        # 임시 이름으로 만든 뒤 교체 (같은 키를 동시에 저장해도 읽는 쪽이 반쯤 쓰인 파일을 보지 않음)
+        for source, destination in files:
+            fd, temp_path = tempfile.mkstemp(prefix='.result-', dir=self.cache_dir)
+            os.close(fd)
+            os.remove(temp_path)
+            link_or_copy(source, temp_path)
+            os.replace(temp_path, destination)
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO results (cache_key, output_path, manifest_path, details, size, created_at, last_used_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (key, files[0][1], files[1][1] if len(files) > 1 else None,
+                     json.dumps(details, ensure_ascii=False) if details else None, size, now, now)
+                )
+                evicted = self._evict_locked()
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        self._remove_files(evicted)
+        return True
+
+    def _evict_locked(self):
+        """전체 크기가 상한 이하가 될 때까지 가장 오래 쓰이지 않은 항목 삭제 -> 지울 파일 목록"""
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+        if total <= self.max_bytes:
+            return []
+        evicted = []
+        for row in self._conn.execute('SELECT cache_key, output_path, manifest_path, size FROM results ORDER BY last_used_at').fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute('DELETE FROM results WHERE cache_key = ?', (row['cache_key'],))
+            evicted.extend(path for path in (row['output_path'], row['manifest_path']) if path)
+            total -= row['size']
+            self.evicted += 1
+        return evicted
+
+    def _remove_files(self, paths):
+        for path in paths:
+            if os.path.exists(path):
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    print(f"결과 캐시 파일 삭제 오류 ({path}): {e}")
+
+    def stats(self):
+        with self._lock:
+            row = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results').fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'entries': row[0],
+            'bytes': row[1],
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evicted': self.evicted,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# 프로세스 전역 공유 인스턴스
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_result_cache():
+    """프로세스 전역 결과 캐시 (TRANSLATION_RESULT_CACHE_MB가 0이면 None - 사용 안 함)"""
+    global _shared_cache
+    max_mb = float(os.environ.get('TRANSLATION_RESULT_CACHE_MB', DEFAULT_MAX_MB))
+    if max_mb <= 0:
+        return None
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ResultCache(
+                cache_dir=os.environ.get('TRANSLATION_RESULT_CACHE_DIR') or None,
+                max_bytes=int(max_mb * 1024 * 1024)
+            )
+        return _shared_cache
@@ -183,11 +183,13 @@ class FileTranslator {
         
         // 번역 제외 설정 추가 (Set을 문자열로 변환)
         const excludeSheets = Array.from(this.excludedSheets).join(',');
-        const excludeCells = Array.from(this.excludedCells).join(',');
+        // 클릭한 셀을 사각형 범위로 합쳐서 전송 (예: 시트!A1:C20)
+        const excludeRanges = this.coalesceExcludedCells();
+        const excludeCells = excludeRanges.join(',');
         const excludePatterns = Array.from(this.excludedPatterns).join(',');
         
         if (excludeCells) {
-            console.log(`제외할 셀 ${this.excludedCells.size}개:`, excludeCells);
+            console.log(`제외할 셀 ${this.excludedCells.size}개 (범위 ${excludeRanges.length}개):`, excludeCells);
         }
         
         formData.append('exclude_sheets', excludeSheets);
@@ -197,10 +199,20 @@ class FileTranslator {
         this.updateProgress('Python 번역기로 파일 업로드 중...', 5);
 
         try {
-            const response = await fetch('http://localhost:5001/translate-excel', {
-                method: 'POST',
-                body: formData
-            });
+            const QUEUE_RETRY_LIMIT = 4;
+            let response;
+            // 서버 대기열이 가득 차면(429) Retry-After 만큼 기다렸다가 다시 업로드
+            for (let attempt = 1; ; attempt++) {
+                response = await fetch('http://localhost:5001/translate-excel', {
+                    method: 'POST',
+                    body: formData
+                });
+                if (response.status !== 429 || attempt >= QUEUE_RETRY_LIMIT) break;
+                
+                const retryAfter = parseInt(response.headers.get('Retry-After'), 10) || 5;
+                this.updateProgress(`번역 서버 대기열이 가득 찼습니다. ${retryAfter}초 후 다시 시도합니다... (${attempt}/${QUEUE_RETRY_LIMIT - 1})`, 5);
+                await new Promise(resolve => setTimeout(resolve, retryAfter * 1000));
+            }
 
             if (!response.ok) {
                 const errorData = await response.json();
@@ -227,6 +239,36 @@ class FileTranslator {
     }
 
     async monitorTranslationProgress(jobId) {
+        // 상태 하나를 화면에 반영, 완료되면 true 반환 (오류는 예외)
+        const applyStatus = (status) => {
+            this.updateProgress(status.message || '번역 중...', status.progress || 0);
+            
+            if (status.status === 'completed') {
+                // 번역 완료
+                this.translatedFileUrl = `http://localhost:5001/download/${status.file_id}/${status.download_filename}`;
+                this.translatedFileName = status.download_filename.replace(`translated_${status.file_id}_`, '');
+                this.showDownloadArea();
+                return true;
+            } else if (status.status === 'error') {
+                // 오류 발생
+                throw new Error(status.error || '번역 중 오류 발생');
+            }
+            return false;
+        };
+        
+        const fallbackToJavaScript = async (error) => {
+            console.error('진행률 조회 오류:', error);
+            // 백업으로 JavaScript 번역기 사용
+            this.updateProgress('진행률 조회 실패, JavaScript 번역기 사용...', 50);
+            const direction = document.querySelector('input[name="direction"]:checked').value;
+            const preserveEnglish = document.getElementById('preserveEnglish').checked;
+            const addToNewSheet = document.getElementById('addToNewSheet').checked;
+            
+            await this.translateWorkbook(direction, preserveEnglish, addToNewSheet);
+            this.showDownloadArea();
+        };
+        
+        // SSE를 사용할 수 없을 때만 1초 간격 상태 조회
         const checkStatus = async () => {
             try {
                 const response = await fetch(`http://localhost:5001/translation-status/${jobId}`);
@@ -235,39 +277,42 @@ class FileTranslator {
                 }
                 
                 const status = await response.json();
-                
-                // 진행률 업데이트
-                this.updateProgress(status.message || '번역 중...', status.progress || 0);
-                
-                if (status.status === 'completed') {
-                    // 번역 완료
-                    this.translatedFileUrl = `http://localhost:5001/download/${status.file_id}/${status.download_filename}`;
-                    this.translatedFileName = status.download_filename.replace(`translated_${status.file_id}_`, '');
-                    this.showDownloadArea();
-                    return;
-                } else if (status.status === 'error') {
-                    // 오류 발생
-                    throw new Error(status.error || '번역 중 오류 발생');
-                } else {
+                if (!applyStatus(status)) {
                     // 아직 진행 중이면 1초 후 다시 확인
                     setTimeout(checkStatus, 1000);
                 }
                 
             } catch (error) {
-                console.error('진행률 조회 오류:', error);
-                // 백업으로 JavaScript 번역기 사용
-                this.updateProgress('진행률 조회 실패, JavaScript 번역기 사용...', 50);
-                const direction = document.querySelector('input[name="direction"]:checked').value;
-                const preserveEnglish = document.getElementById('preserveEnglish').checked;
-                const addToNewSheet = document.getElementById('addToNewSheet').checked;
-                
-                await this.translateWorkbook(direction, preserveEnglish, addToNewSheet);
-                this.showDownloadArea();
+                await fallbackToJavaScript(error);
             }
         };
         
-        // 초기 상태 확인
-        checkStatus();
+        if (!window.EventSource) {
+            checkStatus();
+            return;
+        }
+        
+        // 서버가 진행률이 바뀔 때마다 보내는 이벤트 수신
+        const events = new EventSource(`http://localhost:5001/translation-events/${jobId}`);
+        const onStatus = (e) => {
+            try {
+                if (applyStatus(JSON.parse(e.data))) {
+                    events.close();
+                }
+            } catch (error) {
+                events.close();
+                fallbackToJavaScript(error);
+            }
+        };
+        events.addEventListener('progress', onStatus);
+        events.addEventListener('completed', onStatus);
+        events.addEventListener('failed', onStatus);
+        events.onerror = () => {
+            // 완료/오류 전에 스트림 연결이 끊기면 상태 조회 방식으로 계속 확인
+            events.close();
+            console.warn('진행률 스트림 연결 끊김, 상태 조회로 전환');
+            checkStatus();
+        };
     }
 
     async translateWorkbook(direction, preserveEnglish, addToNewSheet) {
@@ -297,28 +342,36 @@ class FileTranslator {
         const translatedSheet = this.deepCopyWorksheet(worksheet);
         const range = XLSX.utils.decode_range(worksheet['!ref'] || 'A1');
         
+        // 번역할 셀 수집 (영문 유지 셀은 제외)
+        const cellAddresses = [];
+        const texts = [];
+        
         for (let R = range.s.r; R <= range.e.r; ++R) {
             for (let C = range.s.c; C <= range.e.c; ++C) {
                 const cellAddress = XLSX.utils.encode_cell({ r: R, c: C });
                 const cell = worksheet[cellAddress];
                 
                 if (cell && cell.v && typeof cell.v === 'string' && cell.v.trim() !== '') {
-                    let translatedValue = cell.v;
-                    
                     if (preserveEnglish && this.isEnglish(cell.v)) {
-                        translatedValue = cell.v;
-                    } else {
-                        translatedValue = await this.translateText(cell.v, direction);
-                    }
-                    
-                    translatedSheet[cellAddress].v = translatedValue;
-                    if (translatedSheet[cellAddress].w) {
-                        translatedSheet[cellAddress].w = translatedValue;
+                        continue;
                     }
+                    cellAddresses.push(cellAddress);
+                    texts.push(cell.v);
                 }
             }
         }
         
+        // 청크 단위로 배치 번역
+        const translations = await this.translateTexts(texts, direction, preserveEnglish);
+        
+        cellAddresses.forEach((cellAddress, index) => {
+            const translatedValue = translations[index];
+            translatedSheet[cellAddress].v = translatedValue;
+            if (translatedSheet[cellAddress].w) {
+                translatedSheet[cellAddress].w = translatedValue;
+            }
+        });
+        
         return translatedSheet;
     }
 
@@ -371,6 +424,46 @@ class FileTranslator {
         return englishPattern.test(text.trim());
     }
 
+    async translateTexts(texts, direction, preserveEnglish = true) {
+        // 중복 제거 후 BATCH_CHUNK_SIZE개씩 /translate-batch로 전송
+        const BATCH_CHUNK_SIZE = 200;
+        const translationDirection = direction === 'ko-to-zh' ? 'ko-zh' : 'zh-ko';
+        const uniqueTexts = Array.from(new Set(texts));
+        const translated = new Map();
+        
+        for (let i = 0; i < uniqueTexts.length; i += BATCH_CHUNK_SIZE) {
+            const chunk = uniqueTexts.slice(i, i + BATCH_CHUNK_SIZE);
+            
+            try {
+                const response = await fetch('http://localhost:5001/translate-batch', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify({
+                        texts: chunk,
+                        direction: translationDirection,
+                        preserve_english: preserveEnglish
+                    })
+                });
+                
+                if (!response.ok) {
+                    throw new Error('배치 번역 실패');
+                }
+                
+                const data = await response.json();
+                data.results.forEach((result, index) => {
+                    translated.set(chunk[index], result.translatedText || chunk[index]);
+                });
+            } catch (serverError) {
+                console.warn('번역 서버 연결 실패, 백업 번역 사용');
+                chunk.forEach(text => translated.set(text, this.fallbackTranslation(text, direction)));
+            }
+        }
+        
+        return texts.map(text => translated.get(text));
+    }
+
     async translateText(text, direction) {
         try {
             const isKorean = /[가-힣]/.test(text);
@@ -397,7 +490,6 @@ class FileTranslator {
                 if (response.ok) {
                     const data = await response.json();
                     if (data.translatedText) {
-                        await new Promise(resolve => setTimeout(resolve, 100));
                         return data.translatedText;
                     }
                 }
@@ -713,6 +805,63 @@ class FileTranslator {
         this.updateExcludedSummary();
     }
     
+    coalesceExcludedCells() {
+        // 시트별로 행마다 연속된 열 구간을 만든 뒤, 같은 열 구간이 이어지는 행끼리 사각형으로 병합
+        const rowsBySheet = {};
+        this.excludedCells.forEach(cellRef => {
+            const index = cellRef.lastIndexOf('!');
+            const sheet = cellRef.slice(0, index);
+            const { r, c } = XLSX.utils.decode_cell(cellRef.slice(index + 1));
+            if (!rowsBySheet[sheet]) rowsBySheet[sheet] = {};
+            if (!rowsBySheet[sheet][r]) rowsBySheet[sheet][r] = [];
+            rowsBySheet[sheet][r].push(c);
+        });
+        
+        const ranges = [];
+        for (const sheet in rowsBySheet) {
+            const rows = rowsBySheet[sheet];
+            const open = {};  // "시작열:끝열" -> 진행 중인 사각형
+            const rowNumbers = Object.keys(rows).map(Number).sort((a, b) => a - b);
+            
+            const flush = (key) => {
+                const rect = open[key];
+                const start = XLSX.utils.encode_cell({ r: rect.r1, c: rect.c1 });
+                const end = XLSX.utils.encode_cell({ r: rect.r2, c: rect.c2 });
+                ranges.push(start === end ? `${sheet}!${start}` : `${sheet}!${start}:${end}`);
+                delete open[key];
+            };
+            
+            for (const r of rowNumbers) {
+                const cols = rows[r].sort((a, b) => a - b);
+                const spans = [];
+                for (const c of cols) {
+                    const last = spans[spans.length - 1];
+                    if (last && c === last[1] + 1) {
+                        last[1] = c;
+                    } else {
+                        spans.push([c, c]);
+                    }
+                }
+                
+                const keys = new Set(spans.map(([c1, c2]) => `${c1}:${c2}`));
+                // 바로 위 행에서 이어지지 않는 사각형은 완성
+                for (const key of Object.keys(open)) {
+                    if (!keys.has(key) || open[key].r2 !== r - 1) flush(key);
+                }
+                for (const [c1, c2] of spans) {
+                    const key = `${c1}:${c2}`;
+                    if (open[key]) {
+                        open[key].r2 = r;
+                    } else {
+                        open[key] = { r1: r, r2: r, c1, c2 };
+                    }
+                }
+            }
+            Object.keys(open).forEach(flush);
+        }
+        return ranges;
+    }
+    
     previewCellRange(startCell, endCell) {
         if (!startCell || !endCell) return;
         
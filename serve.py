@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+번역 서버 운영용 실행 파일 - 여러 작업자 프로세스 + 스레드로 translate-server.py 실행
+Linux/macOS: gunicorn (gthread 작업자), Windows: waitress (단일 프로세스 + 스레드)
+작업 상태/번역 메모리/엔진 차단 상태는 SQLite 파일로 공유되므로 상태 조회가 어느 작업자로 가도 됨
+
+사용법:
+    python serve.py --workers 4 --threads 8 --port 5001
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVER_PATH = os.path.join(BASE_DIR, 'translate-server.py')
+
+DEFAULT_HOST = '0.0.0.0'
+DEFAULT_PORT = 5001
+DEFAULT_WORKERS = 2
+# 작업자 프로세스당 요청 처리 스레드 수 (SSE 진행률 스트림도 연결마다 스레드 하나를 사용)
+DEFAULT_THREADS = 8
+# 작업자 종료 시 실행 중인 요청을 기다리는 시간 (초)
+DEFAULT_GRACEFUL_TIMEOUT = 30
+
+
+def load_app():
+    """translate-server.py의 Flask 앱 로드 (파일명에 '-'가 있어 import 문으로 불러올 수 없음)
+    EXE 빌드처럼 translate_server.py로 복사된 경우에는 일반 import 사용"""
+    module = sys.modules.get('translate_server')
+    if module is None and not os.path.exists(SERVER_PATH):
+        import translate_server as module
+    if module is None:
+        spec = importlib.util.spec_from_file_location('translate_server', SERVER_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules['translate_server'] = module
+        spec.loader.exec_module(module)
+    return module.app
+
+
+def prepare_shared_state():
+    """작업자 프로세스를 띄우기 전에 한 번만 실행 (공유 상태 경로 설정 + 중단된 작업 정리)"""
+    from engine_health import DEFAULT_SHARED_DB_PATH
+    from job_store import recover_unfinished_jobs
+
+    # 여러 작업자가 엔진 차단 상태를 공유할 SQLite 파일 (ENGINE_HEALTH_DB가 없을 때)
+    os.environ.setdefault('ENGINE_HEALTH_DB', DEFAULT_SHARED_DB_PATH)
+    resumed, failed = recover_unfinished_jobs()
+    if resumed:
+        print(f"이전 실행에서 중단된 번역 작업 {resumed}개를 체크포인트부터 이어서 실행 (작업자들이 나눠서 가져감)")
+    if failed:
+        print(f"이전 실행에서 중단된 번역 작업 {failed}개를 오류로 표시")
+    # 작업자마다 앱을 불러올 때 다시 정리하면 다른 작업자의 실행 중인 작업까지 중단된 것으로 보므로 생략
+    os.environ['TRANSLATION_SKIP_JOB_RECOVERY'] = '1'
+
+
+def run_gunicorn(host, port, workers, threads):
+    from gunicorn.app.base import BaseApplication
+
+    class TranslateServerApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f'{host}:{port}')
+            self.cfg.set('workers', workers)
+            self.cfg.set('threads', threads)
+            self.cfg.set('worker_class', 'gthread')
+            self.cfg.set('graceful_timeout', DEFAULT_GRACEFUL_TIMEOUT)
+            # 앱은 작업자마다 따로 불러옴 (SQLite 연결/백그라운드 스레드를 포크 전에 만들지 않음)
+            self.cfg.set('preload_app', False)
+
+        def load(self):
+            return load_app()
+
+    TranslateServerApplication().run()
+
+
+def run_waitress(host, port, threads):
+    from waitress import serve
+
+    serve(load_app(), host=host, port=port, threads=threads)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='번역 서버 운영용 실행')
+    parser.add_argument('--host', default=os.environ.get('TRANSLATION_SERVER_HOST', DEFAULT_HOST))
+    parser.add_argument('--port', type=int, default=int(os.environ.get('TRANSLATION_SERVER_PORT', DEFAULT_PORT)))
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('TRANSLATION_SERVER_WORKERS', DEFAULT_WORKERS)),
+                        help='작업자 프로세스 수 (Windows에서는 사용 안 함)')
+    parser.add_argument('--threads', type=int, default=int(os.environ.get('TRANSLATION_SERVER_THREADS', DEFAULT_THREADS)),
+                        help='작업자 프로세스당 요청 처리 스레드 수')
+    args = parser.parse_args()
+
+    prepare_shared_state()
+
+    # gunicorn은 fork를 사용하므로 Windows에서는 waitress 사용
+    use_gunicorn = os.name != 'nt'
+    if use_gunicorn and importlib.util.find_spec('gunicorn') is None:
+        print("gunicorn이 설치되어 있지 않아 waitress로 실행합니다 (pip install gunicorn).")
+        use_gunicorn = False
+    if not use_gunicorn and importlib.util.find_spec('waitress') is None:
+        print("waitress가 설치되어 있지 않습니다: pip install waitress")
+        sys.exit(1)
+
+    print("번역 서버 시작 중...")
+    print(f"URL: http://localhost:{args.port}")
+    if use_gunicorn:
+        print(f"gunicorn 작업자 {args.workers}개 x 스레드 {args.threads}개")
+        run_gunicorn(args.host, args.port, args.workers, args.threads)
+    else:
+        print(f"waitress 스레드 {args.threads}개 (단일 프로세스)")
+        run_waitress(args.host, args.port, args.threads)
+
+
+if __name__ == '__main__':
+    main()
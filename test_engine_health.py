@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+엔진 서킷 브레이커 확인 - 차단 -> 시험 호출 -> 복구, 여러 프로세스가 공유하는 SQLite 저장소 (python -m pytest test_engine_health.py)
+"""
+
+import time
+
+import pytest
+
+import engine_health
+from engine_health import CLOSED, HALF_OPEN, OPEN, EngineHealthTracker
+
+OPEN_SECONDS = 0.1
+
+
+@pytest.fixture(params=['memory', 'shared'])
+def make_tracker(request, tmp_path):
+    """프로세스 내 상태만 쓰는 추적기 또는 같은 SQLite 파일을 공유하는 추적기"""
+    db_path = str(tmp_path / 'engine_health.db') if request.param == 'shared' else None
+
+    def make(**kwargs):
+        kwargs.setdefault('failure_threshold', 2)
+        kwargs.setdefault('open_seconds', OPEN_SECONDS)
+        return EngineHealthTracker(db_path=db_path, **kwargs)
+    return make
+
+
+def trace_statements(tracker):
+    """공유 저장소에 보낸 SQL 문장 목록 (실행될 때마다 추가)"""
+    statements = []
+    tracker._conn.set_trace_callback(statements.append)
+    return statements
+
+
+def write_transactions(statements):
+    return len([statement for statement in statements if statement.startswith('BEGIN')])
+
+
+def wait_until_open_expires():
+    time.sleep(OPEN_SECONDS * 1.5)
+
+
+def state(tracker, key):
+    return tracker.snapshot()[key]['state']
+
+
+def test_breaker_opens_probes_and_closes(make_tracker):
+    tracker = make_tracker()
+
+    tracker.record_failure('libretranslate')
+    assert tracker.allow('libretranslate')
+    tracker.record_failure('libretranslate')
+    assert state(tracker, 'libretranslate') == OPEN
+    assert not tracker.allow('libretranslate')
+
+    # 대기 시간이 지나면 시험 호출 한 번만 허용
+    wait_until_open_expires()
+    assert tracker.allow('libretranslate')
+    assert state(tracker, 'libretranslate') == HALF_OPEN
+    assert not tracker.allow('libretranslate')
+
+    tracker.record_success('libretranslate')
+    assert state(tracker, 'libretranslate') == CLOSED
+    assert all(tracker.allow('libretranslate') for _ in range(5))
+    assert tracker.snapshot()['libretranslate']['rejected'] == 2
+
+
+def test_failed_probe_reopens_with_longer_wait(make_tracker):
+    tracker = make_tracker(max_open_seconds=OPEN_SECONDS * 3)
+
+    tracker.record_failure('ollama', hard=True)
+    assert state(tracker, 'ollama') == OPEN
+
+    wait_until_open_expires()
+    assert tracker.allow('ollama')
+    tracker.record_failure('ollama')
+    assert state(tracker, 'ollama') == OPEN
+
+    # 차단 시간이 두 배가 되어 처음 대기 시간만 지나서는 아직 차단
+    wait_until_open_expires()
+    assert not tracker.allow('ollama')
+    time.sleep(OPEN_SECONDS)
+    assert tracker.allow('ollama')
+
+
+def test_release_returns_probe_slot(make_tracker):
+    tracker = make_tracker()
+    tracker.record_failure('google', hard=True)
+    wait_until_open_expires()
+
+    assert tracker.allow('google')
+    assert not tracker.allow('google')
+    tracker.release('google')
+    assert tracker.allow('google')
+
+
+def test_adaptive_order_prefers_faster_reliable_engines(make_tracker):
+    tracker = make_tracker(failure_threshold=100)
+    for _ in range(engine_health.MIN_SAMPLES):
+        tracker.record_success('slow', latency=1.0)
+        tracker.record_success('fast', latency=0.1)
+
+    # 관측이 부족한 엔진은 원래 자리 유지
+    assert tracker.order(['slow', 'unknown', 'fast']) == ['fast', 'unknown', 'slow']
+
+
+def test_shared_breaker_state_is_seen_by_other_processes(tmp_path):
+    db_path = str(tmp_path / 'engine_health.db')
+    first = EngineHealthTracker(db_path=db_path, failure_threshold=2, open_seconds=OPEN_SECONDS)
+    second = EngineHealthTracker(db_path=db_path, failure_threshold=2, open_seconds=OPEN_SECONDS)
+
+    # 연속 실패 횟수도 프로세스 사이에 합산
+    first.record_failure('http://engine/translate')
+    second.record_failure('http://engine/translate')
+    assert not first.allow('http://engine/translate')
+    assert not second.allow('http://engine/translate')
+
+    # 시험 호출은 한 프로세스만
+    wait_until_open_expires()
+    assert first.allow('http://engine/translate')
+    assert not second.allow('http://engine/translate')
+
+    first.record_success('http://engine/translate')
+    assert second.allow('http://engine/translate')
+    assert second.snapshot()['http://engine/translate']['state'] == CLOSED
+
+
+def test_closed_breaker_calls_do_not_write_shared_state(tmp_path):
+    tracker = EngineHealthTracker(db_path=str(tmp_path / 'engine_health.db'), failure_threshold=3, open_seconds=OPEN_SECONDS)
+    tracker.record_success('google', latency=0.01)
+    statements = trace_statements(tracker)
+
+    for _ in range(200):
+        assert tracker.allow('google')
+        tracker.record_success('google', latency=0.01)
+    assert write_transactions(statements) == 0
+
+    # 임계값 전의 실패도 차단 상태 필드(연속 실패 수)가 바뀌므로 기록
+    tracker.record_failure('google')
+    assert write_transactions(statements) == 1
+
+    # 차단/시험 호출/복구 전환은 모두 기록
+    del statements[:]
+    tracker.record_failure('google', hard=True)
+    wait_until_open_expires()
+    assert tracker.allow('google')
+    tracker.record_success('google')
+    assert write_transactions(statements) == 3
+
+
+def test_stats_are_flushed_to_shared_state_periodically(tmp_path, monkeypatch):
+    db_path = str(tmp_path / 'engine_health.db')
+    tracker = EngineHealthTracker(db_path=db_path)
+    other = EngineHealthTracker(db_path=db_path)
+
+    tracker.record_success('google', latency=0.01)
+    tracker.record_success('google', latency=0.01)
+    # 반영 간격 전에는 이 프로세스에서만 보임
+    assert tracker.snapshot()['google']['successes'] == 2
+    assert 'google' not in other.snapshot()
+
+    monkeypatch.setattr(engine_health, 'STATS_FLUSH_INTERVAL', 0)
+    tracker.record_success('google', latency=0.01)
+    assert other.snapshot()['google']['successes'] == 3
+    assert tracker.snapshot()['google']['successes'] == 3
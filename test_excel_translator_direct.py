@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+XLSX 직접 수정 번역기가 템플릿 번역기와 같은 셀 값을 만드는지 확인 (python -m pytest test_excel_translator_direct.py)
+"""
+
+import re
+import zipfile
+
+import openpyxl
+import pytest
+
+from excel_translator_direct import ExcelTranslatorDirect
+from excel_translator_template import ExcelTranslatorTemplate
+from translation_memory import TranslationMemory
+
+# openpyxl이 저장한 인라인 문자열 셀 (<c r=.. t="inlineStr"><is><t>텍스트</t></is></c>)
+INLINE_CELL_RE = re.compile(rb'(<c r="[A-Z]+\d+"[^>]*?) t="inlineStr"><is><t[^>]*>(.*?)</t></is></c>', re.S)
+
+
+def stub_translate(text, direction):
+    # 네트워크 없이 결정적인 번역문 반환
+    return ('[zh]' if direction == 'ko-zh' else '[ko]') + text
+
+
+def make_translator(translator_class, tmp_path):
+    translator = translator_class(
+        translation_memory=TranslationMemory(db_path=str(tmp_path / 'memory.db')),
+        race_mode=False, max_workers=2, sheet_processes=0
+    )
+    translator.translate_with_google = stub_translate
+    translator.translate_with_libretranslate = lambda text, source_lang, target_lang: None
+    translator.translate_with_huggingface = lambda text, direction: None
+    translator.translate_with_ollama = lambda text, direction: None
+    return translator
+
+
+def make_workbook(path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = '주문'
+    rows = [
+        ('품목', '수량', '비고'),
+        ('가나다 상자', 3, 'Box A'),
+        ('가나다 상자', 5, '빠른 배송 <요청> & 확인'),
+        ('라마바 봉투', '=B2+B3', '  앞뒤 공백  '),
+        ('제외할 셀', None, '사전에 없는 문장입니다'),
+    ]
+    for row in rows:
+        sheet.append(row)
+    sheet.merge_cells('A7:C7')
+    sheet['A7'] = '병합된 안내 문구'
+
+    other = workbook.create_sheet('배송')
+    other['A1'] = '라마바 봉투'
+    other['B2'] = '배송지 주소'
+    other['C3'] = 12.5
+
+    skipped = workbook.create_sheet('메모')
+    skipped['A1'] = '번역하지 않는 시트'
+    workbook.save(path)
+
+
+def rewrite_parts(path, rewrites, added=None):
+    """xlsx 안의 XML 파트를 rewrites[파트](bytes) 결과로 바꾸고 added 파트를 추가해서 다시 저장"""
+    with zipfile.ZipFile(path) as zin:
+        items = [(info, zin.read(info.filename)) for info in zin.infolist()]
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zout:
+        for info, data in items:
+            rewrite = rewrites.get(info.filename)
+            zout.writestr(info, rewrite(data) if rewrite else data)
+        for name, data in (added or {}).items():
+            zout.writestr(name, data)
+
+
+def use_shared_strings(path):
+    """openpyxl이 저장한 인라인 문자열 셀을 Excel처럼 공유 문자열(sharedStrings.xml) 참조로 바꿈"""
+    shared = []
+
+    def to_shared(data):
+        def replace(match):
+            if match.group(2) not in shared:
+                shared.append(match.group(2))
+            return b'%s t="s"><v>%d</v></c>' % (match.group(1), shared.index(match.group(2)))
+        return INLINE_CELL_RE.sub(replace, data)
+
+    with zipfile.ZipFile(path) as zin:
+        sheets = [name for name in zin.namelist() if name.startswith('xl/worksheets/')]
+    rewrite_parts(path, {name: to_shared for name in sheets})
+
+    items = b''.join(b'<si><t xml:space="preserve">%s</t></si>' % text for text in shared)
+    shared_strings = (b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                      b'<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="%d" uniqueCount="%d">%s</sst>'
+                      % (len(shared), len(shared), items))
+    rewrite_parts(path, {
+        'xl/_rels/workbook.xml.rels': lambda data: data.replace(
+            b'</Relationships>',
+            b'<Relationship Id="rIdShared" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/></Relationships>'),
+        '[Content_Types].xml': lambda data: data.replace(
+            b'</Types>',
+            b'<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/></Types>'),
+    }, added={'xl/sharedStrings.xml': shared_strings})
+    return shared
+
+
+def workbook_values(path):
+    workbook = openpyxl.load_workbook(path)
+    return {
+        sheet.title: {cell.coordinate: cell.value for row in sheet.iter_rows() for cell in row if cell.value is not None}
+        for sheet in workbook.worksheets
+    }
+
+
+def translate_both(tmp_path, input_path, add_new_sheet):
+    options = dict(direction='ko-zh', add_new_sheet=add_new_sheet, exclude_sheets=['메모'],
+                   exclude_cells=['주문!A5'], exclude_patterns=['배송지*'])
+    outputs = {}
+    for translator_class in (ExcelTranslatorTemplate, ExcelTranslatorDirect):
+        output_path = str(tmp_path / f'{translator_class.__name__}_{add_new_sheet}.xlsx')
+        make_translator(translator_class, tmp_path).translate_excel_file(input_path, output_path, **options)
+        outputs[translator_class] = workbook_values(output_path)
+    return outputs[ExcelTranslatorTemplate], outputs[ExcelTranslatorDirect]
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(monkeypatch):
+    monkeypatch.delenv('TRANSLATION_ENGINES', raising=False)
+    monkeypatch.setenv('ENGINE_WARMUP', '0')
+
+
+@pytest.mark.parametrize('add_new_sheet', [True, False])
+def test_direct_matches_template(tmp_path, add_new_sheet):
+    input_path = str(tmp_path / 'input.xlsx')
+    make_workbook(input_path)
+
+    template_values, direct_values = translate_both(tmp_path, input_path, add_new_sheet)
+
+    assert direct_values == template_values
+    # 번역이 실제로 일어났는지 (두 번역기가 똑같이 아무것도 하지 않은 경우 제외)
+    assert any(str(value).startswith('[zh]') for values in direct_values.values() for value in values.values())
+
+
+@pytest.mark.parametrize('add_new_sheet', [True, False])
+def test_direct_matches_template_with_shared_strings(tmp_path, add_new_sheet):
+    input_path = str(tmp_path / 'input.xlsx')
+    make_workbook(input_path)
+    assert use_shared_strings(input_path)
+
+    template_values, direct_values = translate_both(tmp_path, input_path, add_new_sheet)
+
+    assert direct_values == template_values
+    assert direct_values['배송']['A1'] == ('라마바 봉투' if add_new_sheet else '[zh]라마바 봉투')
+
+
+def test_unsupported_workbook_falls_back_to_template(tmp_path):
+    input_path = str(tmp_path / 'input.xlsx')
+    make_workbook(input_path)
+    # 주소(r)가 없는 셀은 직접 수정 방식에서 처리하지 않음 - 템플릿 방식으로 대체
+    rewrite_parts(input_path, {'xl/worksheets/sheet2.xml': lambda data: re.sub(rb'(<c) r="[A-Z]+\d+"', rb'\1', data)})
+
+    template_values, direct_values = translate_both(tmp_path, input_path, add_new_sheet=False)
+
+    assert direct_values == template_values
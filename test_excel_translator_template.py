@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+템플릿 번역기 확인 - 수정본 번역의 이전 번역 재사용, 시트 단위 작업 프로세스 결과 (python -m pytest test_excel_translator_template.py)
+"""
+
+import json
+
+import openpyxl
+import pytest
+
+from excel_translator_template import ExcelTranslatorTemplate
+from translation_memory import TranslationMemory
+
+
+class StubTranslator(ExcelTranslatorTemplate):
+    """Google 자리에만 결정적인 가짜 엔진을 연결한 번역기 (시트 단위 작업 프로세스에서도 같은 클래스로 만들어짐)"""
+    PREFIX = '[zh]'
+
+    def translate_with_google(self, text, direction):
+        return self.PREFIX + text
+
+    def translate_with_libretranslate(self, text, source_lang, target_lang):
+        return None
+
+    def translate_with_huggingface(self, text, direction):
+        return None
+
+    def translate_with_ollama(self, text, direction):
+        return None
+
+
+class RevisedStubTranslator(StubTranslator):
+    """수정본 번역에서 새로 번역한 셀을 구분하기 위한 다른 번역문"""
+    PREFIX = '[v2]'
+
+
+ORDER_ROWS = [
+    ('가나다 상자', 3, '빠른 배송'),
+    ('라마바 봉투', 5, '가나다 상자'),
+    ('사아자 테이프', 7, 'Box A'),
+]
+SHIPPING_ROWS = [
+    ('배송지 안내', '라마바 봉투'),
+    ('차카타 주소', None),
+]
+
+
+def make_workbook(path, order_rows=ORDER_ROWS, shipping_rows=SHIPPING_ROWS):
+    workbook = openpyxl.Workbook()
+    order = workbook.active
+    order.title = '주문'
+    for row in order_rows:
+        order.append(row)
+    shipping = workbook.create_sheet('배송')
+    for row in shipping_rows:
+        shipping.append(row)
+    workbook.create_sheet('빈 시트')
+    workbook.save(path)
+
+
+def workbook_values(path):
+    workbook = openpyxl.load_workbook(path)
+    return {
+        sheet.title: {cell.coordinate: cell.value for row in sheet.iter_rows() for cell in row if cell.value is not None}
+        for sheet in workbook.worksheets
+    }
+
+
+def make_translator(tmp_path, translator_class=StubTranslator, sheet_processes=0, memory_name='memory.db'):
+    return translator_class(
+        translation_memory=TranslationMemory(db_path=str(tmp_path / memory_name)),
+        race_mode=False, max_workers=2, sheet_processes=sheet_processes
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    # 시트 단위 작업 프로세스는 환경 변수로 번역 메모리 경로를 받음
+    monkeypatch.setenv('TRANSLATION_MEMORY_PATH', str(tmp_path / 'worker_memory.db'))
+    monkeypatch.delenv('TRANSLATION_ENGINES', raising=False)
+    monkeypatch.setenv('ENGINE_WARMUP', '0')
+
+
+@pytest.mark.parametrize('sheet_processes', [0, 2])
+@pytest.mark.parametrize('add_new_sheet', [True, False])
+def test_revision_reuses_unchanged_cells_from_manifest(tmp_path, add_new_sheet, sheet_processes):
+    first_input = str(tmp_path / 'v1.xlsx')
+    manifest_path = str(tmp_path / 'manifest.json')
+    make_workbook(first_input)
+    make_translator(tmp_path).translate_excel_file(first_input, str(tmp_path / 'v1_out.xlsx'), add_new_sheet=add_new_sheet,
+                                                   manifest_path=manifest_path)
+
+    # 수정본: 주문!A2 변경, 주문!A4 추가, 배송!A2 삭제, 나머지는 그대로
+    revised_input = str(tmp_path / 'v2.xlsx')
+    make_workbook(revised_input,
+                  order_rows=[ORDER_ROWS[0], ('라마바 큰 봉투', 5, '가나다 상자'), ORDER_ROWS[2], ('파하 상자', 1, None)],
+                  shipping_rows=[SHIPPING_ROWS[0]])
+    translator = make_translator(tmp_path, RevisedStubTranslator, sheet_processes=sheet_processes, memory_name='revised_memory.db')
+    output_path = str(tmp_path / 'v2_out.xlsx')
+    translator.translate_excel_file(revised_input, output_path, add_new_sheet=add_new_sheet,
+                                    previous_manifest=manifest_path, manifest_path=str(tmp_path / 'manifest_v2.json'))
+
+    values = workbook_values(output_path)
+    order = values['주문_中文' if add_new_sheet else '주문']
+    shipping = values['배송_中文' if add_new_sheet else '배송']
+    # 원문이 그대로인 셀은 이전 번역, 바뀌거나 새로 생긴 셀만 새로 번역
+    assert order['A1'] == '[zh]가나다 상자'
+    assert order['C2'] == '[zh]가나다 상자'
+    assert order['A2'] == '[v2]라마바 큰 봉투'
+    assert order['A4'] == '[v2]파하 상자'
+    assert order['C1'] == '[zh]빠른 배송'
+    assert order['C3'] == 'Box A'
+    assert shipping == {'A1': '[zh]배송지 안내', 'B1': '[zh]라마바 봉투'}
+    # 재사용: 주문 A1/C1/C2/A3/C3(영문이라 그대로), 배송 A1/B1
+    assert translator.cell_counts == {'reused': 7, 'translated': 2}
+
+    # 다음 수정본을 위한 매니페스트에는 재사용한 셀도 기록
+    with open(tmp_path / 'manifest_v2.json', encoding='utf-8') as f:
+        sheets = json.load(f)['sheets']
+    assert sheets['주문']['A1'][1] == '[zh]가나다 상자'
+    assert sheets['주문']['A2'][1] == '[v2]라마바 큰 봉투'
+
+
+def test_revision_reuses_translations_from_previous_files(tmp_path):
+    first_input = str(tmp_path / 'v1.xlsx')
+    first_output = str(tmp_path / 'v1_out.xlsx')
+    make_workbook(first_input)
+    make_translator(tmp_path).translate_excel_file(first_input, first_output)
+
+    revised_input = str(tmp_path / 'v2.xlsx')
+    make_workbook(revised_input, order_rows=[('가나다 큰 상자', 3, '빠른 배송')] + ORDER_ROWS[1:])
+    translator = make_translator(tmp_path, RevisedStubTranslator, memory_name='revised_memory.db')
+    output_path = str(tmp_path / 'v2_out.xlsx')
+    translator.translate_excel_file(revised_input, output_path, previous_source=first_input, previous_output=first_output)
+
+    order = workbook_values(output_path)['주문_中文']
+    assert order['A1'] == '[v2]가나다 큰 상자'
+    assert order['C1'] == '[zh]빠른 배송'
+    assert order['A2'] == '[zh]라마바 봉투'
+    # 이전 파일 비교는 값이 바뀐 셀만 재사용 (값이 그대로인 영문 셀 C3은 다시 번역 대상)
+    assert translator.cell_counts['translated'] == 2
+
+
+def test_incompatible_manifest_translates_everything(tmp_path):
+    first_input = str(tmp_path / 'v1.xlsx')
+    manifest_path = str(tmp_path / 'manifest.json')
+    make_workbook(first_input)
+    make_translator(tmp_path).translate_excel_file(first_input, str(tmp_path / 'v1_out.xlsx'), manifest_path=manifest_path)
+
+    # 영문 유지 설정이 다르면 이전 번역을 쓰지 않음
+    translator = make_translator(tmp_path, RevisedStubTranslator, memory_name='revised_memory.db')
+    output_path = str(tmp_path / 'v2_out.xlsx')
+    translator.translate_excel_file(first_input, output_path, preserve_english=False, previous_manifest=manifest_path)
+
+    assert translator.cell_counts['reused'] == 0
+    assert workbook_values(output_path)['주문_中文']['A1'] == '[v2]가나다 상자'
+
+
+@pytest.mark.parametrize('add_new_sheet', [True, False])
+def test_sheet_processes_match_single_process(tmp_path, add_new_sheet):
+    input_path = str(tmp_path / 'input.xlsx')
+    make_workbook(input_path)
+    options = dict(add_new_sheet=add_new_sheet, exclude_cells=['주문!C1'], exclude_patterns=['배송지*'])
+
+    results = {}
+    for sheet_processes in (0, 2):
+        translator = make_translator(tmp_path, sheet_processes=sheet_processes, memory_name=f'memory_{sheet_processes}.db')
+        output_path = str(tmp_path / f'output_{sheet_processes}.xlsx')
+        manifest_path = str(tmp_path / f'manifest_{sheet_processes}.json')
+        translator.translate_excel_file(input_path, output_path, manifest_path=manifest_path, **options)
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        results[sheet_processes] = (workbook_values(output_path), manifest, translator.cell_counts)
+
+    single, multi = results[0], results[2]
+    assert multi[0] == single[0]
+    assert multi[1] == single[1]
+    assert multi[2] == single[2]
+    order = single[0]['주문_中文' if add_new_sheet else '주문']
+    assert order['A1'] == '[zh]가나다 상자' and order['C1'] == '빠른 배송'
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+번역 사전 매칭기 확인 (python -m pytest test_glossary_matcher.py)
+겹치거나 포함된 용어는 가장 왼쪽-가장 긴 용어부터 치환하고, 저장소의 사전에서는 이전 방식(긴 용어부터 str.replace 반복)과 결과가 같아야 함
+"""
+
+import ast
+import os
+
+import openpyxl
+import pytest
+
+from excel_translator_template import ExcelTranslatorTemplate
+from glossary_matcher import GlossaryMatcher, get_glossary_matcher, invalidate_glossary_matchers
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def replace_each_term(glossary, text):
+    """이전 방식: 긴 용어부터 용어마다 str.replace -> (치환 결과, 치환 여부)"""
+    translated = text
+    replaced = False
+    for term in sorted(glossary, key=len, reverse=True):
+        if term in translated:
+            translated = translated.replace(term, glossary[term])
+            replaced = True
+    return translated, replaced
+
+
+def server_glossaries():
+    """translate-server.py의 FALLBACK_TRANSLATIONS (서버 모듈을 불러오지 않고 값만 읽음)"""
+    with open(os.path.join(REPO_DIR, 'translate-server.py'), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(target, 'id', None) == 'FALLBACK_TRANSLATIONS' for target in node.targets):
+            return ast.literal_eval(node.value)
+    raise AssertionError('FALLBACK_TRANSLATIONS를 찾을 수 없습니다.')
+
+
+def shipped_glossaries():
+    translator = ExcelTranslatorTemplate()
+    glossaries = {'template:ko-zh': translator.ko_to_zh_dict, 'template:zh-ko': translator.zh_to_ko_dict}
+    for direction, glossary in server_glossaries().items():
+        glossaries[f'server:{direction}'] = glossary
+    return glossaries
+
+
+def sample_texts():
+    """저장소의 예제 발주서 셀 문자열"""
+    texts = []
+    workbook = openpyxl.load_workbook(os.path.join(REPO_DIR, 'sample-purchase-order.xlsx'))
+    for sheet in workbook.worksheets:
+        for row in sheet.iter_rows():
+            for cell in row:
+                if isinstance(cell.value, str) and cell.value.strip():
+                    texts.append(cell.value.strip())
+    return texts
+
+
+def test_overlapping_terms_use_leftmost_match():
+    matcher = GlossaryMatcher({'가나': 'A', '나다': 'B'})
+
+    assert matcher.replace('가나다') == ('A다', 1)
+    assert matcher.replace('다나다') == ('다B', 1)
+
+
+def test_nested_terms_use_longest_match():
+    matcher = GlossaryMatcher({'발주': 'X', '발주서': 'Y', '주서': 'Z'})
+
+    assert matcher.replace('발주서') == ('Y', 1)
+    assert matcher.replace('발주 발주서 주서') == ('X Y Z', 3)
+
+
+def test_suffix_term_found_through_failure_links():
+    # '가나다라'를 따라가다 실패한 뒤 '나다'를 찾아야 함
+    matcher = GlossaryMatcher({'가나다라': 'L', '나다': 'S'})
+
+    assert matcher.replace('가나다마') == ('가S마', 1)
+    assert matcher.replace('가나다라') == ('L', 1)
+
+
+def test_replacement_is_not_matched_again():
+    matcher = GlossaryMatcher({'가': '나', '나': '다'})
+
+    assert matcher.replace('가나') == ('나다', 2)
+
+
+def test_no_match_and_empty_terms():
+    matcher = GlossaryMatcher({'': 'X', '가': '나'})
+
+    assert matcher.replace('abc') == ('abc', 0)
+    assert matcher.replace('') == ('', 0)
+
+
+def test_cached_matcher_follows_glossary_changes():
+    glossary = {'가': 'A'}
+    assert get_glossary_matcher(glossary) is get_glossary_matcher(dict(glossary))
+
+    glossary['나'] = 'B'
+    assert get_glossary_matcher(glossary).replace('가나') == ('AB', 2)
+
+    # 크기가 같은 제자리 수정은 캐시를 비워야 반영됨
+    glossary['가'] = 'C'
+    invalidate_glossary_matchers()
+    assert get_glossary_matcher(glossary).replace('가나') == ('CB', 2)
+
+
+@pytest.mark.parametrize('name', sorted(shipped_glossaries()))
+def test_shipped_glossary_matches_per_term_replace(name):
+    glossary = shipped_glossaries()[name]
+    terms = list(glossary)
+    # 예제 셀 문자열, 용어 자체, 이웃한 용어를 붙이거나 띄어 쓴 문자열
+    texts = sample_texts() + terms
+    texts += [''.join(terms[i:i + 2]) for i in range(len(terms))]
+    texts += [' '.join(terms[i:i + 3]) for i in range(len(terms))]
+
+    matcher = GlossaryMatcher(glossary)
+    for text in texts:
+        translated, count = matcher.replace(text)
+        assert (translated, count > 0) == replace_each_term(glossary, text), text
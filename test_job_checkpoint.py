@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+중단된 작업을 체크포인트에서 이어서 실행할 때 엔진 실패로 대체 번역한 문자열을 다시 번역하는지 확인 (python -m pytest test_job_checkpoint.py)
+"""
+
+import openpyxl
+import pytest
+
+from excel_translator_template import ExcelTranslatorTemplate
+from job_checkpoint import TranslationCheckpoint
+from translation_memory import TranslationMemory
+
+TEXTS = ['가나다 하나', '가나다 둘', '가나다 셋', '가나다 넷']
+FAILING_TEXT = '가나다 셋'
+
+
+def make_workbook(path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    for row, text in enumerate(TEXTS, 1):
+        sheet.cell(row=row, column=1, value=text)
+    workbook.save(path)
+
+
+def read_values(path):
+    sheet = openpyxl.load_workbook(path).active
+    return [sheet.cell(row=row, column=1).value for row in range(1, len(TEXTS) + 1)]
+
+
+def make_translator(tmp_path, max_workers, checkpoint_path, failing=()):
+    """Google 자리에만 가짜 엔진을 연결한 번역기 (failing에 있는 문자열은 모든 엔진이 실패)"""
+    calls = []
+
+    def translate_with_google(text, direction):
+        calls.append(text)
+        return None if text in failing else '[zh]' + text
+
+    translator = ExcelTranslatorTemplate(
+        translation_memory=TranslationMemory(db_path=str(tmp_path / 'memory.db')),
+        race_mode=False, max_workers=max_workers, sheet_processes=0
+    )
+    translator.translate_with_google = translate_with_google
+    translator.translate_with_libretranslate = lambda text, source_lang, target_lang: None
+    translator.translate_with_huggingface = lambda text, direction: None
+    translator.translate_with_ollama = lambda text, direction: None
+    translator.checkpoint = TranslationCheckpoint(checkpoint_path)
+    return translator, calls
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(monkeypatch):
+    monkeypatch.delenv('TRANSLATION_ENGINES', raising=False)
+    monkeypatch.setenv('ENGINE_WARMUP', '0')
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_resumed_job_retranslates_engine_fallbacks(tmp_path, max_workers):
+    input_path = str(tmp_path / 'input.xlsx')
+    checkpoint_path = str(tmp_path / 'checkpoint.jsonl')
+    make_workbook(input_path)
+
+    # 첫 실행: 한 문자열은 엔진이 모두 실패해 원문으로 대체 - 체크포인트를 지우기 전에 작업이 종료된 상황
+    translator, calls = make_translator(tmp_path, max_workers, checkpoint_path, failing={FAILING_TEXT})
+    translator.translate_excel_file(input_path, str(tmp_path / 'first.xlsx'), direction='ko-zh', add_new_sheet=False)
+    assert translator.progress.snapshot()['fallbacks'] == 1
+    assert FAILING_TEXT in read_values(str(tmp_path / 'first.xlsx'))
+
+    checkpoint = TranslationCheckpoint(checkpoint_path)
+    assert len(checkpoint) == len(TEXTS) - 1
+    assert FAILING_TEXT not in checkpoint.restore(TEXTS)
+
+    # 재시작 후 이어서 실행: 체크포인트의 번역은 그대로 쓰고 대체 번역했던 문자열만 다시 번역
+    translator, calls = make_translator(tmp_path, max_workers, checkpoint_path)
+    translator.translate_excel_file(input_path, str(tmp_path / 'resumed.xlsx'), direction='ko-zh', add_new_sheet=False)
+
+    assert calls == [FAILING_TEXT]
+    assert translator.progress.snapshot()['fallbacks'] == 0
+    assert read_values(str(tmp_path / 'resumed.xlsx')) == ['[zh]' + text for text in TEXTS]
+
+
+def test_resumed_job_counts_fallbacks_that_fail_again(tmp_path):
+    input_path = str(tmp_path / 'input.xlsx')
+    checkpoint_path = str(tmp_path / 'checkpoint.jsonl')
+    make_workbook(input_path)
+
+    translator, _ = make_translator(tmp_path, 1, checkpoint_path, failing={FAILING_TEXT})
+    translator.translate_excel_file(input_path, str(tmp_path / 'first.xlsx'), direction='ko-zh', add_new_sheet=False)
+
+    # 엔진이 계속 실패하면 이어서 실행한 작업도 대체 번역 수에 남음 (결과 캐시 보관 여부 판단에 사용)
+    translator, calls = make_translator(tmp_path, 1, checkpoint_path, failing={FAILING_TEXT})
+    translator.translate_excel_file(input_path, str(tmp_path / 'resumed.xlsx'), direction='ko-zh', add_new_sheet=False)
+
+    assert calls == [FAILING_TEXT]
+    assert translator.progress.snapshot()['fallbacks'] == 1
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+작업 프로파일링이 번역 결과를 바꾸지 않는지 확인 (python -m pytest test_job_profiler.py)
+Python 3.12 이상에서는 cProfile을 프로세스에 하나만 켤 수 있으므로 작업자 스레드가 여러 개여도 모든 셀이 번역되어야 함
+"""
+
+import cProfile
+
+import openpyxl
+import pytest
+
+import job_profiler
+from excel_translator_template import ExcelTranslatorTemplate
+from job_profiler import JobProfiler
+
+CELL_COUNT = 20
+
+
+def fake_translate_text(text, direction, preserve_english=True):
+    # 엔진을 호출하지 않는 번역
+    return '번역:' + str(text)
+
+
+def make_workbook(path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = '주문'
+    for row in range(1, CELL_COUNT + 1):
+        sheet.cell(row=row, column=1, value=f'품목 {row}')
+    workbook.save(path)
+
+
+def run_profiled_job(tmp_path, profiler):
+    input_path = tmp_path / 'input.xlsx'
+    output_path = tmp_path / 'output.xlsx'
+    make_workbook(input_path)
+
+    translator = ExcelTranslatorTemplate(max_workers=4, sheet_processes=0)
+    translator.translate_text = fake_translate_text
+    translator.profiler = profiler
+    translate_excel_file = profiler.wrap(translator.translate_excel_file)
+    profiler.run(translate_excel_file, str(input_path), str(output_path), direction='ko-zh', add_new_sheet=False)
+
+    sheet = openpyxl.load_workbook(output_path).active
+    return [sheet.cell(row=row, column=1).value for row in range(1, CELL_COUNT + 1)]
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    monkeypatch.setenv('TRANSLATION_MEMORY_PATH', str(tmp_path / 'memory.db'))
+    monkeypatch.setenv('ENGINE_WARMUP', '0')
+
+
+def test_profiled_job_with_workers_translates_every_cell(tmp_path):
+    profiler = JobProfiler()
+    values = run_profiled_job(tmp_path, profiler)
+
+    assert values == [f'번역:품목 {row}' for row in range(1, CELL_COUNT + 1)]
+    assert profiler.dump(str(tmp_path / 'job.prof'))
+
+
+def test_profiler_conflict_does_not_change_results(tmp_path, monkeypatch):
+    # 다른 작업의 프로파일러가 이미 켜져 있는 상황 (3.12 이상의 "Another profiling tool is already active")
+    class ConflictingProfile(cProfile.Profile):
+        def enable(self, *args, **kwargs):
+            raise ValueError('Another profiling tool is already active')
+
+    monkeypatch.setattr(job_profiler.cProfile, 'Profile', ConflictingProfile)
+    profiler = JobProfiler()
+    values = run_profiled_job(tmp_path, profiler)
+
+    assert values == [f'번역:품목 {row}' for row in range(1, CELL_COUNT + 1)]
+    assert profiler.unavailable >= 1
+    assert profiler.dump(str(tmp_path / 'job.prof')) is None
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+작업 저장소 확인 - 만료 정리, 기존 DB 열 추가, 재시작 후 중단된 작업 이어서 실행 (python -m pytest test_job_store.py)
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+
+import pytest
+
+from job_store import ADDED_COLUMNS, INTERRUPTED_STATUS, RESUMING_JOB_MESSAGE, JobStore
+
+# ADDED_COLUMNS가 생기기 전의 작업 테이블
+OLD_SCHEMA = (
+    'CREATE TABLE jobs ('
+    ' job_id TEXT PRIMARY KEY,'
+    ' status TEXT NOT NULL,'
+    ' progress REAL NOT NULL DEFAULT 0,'
+    ' message TEXT,'
+    ' error TEXT,'
+    ' input_path TEXT,'
+    ' output_filename TEXT,'
+    ' original_filename TEXT,'
+    ' result_path TEXT,'
+    ' created_at REAL NOT NULL,'
+    ' updated_at REAL NOT NULL,'
+    ' finished_at REAL)'
+)
+
+
+@pytest.fixture(scope='module')
+def dead_pid():
+    """이미 종료된 프로세스의 pid"""
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    return process.pid
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'jobs.db')
+
+
+@pytest.fixture
+def store(db_path):
+    store = JobStore(db_path=db_path, ttl=60, stale_ttl=600)
+    yield store
+    store.close()
+
+
+def make_file(path):
+    path.write_bytes(b'data')
+    return str(path)
+
+
+def test_evict_expired_removes_old_jobs_and_files(store, tmp_path):
+    finished_input = make_file(tmp_path / 'finished_in.xlsx')
+    finished_output = make_file(tmp_path / 'finished_out.xlsx')
+    store.create('finished', input_path=finished_input)
+    store.update('finished', status='completed', result_path=finished_output)
+    store.create('recent')
+    store.update('recent', status='error', error='실패')
+    store.create('running', status='running')
+
+    now = time.time()
+    # 끝난 지 TTL이 지나지 않았으면 보관
+    assert store.evict_expired(now=now + 30) == 0
+
+    # 끝난 작업은 TTL, 끝나지 않은 작업은 갱신이 없는 시간이 stale TTL을 넘으면 정리
+    assert store.evict_expired(now=now + 120) == 2
+    assert store.get('finished') is None and store.get('recent') is None
+    assert store.get('running') is not None
+    assert not (tmp_path / 'finished_in.xlsx').exists()
+    assert not (tmp_path / 'finished_out.xlsx').exists()
+
+    assert store.evict_expired(now=now + 1200) == 1
+    assert store.get('running') is None
+    assert store.stats()['evicted'] == 3
+
+
+def test_reaper_thread_evicts_expired_jobs(db_path):
+    # 정리 스레드는 멈출 수 없으므로 연결을 닫지 않음 (데몬 스레드)
+    store = JobStore(db_path=db_path, ttl=0, stale_ttl=600)
+    store.create('done')
+    store.update('done', status='completed')
+    store.create('queued')
+    store.start_reaper(interval=0.05)
+
+    deadline = time.monotonic() + 5
+    while store.get('done') is not None and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert store.get('done') is None
+    assert store.get('queued') is not None
+
+
+def test_old_database_gets_added_columns(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute(OLD_SCHEMA)
+    conn.execute("INSERT INTO jobs (job_id, status, created_at, updated_at) VALUES ('old', 'completed', 1, 1)")
+    conn.commit()
+    conn.close()
+
+    store = JobStore(db_path=db_path)
+    try:
+        columns = {row[1] for row in store._conn.execute('PRAGMA table_info(jobs)')}
+        assert set(ADDED_COLUMNS) <= columns
+
+        # 기존 작업은 그대로 남고 새 열도 갱신할 수 있음
+        assert store.get('old')['status'] == 'completed'
+        assert store.update('old', details='{}', params='{}', checkpoint_path='checkpoint.jsonl')
+        assert store.get('old')['checkpoint_path'] == 'checkpoint.jsonl'
+    finally:
+        store.close()
+
+    # 다시 열어도 열을 중복으로 추가하지 않음
+    JobStore(db_path=db_path).close()
+
+
+def test_interrupt_unfinished_marks_only_resumable_jobs(store, tmp_path):
+    params = json.dumps({'direction': 'ko-zh'})
+    store.create('running', status='running', params=params, input_path=make_file(tmp_path / 'running.xlsx'))
+    store.create('queued', params=params, input_path=make_file(tmp_path / 'queued.xlsx'))
+    store.create('no_params', status='running', input_path=make_file(tmp_path / 'no_params.xlsx'))
+    store.create('no_input', status='running', params=params, input_path=str(tmp_path / 'missing.xlsx'))
+    store.create('done', params=params)
+    store.update('done', status='completed')
+
+    assert store.interrupt_unfinished('중단됨') == (2, 2)
+
+    for job_id in ('running', 'queued'):
+        job = store.get(job_id)
+        assert job['status'] == INTERRUPTED_STATUS
+        assert job['message'] == RESUMING_JOB_MESSAGE
+    for job_id in ('no_params', 'no_input'):
+        job = store.get(job_id)
+        assert job['status'] == 'error' and job['error'] == '중단됨'
+        assert job['finished_at'] is not None
+    assert store.get('done')['status'] == 'completed'
+
+    # 이미 interrupted인 작업은 다시 세지 않음
+    assert store.interrupt_unfinished('중단됨') == (0, 0)
+
+
+def test_claim_interrupted_hands_each_job_to_one_process(store, db_path, tmp_path):
+    params = json.dumps({'direction': 'ko-zh'})
+    for job_id in ('first', 'second'):
+        store.create(job_id, status='running', params=params, input_path=make_file(tmp_path / f'{job_id}.xlsx'))
+    store.interrupt_unfinished('중단됨')
+
+    # 같은 DB를 쓰는 다른 작업자 프로세스
+    other = JobStore(db_path=db_path)
+    try:
+        claimed = store.claim_interrupted()
+        assert sorted(job['job_id'] for job in claimed) == ['first', 'second']
+        assert all(job['status'] == 'queued' and job['params'] == params for job in claimed)
+        assert all(job['owner_pid'] == os.getpid() for job in claimed)
+        assert other.claim_interrupted() == []
+    finally:
+        other.close()
+    assert store.claim_interrupted() == []
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='Windows에서는 작업자 프로세스 종료를 확인하지 않음')
+def test_interrupt_orphaned_marks_jobs_of_dead_workers(store, tmp_path, dead_pid):
+    params = json.dumps({'direction': 'ko-zh'})
+    store.create('orphaned', status='running', params=params, input_path=make_file(tmp_path / 'orphaned.xlsx'), owner_pid=dead_pid)
+    store.create('orphaned_queued', params=params, input_path=make_file(tmp_path / 'queued.xlsx'), owner_pid=dead_pid)
+    store.create('orphaned_no_input', status='running', params=params, owner_pid=dead_pid)
+    store.create('mine', status='running', params=params, input_path=make_file(tmp_path / 'mine.xlsx'), owner_pid=os.getpid())
+    store.create('other_worker', status='running', params=params, input_path=make_file(tmp_path / 'other.xlsx'), owner_pid=os.getppid())
+    store.create('unknown_owner', status='running', params=params, input_path=make_file(tmp_path / 'unknown.xlsx'))
+    store.create('finished', owner_pid=dead_pid)
+    store.update('finished', status='completed')
+
+    assert store.interrupt_orphaned('중단됨') == (2, 1)
+
+    assert store.get('orphaned')['status'] == INTERRUPTED_STATUS
+    assert store.get('orphaned_queued')['status'] == INTERRUPTED_STATUS
+    assert store.get('orphaned_no_input')['status'] == 'error'
+    for job_id in ('mine', 'other_worker', 'unknown_owner'):
+        assert store.get(job_id)['status'] == 'running'
+    assert store.get('finished')['status'] == 'completed'
+
+    # 살아 있는 작업자가 가져가면 다시 표시하지 않음
+    assert sorted(job['job_id'] for job in store.claim_interrupted()) == ['orphaned', 'orphaned_queued']
+    assert store.interrupt_orphaned('중단됨') == (0, 0)
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='Windows에서는 작업자 프로세스 종료를 확인하지 않음')
+def test_interrupt_orphaned_without_resume_fails_jobs(store, tmp_path, dead_pid):
+    store.create('orphaned', status='running', params='{}', input_path=make_file(tmp_path / 'orphaned.xlsx'), owner_pid=dead_pid)
+
+    assert store.interrupt_orphaned('중단됨', resume=False) == (0, 1)
+    assert store.get('orphaned')['error'] == '중단됨'
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='Windows에서는 작업자 프로세스 종료를 확인하지 않음')
+def test_reaper_hands_orphaned_jobs_to_live_worker(db_path, tmp_path, dead_pid, monkeypatch):
+    monkeypatch.setenv('TRANSLATION_RESUME_JOBS', '1')
+    store = JobStore(db_path=db_path)
+    claimed = []
+    store.on_orphaned = lambda: claimed.extend(job['job_id'] for job in store.claim_interrupted())
+    store.create('orphaned', status='running', params='{}', input_path=make_file(tmp_path / 'orphaned.xlsx'), owner_pid=dead_pid)
+    store.start_reaper(interval=0.05)
+
+    deadline = time.monotonic() + 5
+    while not claimed and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert claimed == ['orphaned']
+    job = store.get('orphaned')
+    assert job['status'] == 'queued' and job['owner_pid'] == os.getpid()
@@ -6,28 +6,49 @@ CORS 문제를 해결하고 안정적인 번역을 위해 사용
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import requests
 import json
+import os
 import time
-import threading
 import uuid
+from translation_memory import get_translation_memory
+from engine_race import run_engines, get_engine_stats, load_enabled_engines
+from glossary_matcher import get_glossary_matcher
+from engine_health import get_engine_health, guarded_post
+from engine_registry import get_engine_registry, start_warm_up
+from job_scheduler import get_job_scheduler, QueueFullError
+from job_store import get_job_store, is_resume_enabled, INTERRUPTED_JOB_MESSAGE
+from job_checkpoint import TranslationCheckpoint
+from progress_reporter import ProgressReporter, STRUCTURED_FIELDS, debug_logger
+from engine_endpoints import libretranslate_urls, ollama_url, ollama_model
+from metrics import get_metrics, DEFAULT_STAGE_BUCKETS
+from result_cache import get_result_cache, make_cache_key, stream_sha256, link_or_copy
+from job_profiler import JobProfiler, is_profiling_enabled, format_profile, format_thread_stacks, DEFAULT_PROFILE_LIMIT
 
 app = Flask(__name__)
 CORS(app)
 
-# 번역 작업 상태 저장
-translation_jobs = {}
+# 번역 작업 상태 저장 (SQLite, 만료된 작업 기록/파일은 자동 정리)
+job_store = get_job_store()
+# 이전 실행에서 끝나지 않은 작업은 체크포인트부터 이어서 실행 (실행 정보/입력 파일이 없거나 TRANSLATION_RESUME_JOBS=0이면 오류로 표시)
+# 시트 단위 작업 프로세스(spawn)가 이 파일을 __mp_main__으로 다시 불러올 때와
+# 직접 실행(debug) 시 코드 변경 감시만 하는 reloader 부모 프로세스에서는 건너뜀 (작업은 실제로 요청을 처리하는 프로세스에서 실행)
+RECOVER_JOBS = __name__ != '__mp_main__' and not (__name__ == '__main__' and not os.environ.get('WERKZEUG_RUN_MAIN'))
+# (serve.py로 여러 작업자 프로세스를 띄울 때는 작업자를 띄우기 전에 한 번만 표시 - 다른 작업자의 실행 중인 작업을 건드리지 않도록)
+if RECOVER_JOBS and not os.environ.get('TRANSLATION_SKIP_JOB_RECOVERY'):
+    if is_resume_enabled():
+        job_store.interrupt_unfinished(INTERRUPTED_JOB_MESSAGE)
+    else:
+        job_store.fail_unfinished(INTERRUPTED_JOB_MESSAGE)
 
-# LibreTranslate 공개 인스턴스들
-LIBRETRANSLATE_URLS = [
-    "https://libretranslate.de/translate",
-    "https://translate.argosopentech.com/translate",
-    "https://libretranslate.com/translate"
-]
+# SSE 진행률 스트림: 진행률 이벤트 최소 간격, 변경 알림이 없을 때 재조회 간격, 연결 유지 주석 간격 (초)
+SSE_MIN_INTERVAL = 0.25
+SSE_POLL_INTERVAL = 1.0
+SSE_KEEPALIVE_SECONDS = 15
 
 def translate_with_libretranslate(text, source_lang, target_lang):
     """LibreTranslate API를 사용한 번역"""
-    for url in LIBRETRANSLATE_URLS:
+    # LibreTranslate 공개 인스턴스들 (LIBRETRANSLATE_URLS 환경 변수로 변경 가능)
+    for url in libretranslate_urls():
         try:
             data = {
                 "q": text,
@@ -36,8 +57,9 @@ def translate_with_libretranslate(text, source_lang, target_lang):
                 "format": "text"
             }
             
-            response = requests.post(url, json=data, timeout=8)
-            if response.status_code == 200:
+            # 차단된 미러는 건너뜀 (연결 실패/타임아웃 시 일정 시간 차단)
+            response = guarded_post(url, json=data, timeout=8)
+            if response is not None and response.status_code == 200:
                 result = response.json()
                 if 'translatedText' in result and result['translatedText'].strip():
                     return result['translatedText']
@@ -48,8 +70,7 @@ def translate_with_libretranslate(text, source_lang, target_lang):
 def translate_with_google(text, direction):
     """Google Translate 무료 API로 번역"""
     try:
-        from googletrans import Translator
-        translator = Translator()
+        translator = get_engine_registry().googletrans_translator()
         
         if direction == 'ko-zh':
             source, target = 'ko', 'zh-CN'
@@ -66,8 +87,6 @@ def translate_with_google(text, direction):
 def translate_with_deep_translator(text, direction):
     """Deep Translator로 번역 (Google, Bing, DeepL 등 지원)"""
     try:
-        from deep_translator import GoogleTranslator, BingTranslator
-        
         if direction == 'ko-zh':
             source, target = 'ko', 'zh-CN'
         else:
@@ -75,7 +94,7 @@ def translate_with_deep_translator(text, direction):
         
         # Google Translator 시도
         try:
-            translator = GoogleTranslator(source=source, target=target)
+            translator = get_engine_registry().deep_translator('google', source, target)
             result = translator.translate(text)
             if result and result.strip() != text:
                 return result.strip()
@@ -84,7 +103,7 @@ def translate_with_deep_translator(text, direction):
         
         # Bing Translator 시도
         try:
-            translator = BingTranslator(source=source, target=target)
+            translator = get_engine_registry().deep_translator('bing', source, target)
             result = translator.translate(text)
             if result and result.strip() != text:
                 return result.strip()
@@ -103,17 +122,17 @@ def translate_with_ollama(text, direction):
         else:
             prompt = f"다음 중국어 텍스트를 한국어로 정확하게 번역해주세요. 영어는 그대로 유지하세요. 번역 결과만 답해주세요:\n\n{text}"
         
-        response = requests.post(
-            "http://localhost:11434/api/generate",
+        response = guarded_post(
+            ollama_url(),
             json={
-                "model": "llama3.2:3b",  # 가벼운 모델
+                "model": ollama_model(),  # 기본: 가벼운 모델 (llama3.2:3b)
                 "prompt": prompt,
                 "stream": False
             },
             timeout=15
         )
         
-        if response.status_code == 200:
+        if response is not None and response.status_code == 200:
             result = response.json()
             translation = result.get('response', '').strip()
             if translation and translation != text:
@@ -134,243 +153,242 @@ def is_english(text):
     import re
     return bool(re.match(r'^[a-zA-Z0-9\s\.\,\-\(\)\[\]\{\}@:\/]+$', str(text).strip()))
 
+# 백업 번역 사전 (방향별)
+FALLBACK_TRANSLATIONS = {
+    'ko-zh': {
+        '발주서': '订单书',
+        '수주처': '接单处',
+        '상호': '商号',
+        '대표': '代表',
+        '발주일': '订单日期',
+        '이메일': '邮箱',
+        '연락처': '联系方式',
+        '주소': '地址',
+        '납기일자': '交货日期',
+        '발송정보': '配送信息',
+        '발송일': '发货日',
+        '품목': '品目',
+        '단위': '单位',
+        '수량': '数量',
+        '구분': '区分',
+        '비고': '备注',
+        '합계': '合计',
+        '요구사항': '要求事项',
+        '확인': '确认',
+        '아래와 같이 발주합니다': '订单如下',
+        '주식회사': '股份有限公司',
+        '테클라스트코리아': '泰克拉斯特韩国',
+        '이상모': '李相模',
+        '등록번호': '注册号码',
+        '경기도': '京畿道',
+        '광명시': '光明市',
+        '하안로': '下安路',
+        '광명테크노파크': '光明科技园',
+        '서비스': '服务',
+        '도소매': '批发零售',
+        '종목': '种目',
+        '태블릿PC': '平板电脑',
+        '유재건부장': '刘在建部长',
+        '심대용과장': '沈大龙科长',
+        '반입분': '入库分',
+        '남품장소': '南品场所',
+        '남품일정': '南品日程',
+        # 추가 번역 용어들
+        '프로젝트': '项目',
+        '업무': '业务',
+        '관리자': '管理员',
+        '완료': '完成',
+        '고객': '客户',
+        '회사': '公司',
+        '부서': '部门',
+        '담당자': '负责人',
+        '직원': '职员',
+        '팀장': '组长',
+        '과장': '科长',
+        '부장': '部长',
+        '사장': '社长',
+        '작업': '工作',
+        '계획': '计划',
+        '일정': '日程',
+        '진행': '进行',
+        '시작': '开始',
+        '종료': '结束',
+        '검토': '审查',
+        '승인': '批准',
+        '변경': '变更',
+        '수정': '修改',
+        '업데이트': '更新',
+        '품질': '质量',
+        '성능': '性能',
+        '정보': '信息',
+        '데이터': '数据',
+        '문서': '文件',
+        '보고서': '报告书',
+        '제안서': '提案书',
+        '계획서': '计划书',
+        '내용': '内容',
+        '항목': '项',
+        '목록': '列表',
+        '설정': '设置',
+        '상태': '状态',
+        '결과': '结果',
+        '목적': '目的',
+        '목표': '目标',
+        '방법': '方法',
+        '절차': '程序',
+        '과정': '过程',
+        '단계': '阶段',
+        '관리': '管理',
+        '점검': '检查',
+        '테스트': '测试',
+        '확인': '确认',
+        '평가': '评价',
+        '분석': '分析',
+        '개발': '开发',
+        '설계': '设计',
+        '생산': '生产',
+        '제조': '制造',
+        '설치': '安装',
+        '배송': '配送',
+        '시스템': '系统',
+        '장비': '设备',
+        '제품': '产品',
+        '모델': '型号',
+        '종류': '种类',
+        '크기': '尺寸',
+        '시간': '时间',
+        '기간': '期间',
+        '가격': '价格',
+        '비용': '费用',
+        '금액': '金额',
+        '총계': '总计',
+        '기본': '基本',
+        '표준': '标准',
+        '특별': '特别',
+        '현재': '现在',
+        '새로운': '新的',
+        '최신': '最新'
+    },
+    'zh-ko': {
+        '订单书': '발주서',
+        '接单处': '수주처',
+        '商号': '상호',
+        '代表': '대표',
+        '订单日期': '발주일',
+        '邮箱': '이메일',
+        '联系方式': '연락처',
+        '地址': '주소',
+        '交货日期': '납기일자',
+        '配送信息': '발송정보',
+        '发货日': '발송일',
+        '品目': '품목',
+        '单位': '단위',
+        '数量': '수량',
+        '区分': '구분',
+        '备注': '비고',
+        '合计': '합계',
+        '要求事项': '요구사항',
+        '确认': '확인',
+        '订单如下': '아래와 같이 발주합니다',
+        '股份有限公司': '주식회사',
+        '泰克拉斯特韩国': '테클라스트코리아',
+        '李相模': '이상모',
+        '注册号码': '등록번호',
+        '京畿道': '경기도',
+        '光明市': '광명시',
+        '下安路': '하안로',
+        '光明科技园': '광명테크노파크',
+        '服务': '서비스',
+        '批发零售': '도소매',
+        '种目': '종목',
+        '平板电脑': '태블릿PC',
+        '刘在建部长': '유재건부장',
+        '沈大龙科长': '심대용과장',
+        '入库分': '반입분',
+        '南品场所': '남품장소',
+        '南品日程': '남품일정',
+        # 추가 번역 용어들 (중국어 -> 한국어)
+        '项目': '프로젝트',
+        '业务': '업무',
+        '管理员': '관리자',
+        '完成': '완료',
+        '客户': '고객',
+        '公司': '회사',
+        '部门': '부서',
+        '负责人': '담당자',
+        '职员': '직원',
+        '组长': '팀장',
+        '科长': '과장',
+        '部长': '부장',
+        '社长': '사장',
+        '工作': '작업',
+        '计划': '계획',
+        '日程': '일정',
+        '进行': '진행',
+        '开始': '시작',
+        '结束': '종료',
+        '审查': '검토',
+        '批准': '승인',
+        '变更': '변경',
+        '修改': '수정',
+        '更新': '업데이트',
+        '质量': '품질',
+        '性能': '성능',
+        '信息': '정보',
+        '数据': '데이터',
+        '文件': '문서',
+        '报告书': '보고서',
+        '提案书': '제안서',
+        '计划书': '계획서',
+        '内容': '내용',
+        '项': '항목',
+        '列表': '목록',
+        '设置': '설정',
+        '状态': '상태',
+        '结果': '결과',
+        '目的': '목적',
+        '目标': '목표',
+        '方法': '방법',
+        '程序': '절차',
+        '过程': '과정',
+        '阶段': '단계',
+        '管理': '관리',
+        '检查': '점검',
+        '测试': '테스트',
+        '确认': '확인',
+        '评价': '평가',
+        '分析': '분석',
+        '开发': '개발',
+        '设计': '설계',
+        '生产': '생산',
+        '制造': '제조',
+        '安装': '설치',
+        '配送': '배송',
+        '系统': '시스템',
+        '设备': '장비',
+        '产品': '제품',
+        '型号': '모델',
+        '种类': '종류',
+        '尺寸': '크기',
+        '时间': '시간',
+        '期间': '기간',
+        '价格': '가격',
+        '费用': '비용',
+        '金额': '금액',
+        '总计': '총계',
+        '基本': '기본',
+        '标准': '표준',
+        '特别': '특별',
+        '现在': '현재',
+        '新的': '새로운',
+        '最新': '최신'
+    }
+}
+
 def fallback_translation(text, direction):
-    """백업 번역 사전"""
-    if direction == 'ko-zh':
-        translations = {
-            '발주서': '订单书',
-            '수주처': '接单处',
-            '상호': '商号',
-            '대표': '代表',
-            '발주일': '订单日期',
-            '이메일': '邮箱',
-            '연락처': '联系方式',
-            '주소': '地址',
-            '납기일자': '交货日期',
-            '발송정보': '配送信息',
-            '발송일': '发货日',
-            '품목': '品目',
-            '단위': '单位',
-            '수량': '数量',
-            '구분': '区分',
-            '비고': '备注',
-            '합계': '合计',
-            '요구사항': '要求事项',
-            '확인': '确认',
-            '아래와 같이 발주합니다': '订单如下',
-            '주식회사': '股份有限公司',
-            '테클라스트코리아': '泰克拉斯特韩国',
-            '이상모': '李相模',
-            '등록번호': '注册号码',
-            '경기도': '京畿道',
-            '광명시': '光明市',
-            '하안로': '下安路',
-            '광명테크노파크': '光明科技园',
-            '서비스': '服务',
-            '도소매': '批发零售',
-            '종목': '种目',
-            '태블릿PC': '平板电脑',
-            '유재건부장': '刘在建部长',
-            '심대용과장': '沈大龙科长',
-            '반입분': '入库分',
-            '남품장소': '南品场所',
-            '남품일정': '南品日程',
-            # 추가 번역 용어들
-            '프로젝트': '项目',
-            '업무': '业务',
-            '관리자': '管理员',
-            '완료': '完成',
-            '고객': '客户',
-            '회사': '公司',
-            '부서': '部门',
-            '담당자': '负责人',
-            '직원': '职员',
-            '팀장': '组长',
-            '과장': '科长',
-            '부장': '部长',
-            '사장': '社长',
-            '작업': '工作',
-            '계획': '计划',
-            '일정': '日程',
-            '진행': '进行',
-            '시작': '开始',
-            '종료': '结束',
-            '검토': '审查',
-            '승인': '批准',
-            '변경': '变更',
-            '수정': '修改',
-            '업데이트': '更新',
-            '품질': '质量',
-            '성능': '性能',
-            '정보': '信息',
-            '데이터': '数据',
-            '문서': '文件',
-            '보고서': '报告书',
-            '제안서': '提案书',
-            '계획서': '计划书',
-            '내용': '内容',
-            '항목': '项',
-            '목록': '列表',
-            '설정': '设置',
-            '상태': '状态',
-            '결과': '结果',
-            '목적': '目的',
-            '목표': '目标',
-            '방법': '方法',
-            '절차': '程序',
-            '과정': '过程',
-            '단계': '阶段',
-            '관리': '管理',
-            '점검': '检查',
-            '테스트': '测试',
-            '확인': '确认',
-            '평가': '评价',
-            '분석': '分析',
-            '개발': '开发',
-            '설계': '设计',
-            '생산': '生产',
-            '제조': '制造',
-            '설치': '安装',
-            '배송': '配送',
-            '시스템': '系统',
-            '장비': '设备',
-            '제품': '产品',
-            '모델': '型号',
-            '종류': '种类',
-            '크기': '尺寸',
-            '시간': '时间',
-            '기간': '期间',
-            '가격': '价格',
-            '비용': '费用',
-            '금액': '金额',
-            '총계': '总计',
-            '기본': '基本',
-            '표준': '标准',
-            '특별': '特别',
-            '현재': '现在',
-            '새로운': '新的',
-            '최신': '最新'
-        }
-    else:  # zh-ko
-        translations = {
-            '订单书': '발주서',
-            '接单处': '수주처',
-            '商号': '상호',
-            '代表': '대표',
-            '订单日期': '발주일',
-            '邮箱': '이메일',
-            '联系方式': '연락처',
-            '地址': '주소',
-            '交货日期': '납기일자',
-            '配送信息': '발송정보',
-            '发货日': '발송일',
-            '品目': '품목',
-            '单位': '단위',
-            '数量': '수량',
-            '区分': '구분',
-            '备注': '비고',
-            '合计': '합계',
-            '要求事项': '요구사항',
-            '确认': '확인',
-            '订单如下': '아래와 같이 발주합니다',
-            '股份有限公司': '주식회사',
-            '泰克拉斯特韩国': '테클라스트코리아',
-            '李相模': '이상모',
-            '注册号码': '등록번호',
-            '京畿道': '경기도',
-            '光明市': '광명시',
-            '下安路': '하안로',
-            '光明科技园': '광명테크노파크',
-            '服务': '서비스',
-            '批发零售': '도소매',
-            '种目': '종목',
-            '平板电脑': '태블릿PC',
-            '刘在建部长': '유재건부장',
-            '沈大龙科长': '심대용과장',
-            '入库分': '반입분',
-            '南品场所': '남품장소',
-            '南品日程': '남품일정',
-            # 추가 번역 용어들 (중국어 -> 한국어)
-            '项目': '프로젝트',
-            '业务': '업무',
-            '管理员': '관리자',
-            '完成': '완료',
-            '客户': '고객',
-            '公司': '회사',
-            '部门': '부서',
-            '负责人': '담당자',
-            '职员': '직원',
-            '组长': '팀장',
-            '科长': '과장',
-            '部长': '부장',
-            '社长': '사장',
-            '工作': '작업',
-            '计划': '계획',
-            '日程': '일정',
-            '进行': '진행',
-            '开始': '시작',
-            '结束': '종료',
-            '审查': '검토',
-            '批准': '승인',
-            '变更': '변경',
-            '修改': '수정',
-            '更新': '업데이트',
-            '质量': '품질',
-            '性能': '성능',
-            '信息': '정보',
-            '数据': '데이터',
-            '文件': '문서',
-            '报告书': '보고서',
-            '提案书': '제안서',
-            '计划书': '계획서',
-            '内容': '내용',
-            '项': '항목',
-            '列表': '목록',
-            '设置': '설정',
-            '状态': '상태',
-            '结果': '결과',
-            '目的': '목적',
-            '目标': '목표',
-            '方法': '방법',
-            '程序': '절차',
-            '过程': '과정',
-            '阶段': '단계',
-            '管理': '관리',
-            '检查': '점검',
-            '测试': '테스트',
-            '确认': '확인',
-            '评价': '평가',
-            '分析': '분석',
-            '开发': '개발',
-            '设计': '설계',
-            '生产': '생산',
-            '制造': '제조',
-            '安装': '설치',
-            '配送': '배송',
-            '系统': '시스템',
-            '设备': '장비',
-            '产品': '제품',
-            '型号': '모델',
-            '种类': '종류',
-            '尺寸': '크기',
-            '时间': '시간',
-            '期间': '기간',
-            '价格': '가격',
-            '费用': '비용',
-            '金额': '금액',
-            '总计': '총계',
-            '基本': '기본',
-            '标准': '표준',
-            '特别': '특별',
-            '现在': '현재',
-            '新的': '새로운',
-            '最新': '최신'
-        }
-    
-    translated = text
-    for original, translation in translations.items():
-        translated = translated.replace(original, translation)
-    
+    """백업 번역 사전 (컴파일된 사전 매칭기로 한 번에 치환)"""
+    matcher = get_glossary_matcher(FALLBACK_TRANSLATIONS['ko-zh' if direction == 'ko-zh' else 'zh-ko'])
+    translated, _ = matcher.replace(text)
     return translated
 
 def hybrid_translate_text(text, direction, preserve_english=True):
@@ -407,32 +425,47 @@ def hybrid_translate_text(text, direction, preserve_english=True):
     if has_dict_translation and not still_has_original_lang:
         return dict_translated
     
-    # 2단계: Google Translate 시도 (전체 문장 번역)
-    google_translation = translate_with_google(text_str, direction)
-    if google_translation:
-        return google_translation
+    # 2단계: 번역 메모리 확인 (네트워크 엔진 호출 전)
+    memory = get_translation_memory()
+    cached_translation = memory.get(direction, text_str)
+    if cached_translation:
+        return cached_translation
     
-    # 3단계: Deep Translator (Google/Bing) 시도
-    deep_translation = translate_with_deep_translator(text_str, direction)
-    if deep_translation:
-        return deep_translation
-    
-    # 4단계: LibreTranslate API 시도
+    # 3단계: 네트워크 엔진 (Google -> Deep Translator -> LibreTranslate -> Ollama)
+    # 기본은 순차 폴백, TRANSLATION_RACE_MODE=1이면 헤지 경쟁 모드
     source_lang = 'ko' if direction == 'ko-zh' else 'zh'
     target_lang = 'zh' if direction == 'ko-zh' else 'ko'
     
-    libre_translation = translate_with_libretranslate(text_str, source_lang, target_lang)
-    if libre_translation:
-        return libre_translation
-    
-    # 5단계: Ollama 로컬 LLM 시도
-    ollama_translation = translate_with_ollama(text_str, direction)
-    if ollama_translation:
-        return ollama_translation
+    engines = [
+        ('google', lambda: translate_with_google(text_str, direction)),
+        ('deep_translator', lambda: translate_with_deep_translator(text_str, direction)),
+        ('libretranslate', lambda: translate_with_libretranslate(text_str, source_lang, target_lang)),
+        ('ollama', lambda: translate_with_ollama(text_str, direction))
+    ]
+    engine, engine_translation = run_engines(engines)
+    if engine_translation:
+        memory.put(direction, text_str, engine_translation, engine)
+        return engine_translation
     
-    # 6단계: 모든 방법 실패시 사전 번역 결과라도 반환
+    # 4단계: 모든 방법 실패시 사전 번역 결과라도 반환 (캐시하지 않음 - 다음에 재시도)
     return dict_translated
 
+def detect_translation_method(text, translated, direction):
+    """번역 결과가 어떤 방법으로 만들어졌는지 판별"""
+    dict_only = fallback_translation(text, direction)
+    if translated == text:
+        return 'unchanged'
+    elif translated == dict_only:
+        # 사전만으로 번역된 경우라도, 원본 언어가 남아있으면 API 필요
+        if direction == 'ko-zh' and is_korean(translated):
+            return 'partial_dictionary'
+        elif direction == 'zh-ko' and is_chinese(translated):
+            return 'partial_dictionary'
+        else:
+            return 'dictionary'
+    else:
+        return 'api_or_llm'
+
 @app.route('/translate', methods=['POST'])
 def translate():
     try:
@@ -448,19 +481,7 @@ def translate():
         translated = hybrid_translate_text(text, direction, preserve_english)
         
         # 어떤 방법이 사용되었는지 확인
-        dict_only = fallback_translation(text, direction)
-        if translated == text:
-            method = 'unchanged'
-        elif translated == dict_only:
-            # 사전만으로 번역된 경우라도, 원본 언어가 남아있으면 API 필요
-            if direction == 'ko-zh' and is_korean(translated):
-                method = 'partial_dictionary'
-            elif direction == 'zh-ko' and is_chinese(translated):
-                method = 'partial_dictionary'
-            else:
-                method = 'dictionary'
-        else:
-            method = 'api_or_llm'
+        method = detect_translation_method(text, translated, direction)
         
         return jsonify({
             'translatedText': translated, 
@@ -472,22 +493,107 @@ def translate():
         print(f"번역 오류: {e}")
         return jsonify({'error': str(e)}), 500
 
-def run_translation(job_id, input_path, output_path, direction, preserve_english, add_new_sheet, exclude_sheets=None, exclude_cells=None, exclude_patterns=None):
-    """백그라운드에서 번역 실행"""
+# 한 번의 배치 요청으로 받을 수 있는 최대 텍스트 수
+MAX_BATCH_SIZE = 1000
+
+@app.route('/translate-batch', methods=['POST'])
+def translate_batch():
+    """여러 텍스트를 한 번에 번역 (중복 제거 후 입력 순서대로 반환)"""
+    try:
+        data = request.json or {}
+        texts = data.get('texts', [])
+        direction = data.get('direction', 'ko-zh')
+        preserve_english = data.get('preserve_english', True)
+        
+        if not isinstance(texts, list):
+            return jsonify({'error': 'texts는 배열이어야 합니다.'}), 400
+        if len(texts) > MAX_BATCH_SIZE:
+            return jsonify({'error': f'한 번에 최대 {MAX_BATCH_SIZE}개까지 번역할 수 있습니다.'}), 400
+        
+        # 고유 텍스트만 번역
+        unique_results = {}
+        for text in texts:
+            if not isinstance(text, str) or text in unique_results:
+                continue
+            if not text.strip():
+                unique_results[text] = (text, 'unchanged')
+                continue
+            translated = hybrid_translate_text(text, direction, preserve_english)
+            unique_results[text] = (translated, detect_translation_method(text, translated, direction))
+        
+        # 입력 순서대로 결과 구성
+        results = []
+        for text in texts:
+            if not isinstance(text, str):
+                results.append({'translatedText': text, 'method': 'unchanged', 'original': text})
+                continue
+            translated, method = unique_results[text]
+            results.append({'translatedText': translated, 'method': method, 'original': text})
+        
+        return jsonify({
+            'results': results,
+            'count': len(results),
+            'unique_count': len(unique_results)
+        })
+        
+    except Exception as e:
+        print(f"배치 번역 오류: {e}")
+        return jsonify({'error': str(e)}), 500
+
+def get_excel_translator_class(engine=None):
+    """엑셀 번역 엔진 선택 (template: openpyxl 로드/저장, direct: xlsx 압축 파일 직접 수정)"""
+    import os
+    engine = (engine or os.environ.get('EXCEL_TRANSLATOR_ENGINE', 'template')).lower()
+    if engine == 'direct':
+        from excel_translator_direct import ExcelTranslatorDirect
+        return ExcelTranslatorDirect
+    from excel_translator_template import ExcelTranslatorTemplate
+    return ExcelTranslatorTemplate
+
+_job_stage_seconds = get_metrics().histogram(
+    'translator_job_stage_seconds', '엑셀 번역 작업 단계별 소요 시간', ('stage',), buckets=DEFAULT_STAGE_BUCKETS)
+_jobs_finished = get_metrics().counter('translator_jobs_finished_total', '끝난 엑셀 번역 작업 수', ('status',))
+_result_cache_lookups = get_metrics().counter('translator_result_cache_lookups_total', '번역 결과 캐시 조회 수', ('result',))
+
+def run_translation(job_id, input_path, output_path, direction, preserve_english, add_new_sheet, exclude_sheets=None, exclude_cells=None, exclude_patterns=None, engine=None, profile=False, previous=None, cache_key=None):
+    """백그라운드에서 번역 실행 (profile=True면 cProfile 기록을 작업 출력 파일 옆에 저장)
+    previous: 수정본 번역용 이전 실행 정보 {'manifest': 매니페스트 경로} 또는 {'source': 이전 원본, 'output': 이전 번역 파일}
+    셀별 원문 해시/번역 매니페스트를 출력 파일 옆에 저장하여 다음 수정본 요청의 previous_job_id로 사용
+    cache_key: 완료된 결과를 번역 결과 캐시에 보관할 키
+    번역 결과는 체크포인트 파일에 주기적으로 기록 - 서버가 도중에 종료되면 재시작 후 resume_interrupted_jobs()가 이어서 실행"""
+    profiler = JobProfiler() if profile else None
+    previous = previous or {}
+    manifest_path = os.path.join(os.path.dirname(output_path), f"manifest_{job_id}.json")
+    checkpoint = TranslationCheckpoint(os.path.join(os.path.dirname(output_path), f"checkpoint_{job_id}.jsonl"))
     try:
-        from excel_translator_template import ExcelTranslatorTemplate
+        translator_class = get_excel_translator_class(engine)
+        
+        last_stage = [None]
+        last_details = [{}]
         
-        def progress_callback(message, percentage):
-            translation_jobs[job_id]['progress'] = percentage
-            translation_jobs[job_id]['message'] = message
-            print(f"Job {job_id}: {message} ({percentage}%)")
+        def on_progress(event):
+            # 진행률과 단계/개수/캐시 적중 정보를 한 번에 저장 (보고기가 시간 간격으로 합쳐서 호출)
+            details = {name: event[name] for name in STRUCTURED_FIELDS}
+            last_details[0] = details
+            job_store.update(job_id, progress=event['percentage'], message=event['message'], details=json.dumps(details))
+            if event['stage'] != last_stage[0]:
+                last_stage[0] = event['stage']
+                print(f"Job {job_id}: [{event['stage']}] {event['message']} ({event['percentage']:.0f}%)")
+            else:
+                debug_logger.debug("Job %s: %s (%.1f%%)", job_id, event['message'], event['percentage'])
         
-        translation_jobs[job_id]['status'] = 'running'
-        translation_jobs[job_id]['progress'] = 0
-        translation_jobs[job_id]['message'] = '번역 시작'
+        job_store.update(job_id, status='running', progress=0, message='번역 시작', checkpoint_path=checkpoint.path)
+        resumed = len(checkpoint) > 0
+        if resumed:
+            print(f"Job {job_id}: 체크포인트의 번역 {len(checkpoint)}개부터 이어서 실행")
         
-        translator = ExcelTranslatorTemplate(progress_callback)
-        result_path = translator.translate_excel_file(
+        translator = translator_class(ProgressReporter(on_event=on_progress))
+        translator.checkpoint = checkpoint
+        translate_excel_file = translator.translate_excel_file
+        if profiler is not None:
+            translator.profiler = profiler
+            translate_excel_file = profiler.wrap(translate_excel_file)
+        result_path = translate_excel_file(
             input_path=input_path,
             output_path=output_path,
             direction=direction,
@@ -495,23 +601,69 @@ def run_translation(job_id, input_path, output_path, direction, preserve_english
             add_new_sheet=add_new_sheet,
             exclude_sheets=exclude_sheets,
             exclude_cells=exclude_cells,
-            exclude_patterns=exclude_patterns
+            exclude_patterns=exclude_patterns,
+            previous_source=previous.get('source'),
+            previous_output=previous.get('output'),
+            previous_manifest=previous.get('manifest'),
+            manifest_path=manifest_path
         )
+        if os.path.exists(manifest_path):
+            job_store.update(job_id, manifest_path=manifest_path)
+        
+        # 단계별 소요 시간과 셀 수(이전 번역 재사용/새로 번역)는 작업이 끝난 뒤 상태 조회 응답에 포함
+        timings = translator.timings.as_dict() if hasattr(translator, 'timings') else {}
+        cell_counts = dict(getattr(translator, 'cell_counts', {}))
+        for stage, seconds in timings.items():
+            _job_stage_seconds.observe(seconds, stage=stage)
+        _jobs_finished.inc(status='completed')
         
-        translation_jobs[job_id]['status'] = 'completed'
-        translation_jobs[job_id]['progress'] = 100
-        translation_jobs[job_id]['message'] = '번역 완료'
-        translation_jobs[job_id]['result_path'] = result_path
+        details = dict(last_details[0], timings=timings, cells=cell_counts)
+        job_store.update(job_id, status='completed', progress=100, message='번역 완료', result_path=result_path,
+                         details=json.dumps(details))
+        
+        # 같은 파일/설정의 다음 요청을 위해 결과 보관 (실패해도 작업은 완료 상태 유지)
+        # 엔진 실패로 사전 번역/원문을 쓴 문자열이 있으면 번역 메모리처럼 보관하지 않음 (다음 요청에서 다시 번역)
+        # 체크포인트에서 이어서 실행한 작업도 보관하지 않음 - 복원한 문자열은 대체 번역 수에 잡히지 않고,
+        # 대체 번역도 기록하던 이전 버전이 남긴 체크포인트와 구분할 수 없음
+        fallbacks = translator.progress.snapshot().get('fallbacks', 0)
+        result_cache = get_result_cache() if cache_key and not fallbacks and not resumed else None
+        if cache_key and fallbacks:
+            print(f"Job {job_id}: 엔진 실패로 대체 번역한 문자열 {fallbacks}개 - 결과 캐시에 보관하지 않음")
+        elif cache_key and resumed:
+            print(f"Job {job_id}: 체크포인트에서 이어서 실행한 작업 - 결과 캐시에 보관하지 않음")
+        if result_cache is not None:
+            try:
+                result_cache.put(cache_key, result_path, manifest_path if os.path.exists(manifest_path) else None, details)
+            except Exception as e:
+                print(f"번역 결과 캐시 저장 오류 (Job {job_id}): {e}")
         
         # 임시 파일 정리
-        import os
         if os.path.exists(input_path):
             os.remove(input_path)
             
     except Exception as e:
-        translation_jobs[job_id]['status'] = 'error'
-        translation_jobs[job_id]['error'] = str(e)
+        _jobs_finished.inc(status='error')
+        job_store.update(job_id, status='error', error=str(e))
         print(f"번역 오류 (Job {job_id}): {e}")
+    finally:
+        # 끝난 작업(완료/오류)은 이어서 실행할 일이 없으므로 체크포인트 삭제
+        try:
+            checkpoint.remove()
+        except OSError as e:
+            print(f"체크포인트 삭제 오류 (Job {job_id}): {e}")
+        # 업로드된 이전 원본/번역 파일 정리 (매니페스트는 이전 작업의 것이므로 그대로 둠)
+        for path in (previous.get('source'), previous.get('output')):
+            if path and os.path.exists(path):
+                os.remove(path)
+        # 실패한 작업도 원인 분석을 위해 기록 저장
+        if profiler is not None:
+            profile_path = os.path.join(os.path.dirname(output_path), f"profile_{job_id}.prof")
+            try:
+                if profiler.dump(profile_path):
+                    job_store.update(job_id, profile_path=profile_path)
+                    print(f"Job {job_id}: 프로파일 저장 - {profile_path}")
+            except OSError as e:
+                print(f"프로파일 저장 오류 (Job {job_id}): {e}")
 
 @app.route('/translate-excel', methods=['POST'])
 def translate_excel():
@@ -523,6 +675,9 @@ def translate_excel():
         direction = request.form.get('direction', 'ko-zh')
         preserve_english = request.form.get('preserve_english', 'true').lower() == 'true'
         add_new_sheet = request.form.get('add_new_sheet', 'true').lower() == 'true'
+        engine = request.form.get('engine') or None
+        # 작업 프로파일 기록 (요청의 profile 값 또는 TRANSLATION_PROFILE 환경 변수)
+        profile = is_profiling_enabled(request.form.get('profile'))
         
         # 번역 제외 설정 파싱
         exclude_sheets_str = request.form.get('exclude_sheets', '')
@@ -543,6 +698,35 @@ def translate_excel():
         if file.filename == '':
             return jsonify({'error': '파일이 선택되지 않았습니다.'}), 400
         
+        # 같은 파일을 같은 설정으로 번역한 결과가 있으면 대기열을 거치지 않고 바로 완료
+        # (수정본 번역은 이전 번역을 따라야 하고, 프로파일 요청은 실제 실행을 기록해야 하므로 항상 실행)
+        cache_key = None
+        result_cache = get_result_cache()
+        if result_cache is not None and not profile and not request.form.get('previous_job_id') and not request.files.get('previous_source'):
+            cache_key = make_cache_key(stream_sha256(file.stream), {
+                'direction': direction,
+                'preserve_english': preserve_english,
+                'add_new_sheet': add_new_sheet,
+                # 제외 목록은 순서와 관계없이 같은 결과이므로 정렬해서 비교
+                'exclude_sheets': sorted(set(exclude_sheets or [])),
+                'exclude_cells': sorted(set(exclude_cells or [])),
+                'exclude_patterns': sorted(set(exclude_patterns or [])),
+                'translator': get_excel_translator_class(engine).__name__,
+                # 사용할 네트워크 엔진이 다르면 번역문도 다를 수 있음 (문자열별로 어느 엔진이 답했는지는 결과에 반영되지 않으므로 설정만 비교)
+                'engines': sorted(load_enabled_engines() or []),
+            })
+            cached = result_cache.get(cache_key)
+            _result_cache_lookups.inc(result='hit' if cached else 'miss')
+            if cached:
+                return cached_result_response(file.filename, cached)
+        
+        # 대기열이 가득 찼으면 업로드 파일을 저장하기 전에 거절
+        scheduler = get_job_scheduler()
+        try:
+            scheduler.check_capacity()
+        except QueueFullError as e:
+            return queue_full_response(e)
+        
         # 파일 저장
         import os
         
@@ -553,63 +737,201 @@ def translate_excel():
         input_path = os.path.join(os.getcwd(), input_filename)
         output_path = os.path.join(os.getcwd(), output_filename)
         
+        # 수정본 번역: 이전 작업 ID(서버에 남아 있는 매니페스트) 또는 이전 원본/번역 파일 업로드
+        previous = {}
+        previous_job_id = request.form.get('previous_job_id')
+        if previous_job_id:
+            previous_job = job_store.get(previous_job_id)
+            if not previous_job or not previous_job['manifest_path'] or not os.path.exists(previous_job['manifest_path']):
+                return jsonify({'error': '이전 작업의 번역 기록을 찾을 수 없습니다. 이전 원본/번역 파일을 함께 올려 주세요.'}), 400
+            previous['manifest'] = previous_job['manifest_path']
+        elif request.files.get('previous_source') and request.files.get('previous_translated'):
+            previous['source'] = os.path.join(os.getcwd(), f"previous_source_{unique_id}_{file.filename}")
+            previous['output'] = os.path.join(os.getcwd(), f"previous_translated_{unique_id}_{file.filename}")
+            request.files['previous_source'].save(previous['source'])
+            request.files['previous_translated'].save(previous['output'])
+        
         file.save(input_path)
         
         # 번역 작업 정보 저장
         job_id = unique_id
-        translation_jobs[job_id] = {
-            'status': 'queued',
-            'progress': 0,
-            'message': '번역 준비 중...',
-            'output_filename': output_filename,
-            'original_filename': file.filename
-        }
-        
-        # 백그라운드에서 번역 실행
-        thread = threading.Thread(
-            target=run_translation,
-            args=(job_id, input_path, output_path, direction, preserve_english, add_new_sheet, exclude_sheets, exclude_cells, exclude_patterns)
+        job_store.create(
+            job_id,
+            status='queued',
+            progress=0,
+            message='번역 준비 중...',
+            input_path=input_path,
+            output_filename=output_filename,
+            original_filename=file.filename,
+            # 작업을 실행할 프로세스 (이 프로세스가 죽으면 다른 작업자의 정리 스레드가 이어서 실행)
+            owner_pid=os.getpid(),
+            # 서버가 작업 도중 재시작되면 같은 설정으로 이어서 실행하기 위한 실행 정보
+            params=json.dumps({
+                'output_path': output_path,
+                'direction': direction,
+                'preserve_english': preserve_english,
+                'add_new_sheet': add_new_sheet,
+                'exclude_sheets': exclude_sheets,
+                'exclude_cells': exclude_cells,
+                'exclude_patterns': exclude_patterns,
+                'engine': engine,
+                'profile': profile,
+                'previous': previous,
+                'cache_key': cache_key,
+            }, ensure_ascii=False)
         )
-        thread.daemon = True
-        thread.start()
+        
+        # 작업 대기열에 등록 (작업자 스레드가 순서대로 실행)
+        try:
+            queue_position = scheduler.submit(
+                job_id, run_translation,
+                job_id, input_path, output_path, direction, preserve_english, add_new_sheet, exclude_sheets, exclude_cells, exclude_patterns, engine, profile, previous, cache_key
+            )
+        except QueueFullError as e:
+            job_store.delete(job_id)
+            for path in (input_path, previous.get('source'), previous.get('output')):
+                if path and os.path.exists(path):
+                    os.remove(path)
+            return queue_full_response(e)
         
         return jsonify({
             'success': True,
             'job_id': job_id,
-            'message': '번역이 시작되었습니다.'
+            'queue_position': queue_position,
+            'message': '번역이 시작되었습니다.' if queue_position == 0 else f'번역 대기 중 ({queue_position}번째)'
         })
         
     except Exception as e:
         print(f"엑셀 번역 오류: {e}")
         return jsonify({'error': f'번역 중 오류가 발생했습니다: {str(e)}'}), 500
 
-@app.route('/translation-status/<job_id>', methods=['GET'])
-def get_translation_status(job_id):
-    """번역 상태 조회"""
-    if job_id not in translation_jobs:
-        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
-    
-    job = translation_jobs[job_id]
+def cached_result_response(filename, cached):
+    """번역 결과 캐시 적중 - 보관된 결과 파일을 연결한 완료 작업을 만들고 바로 응답
+    작업 파일은 캐시 파일과 별도 이름이므로 작업 만료/캐시 정리가 서로의 파일을 지우지 않음"""
+    job_id = str(uuid.uuid4())[:8]
+    output_filename = f"translated_{job_id}_{filename}"
+    output_path = link_or_copy(cached['output_path'], os.path.join(os.getcwd(), output_filename))
+    manifest_path = None
+    if cached['manifest_path']:
+        manifest_path = link_or_copy(cached['manifest_path'], os.path.join(os.getcwd(), f"manifest_{job_id}.json"))
     
+    job_store.create(job_id, status='queued', output_filename=output_filename, original_filename=filename)
+    job_store.update(job_id, status='completed', progress=100, message='번역 완료 (이전 번역 결과 재사용)', result_path=output_path,
+                     manifest_path=manifest_path, details=json.dumps(dict(cached['details'], result_cache='hit')))
+    _jobs_finished.inc(status='cached')
+    print(f"Job {job_id}: 번역 결과 캐시 적중 ({filename})")
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'queue_position': 0,
+        'cached': True,
+        'message': '이전 번역 결과를 사용합니다.'
+    })
+
+def queue_full_response(error):
+    """대기열 초과 응답 (429 + Retry-After)"""
+    response = jsonify({'error': str(error), 'retry_after': error.retry_after})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+def job_status_payload(job):
+    """작업 상태 응답 내용 (상태 조회와 SSE 이벤트가 함께 사용)
+    진행 중/완료 작업은 단계(stage), 완료/전체 개수(done/total), 고유 문자열 수(unique), 캐시 적중 수(cache_hits) 포함"""
+    details = json.loads(job['details']) if job.get('details') else {}
     if job['status'] == 'completed':
-        return jsonify({
+        return {
             'status': job['status'],
             'progress': job['progress'],
             'message': job['message'],
             'download_filename': job['output_filename'],
-            'file_id': job_id
-        })
+            'file_id': job['job_id'],
+            **details
+        }
     elif job['status'] == 'error':
-        return jsonify({
+        return {
             'status': job['status'],
-            'error': job.get('error', '알 수 없는 오류')
-        })
+            'error': job['error'] or '알 수 없는 오류'
+        }
+    elif job['status'] == 'queued':
+        queue_position = get_job_scheduler().position(job['job_id'])
+        return {
+            'status': job['status'],
+            'progress': job['progress'],
+            'message': f'번역 대기 중 ({queue_position}번째)' if queue_position else job['message'],
+            'queue_position': queue_position
+        }
     else:
-        return jsonify({
+        return {
             'status': job['status'],
             'progress': job['progress'],
-            'message': job['message']
-        })
+            'message': job['message'],
+            **details
+        }
+
+@app.route('/translation-status/<job_id>', methods=['GET'])
+def get_translation_status(job_id):
+    """번역 상태 조회"""
+    job = job_store.get(job_id)
+    if job is None:
+        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
+    
+    return jsonify(job_status_payload(job))
+
+def sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.route('/translation-events/<job_id>', methods=['GET'])
+def translation_events(job_id):
+    """번역 진행률 SSE 스트림 - 상태가 바뀔 때만 전송 (진행률은 SSE_MIN_INTERVAL 간격으로 합쳐서 전송)
+    이벤트: progress(진행 중), completed(완료), failed(오류) - 완료/오류 이벤트 후 스트림 종료"""
+    from flask import Response
+    
+    if job_store.get(job_id) is None:
+        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
+    
+    def stream():
+        last_payload = None
+        last_sent = 0.0
+        version = job_store.version
+        
+        while True:
+            job = job_store.get(job_id)
+            if job is None:
+                yield sse_event('failed', {'status': 'error', 'error': '작업을 찾을 수 없습니다.'})
+                return
+            
+            payload = job_status_payload(job)
+            now = time.monotonic()
+            if payload != last_payload:
+                finished = payload['status'] in ('completed', 'error')
+                # 상태/단계가 바뀐 경우는 바로 전송
+                stage_changed = last_payload is None or any(
+                    payload.get(key) != last_payload.get(key) for key in ('status', 'stage')
+                )
+                if finished or stage_changed or now - last_sent >= SSE_MIN_INTERVAL:
+                    event = {'completed': 'completed', 'error': 'failed'}.get(payload['status'], 'progress')
+                    yield sse_event(event, payload)
+                    if finished:
+                        return
+                    last_payload = payload
+                    last_sent = now
+                else:
+                    # 너무 잦은 진행률 갱신은 다음 전송 시점까지 모아서 최신 값만 전송
+                    time.sleep(SSE_MIN_INTERVAL - (now - last_sent))
+                    continue
+            elif now - last_sent >= SSE_KEEPALIVE_SECONDS:
+                # 프록시가 연결을 끊지 않도록 주석 줄 전송
+                yield ': keep-alive\n\n'
+                last_sent = now
+            
+            # 같은 프로세스의 갱신은 즉시 깨어나고, 다른 프로세스의 갱신은 SSE_POLL_INTERVAL마다 다시 조회
+            version = job_store.wait_for_change(version, SSE_POLL_INTERVAL)
+    
+    return Response(stream(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
 
 @app.route('/download/<file_id>/<filename>', methods=['GET'])
 def download_file(file_id, filename):
@@ -617,35 +939,189 @@ def download_file(file_id, filename):
         from flask import send_file
         import os
         
-        file_path = os.path.join(os.getcwd(), filename)
+        # 작업에 기록된 출력 파일만 내려받을 수 있음
+        job = job_store.get(file_id)
+        if job is None or job['status'] != 'completed' or job['output_filename'] != filename:
+            return jsonify({'error': '파일을 찾을 수 없습니다.'}), 404
         
+        file_path = job['result_path'] or os.path.join(os.getcwd(), filename)
         if not os.path.exists(file_path):
             return jsonify({'error': '파일을 찾을 수 없습니다.'}), 404
         
-        def remove_file():
-            try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-            except:
-                pass
-        
-        response = send_file(file_path, as_attachment=True, download_name=filename.replace(f'translated_{file_id}_', ''))
-        
-        # 파일 전송 후 정리 (1초 후)
-        import threading
-        timer = threading.Timer(1.0, remove_file)
-        timer.start()
-        
-        return response
+        # 파일은 작업 보관 시간(TRANSLATION_JOB_TTL)이 지나면 정리 스레드가 삭제
+        return send_file(file_path, as_attachment=True, download_name=job['original_filename'] or filename.replace(f'translated_{file_id}_', ''))
         
     except Exception as e:
         print(f"파일 다운로드 오류: {e}")
         return jsonify({'error': f'파일 다운로드 중 오류가 발생했습니다: {str(e)}'}), 500
 
+@app.route('/translation-memory/stats', methods=['GET'])
+def translation_memory_stats():
+    """번역 메모리 적중/미스 통계"""
+    return jsonify(get_translation_memory().stats())
+
+@app.route('/result-cache/stats', methods=['GET'])
+def result_cache_stats():
+    """번역 결과 캐시 항목 수/크기/적중률 (적중/미스는 이 프로세스 기준)"""
+    result_cache = get_result_cache()
+    return jsonify(result_cache.stats() if result_cache is not None else {'enabled': False})
+
+@app.route('/engine-stats', methods=['GET'])
+def engine_stats():
+    """엔진별 승리/지연 통계 (헤지 지연 조정용)"""
+    return jsonify(get_engine_stats().snapshot())
+
+@app.route('/translation-queue', methods=['GET'])
+def translation_queue():
+    """번역 작업 대기열 상태 (작업자 수, 실행/대기 중인 작업 수, 저장된 작업 수)
+    대기열은 작업자 프로세스마다 따로 있으므로 응답한 프로세스의 pid를 함께 반환"""
+    status = get_job_scheduler().snapshot()
+    status['pid'] = os.getpid()
+    status['store'] = job_store.stats()
+    return jsonify(status)
+
+@app.route('/engine-health', methods=['GET'])
+def engine_health():
+    """엔진/URL별 서킷 브레이커 상태"""
+    return jsonify(get_engine_health().snapshot())
+
+def collect_runtime_metrics(registry):
+    """/metrics 응답 직전에 대기열/작업/번역 메모리 상태를 게이지로 채움"""
+    scheduler = get_job_scheduler().snapshot()
+    registry.gauge('translator_job_queue_depth', '실행을 기다리는 작업 수 (이 프로세스)').set(scheduler['queued'])
+    registry.gauge('translator_jobs_active', '실행 중인 작업 수 (이 프로세스)').set(scheduler['running'])
+    registry.gauge('translator_job_workers', '작업자 스레드 수 (이 프로세스)').set(scheduler['workers'])
+    registry.collected_counter('translator_jobs_rejected_total', '대기열이 가득 차서 거절된 업로드 수 (이 프로세스)').set(scheduler['rejected'])
+    
+    # 작업 저장소는 모든 작업자 프로세스가 공유
+    jobs = registry.gauge('translator_jobs', '저장된 작업 수 (상태별, 모든 프로세스)', ('status',))
+    jobs.clear()
+    for status, count in job_store.stats()['jobs'].items():
+        jobs.set(count, status=status)
+    
+    memory = get_translation_memory().stats()
+    cache = registry.collected_counter('translator_cache_lookups_total', '번역 메모리 조회 수 (tier: memory/disk/miss)', ('tier',))
+    cache.set(memory['memory_hits'], tier='memory')
+    cache.set(memory['disk_hits'], tier='disk')
+    cache.set(memory['misses'], tier='miss')
+    registry.gauge('translator_cache_hit_ratio', '번역 메모리 적중률').set(memory['hit_ratio'])
+    registry.gauge('translator_cache_entries', '프로세스 내 LRU 항목 수').set(memory['memory_entries'])
+    
+    breakers = registry.gauge('translator_engine_circuit_open', '엔진/URL 차단 여부 (1: 차단 또는 시험 호출 중)', ('backend',))
+    breakers.clear()
+    for backend, state in get_engine_health().snapshot().items():
+        breakers.set(0 if state['state'] == 'closed' else 1, backend=backend)
+    
+    result_cache = get_result_cache()
+    if result_cache is not None:
+        stats = result_cache.stats()
+        registry.gauge('translator_result_cache_entries', '번역 결과 캐시 항목 수 (모든 작업자 공유)').set(stats['entries'])
+        registry.gauge('translator_result_cache_bytes', '번역 결과 캐시 크기 (바이트)').set(stats['bytes'])
+
+get_metrics().add_collector(collect_runtime_metrics)
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus 텍스트 형식 지표 (엔진 호출 수/지연 시간, 오류/타임아웃, 캐시 적중률, 대기열 길이, 실행 중인 작업 수)"""
+    from flask import Response
+    return Response(get_metrics().render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+def admin_error():
+    """관리자 API 접근 확인 - TRANSLATION_ADMIN_TOKEN이 있으면 X-Admin-Token 헤더(또는 token 값) 필요, 없으면 로컬 요청만 허용"""
+    token = os.environ.get('TRANSLATION_ADMIN_TOKEN')
+    if token:
+        if request.headers.get('X-Admin-Token', request.args.get('token')) != token:
+            return jsonify({'error': '관리자 인증이 필요합니다.'}), 401
+    elif request.remote_addr not in ('127.0.0.1', '::1'):
+        return jsonify({'error': '관리자 API는 로컬에서만 사용할 수 있습니다 (TRANSLATION_ADMIN_TOKEN 설정 시 원격 허용).'}), 403
+    return None
+
+@app.route('/admin/jobs/<job_id>/profile', methods=['GET'])
+def admin_job_profile(job_id):
+    """작업 프로파일 내려받기 (pstats 파일, format=text면 sort/limit 기준 표)"""
+    from flask import Response, send_file
+    
+    error = admin_error()
+    if error:
+        return error
+    
+    job = job_store.get(job_id)
+    if job is None:
+        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
+    if not job['profile_path'] or not os.path.exists(job['profile_path']):
+        message = '작업이 끝나면 프로파일이 저장됩니다.' if job['status'] not in ('completed', 'error') else '이 작업은 프로파일을 기록하지 않았습니다 (profile=true 또는 TRANSLATION_PROFILE=1).'
+        return jsonify({'error': message}), 404
+    
+    if request.args.get('format') == 'text':
+        try:
+            text = format_profile(job['profile_path'], request.args.get('sort', 'cumulative'),
+                                  int(request.args.get('limit', DEFAULT_PROFILE_LIMIT)))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        return Response(text, content_type='text/plain; charset=utf-8')
+    return send_file(job['profile_path'], as_attachment=True, download_name=f'profile_{job_id}.prof')
+
+@app.route('/admin/jobs/<job_id>/stack', methods=['GET'])
+def admin_job_stack(job_id):
+    """실행 중인 작업의 현재 스택 (작업 스레드 + 번역 작업자 풀 스레드)"""
+    from flask import Response
+    
+    error = admin_error()
+    if error:
+        return error
+    
+    job = job_store.get(job_id)
+    if job is None:
+        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
+    thread_name = get_job_scheduler().running_thread(job_id)
+    if thread_name is None:
+        if job['status'] in ('queued', 'running'):
+            return jsonify({'error': '이 프로세스에서 실행 중인 작업이 아닙니다 (대기 중이거나 다른 작업자 프로세스에서 실행 중).', 'pid': os.getpid()}), 409
+        return jsonify({'error': '실행 중인 작업이 아닙니다.', 'status': job['status']}), 409
+    
+    stacks = format_thread_stacks([thread_name])
+    return Response(f"Job {job_id} ({job['message']}, {job['progress']:.0f}%)\n\n{stacks}", content_type='text/plain; charset=utf-8')
+
+@app.route('/admin/stacks', methods=['GET'])
+def admin_stacks():
+    """이 프로세스의 모든 스레드 스택"""
+    from flask import Response
+    
+    error = admin_error()
+    if error:
+        return error
+    return Response(format_thread_stacks(), content_type='text/plain; charset=utf-8')
+
 @app.route('/health', methods=['GET'])
 def health():
     return jsonify({'status': 'ok', 'message': '번역 서버가 정상 작동 중입니다.'})
 
+def resume_interrupted_jobs():
+    """이전 실행에서 중단된 작업(interrupted)을 가져와 대기열에 다시 등록 - 체크포인트에 기록된 번역은 다시 요청하지 않음
+    serve.py 작업자 프로세스마다 호출되어도 작업마다 한 프로세스만 가져감"""
+    scheduler = get_job_scheduler()
+    for job in job_store.claim_interrupted():
+        job_id = job['job_id']
+        try:
+            params = json.loads(job['params'])
+            scheduler.submit(job_id, run_translation, job_id, job['input_path'], **params)
+            print(f"Job {job_id}: 서버 재시작 전에 중단된 번역 작업을 이어서 실행")
+        except (QueueFullError, ValueError, TypeError) as e:
+            print(f"Job {job_id}: 이어서 실행할 수 없음 - {e}")
+            job_store.update(job_id, status='error', error=INTERRUPTED_JOB_MESSAGE)
+            _jobs_finished.inc(status='error')
+
+
+if RECOVER_JOBS and is_resume_enabled():
+    # serve.py 작업자가 죽어 남은 작업은 살아 있는 작업자의 정리 스레드가 interrupted로 표시한 뒤 가져감
+    # (정리 스레드가 이미 돌고 있으므로 먼저 연결한 뒤 남아 있는 interrupted 작업을 가져감)
+    job_store.on_orphaned = resume_interrupted_jobs
+    resume_interrupted_jobs()
+
+# 엔진 클라이언트를 만들고 연결을 미리 맺어 둠 (백그라운드 - 시트 단위 작업 프로세스는 각자 준비)
+if __name__ != '__mp_main__':
+    start_warm_up()
+
 if __name__ == '__main__':
     print("번역 서버 시작 중...")
     print("URL: http://localhost:5001")
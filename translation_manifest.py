@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+번역 매니페스트 - 셀별 원문 해시와 번역문 기록 (원본 시트명 + 좌표 기준)
+같은 주문서의 수정본을 번역할 때 원문이 그대로인 셀은 이전 번역을 재사용하고, 바뀌거나 새로 생긴 셀만 번역
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+MANIFEST_VERSION = 1
+
+
+def cell_hash(value):
+    """셀 원문 해시 (정확히 같은 문자열일 때만 같은 값)"""
+    return hashlib.sha256(str(value).encode('utf-8')).hexdigest()[:32]
+
+
+def reuse_translation(entries, coordinate, value):
+    """시트의 매니페스트 항목에서 원문이 바뀌지 않은 셀의 이전 번역 반환 (없거나 바뀌었으면 None)"""
+    entry = entries.get(coordinate)
+    if entry is not None and entry[0] == cell_hash(value):
+        return entry[1]
+    return None
+
+
+class TranslationManifest:
+    def __init__(self, direction=None, preserve_english=None):
+        self.direction = direction
+        self.preserve_english = preserve_english
+        # 원본 시트명 -> {좌표: [원문 해시, 번역문]} (번역 대상이었던 셀, 번역해도 값이 그대로인 셀 포함)
+        self.sheets = {}
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.sheets.values())
+
+    def record(self, sheet_name, coordinate, source, translation):
+        self.sheets.setdefault(sheet_name, {})[coordinate] = [cell_hash(source), translation]
+
+    def sheet_entries(self, sheet_name):
+        return self.sheets.get(sheet_name, {})
+
+    def is_compatible(self, direction, preserve_english):
+        """번역 방향/영문 유지 설정이 다르면 이전 번역을 쓸 수 없음 (설정을 모르는 매니페스트는 방향만 확인)"""
+        if self.direction != direction:
+            return False
+        return self.preserve_english is None or self.preserve_english == preserve_english
+
+    def save(self, path):
+        """임시 파일에 쓴 뒤 교체 (저장 중에 끊겨도 이전 매니페스트가 깨지지 않음)"""
+        data = {
+            'version': MANIFEST_VERSION,
+            'direction': self.direction,
+            'preserve_english': self.preserve_english,
+            'sheets': self.sheets,
+        }
+        fd, temp_path = tempfile.mkstemp(prefix='.manifest-', suffix='.json', dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != MANIFEST_VERSION:
+            raise ValueError(f"지원하지 않는 매니페스트 버전: {data.get('version')}")
+        manifest = cls(data.get('direction'), data.get('preserve_english'))
+        manifest.sheets = data.get('sheets') or {}
+        return manifest
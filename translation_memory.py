@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+번역 메모리 (Translation Memory)
+프로세스 내 LRU 캐시 + SQLite 디스크 저장소의 2단계 구조
+번역 서버와 모든 엑셀 번역기가 같은 메모리를 공유하여 반복되는 문자열의 재번역을 방지
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'translation_memory.db')
+DEFAULT_MAX_ENTRIES = 10000
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_text(text):
+    """캐시 키용 원문 정규화 (유니코드 NFC + 앞뒤 공백 제거 + 연속 공백 축약)"""
+    return _WHITESPACE_RE.sub(' ', unicodedata.normalize('NFC', str(text)).strip())
+
+
+class TranslationMemory:
+    def __init__(self, db_path=None, max_entries=DEFAULT_MAX_ENTRIES):
+        self.db_path = db_path or DEFAULT_DB_PATH
+        self.max_entries = max_entries
+
+        # 1단계: 프로세스 내 LRU (키: (방향, 정규화된 원문) -> (번역문, 엔진))
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 적중/미스 카운터
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        # 2단계: SQLite 디스크 저장소 (재시작 후에도 유지)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS translations ('
+            ' direction TEXT NOT NULL,'
+            ' source TEXT NOT NULL,'
+            ' translation TEXT NOT NULL,'
+            ' engine TEXT,'
+            ' created_at REAL NOT NULL,'
+            ' PRIMARY KEY (direction, source))'
+        )
+        self._conn.commit()
+
+    def _remember(self, key, entry):
+        """LRU에 항목 추가 (용량 초과 시 가장 오래된 항목 제거)"""
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def lookup(self, direction, text):
+        """(번역문, 엔진) 반환, 없으면 None"""
+        key = (direction, normalize_text(text))
+
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is not None:
+                self._lru.move_to_end(key)
+                self.memory_hits += 1
+                return entry
+
+            try:
+                row = self._conn.execute(
+                    'SELECT translation, engine FROM translations WHERE direction = ? AND source = ?',
+                    key
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            entry = (row[0], row[1])
+            self._remember(key, entry)
+            self.disk_hits += 1
+            return entry
+
+    def get(self, direction, text):
+        """번역문만 반환, 없으면 None"""
+        entry = self.lookup(direction, text)
+        return entry[0] if entry else None
+
+    def put(self, direction, text, translation, engine=None):
+        """번역 결과 저장 (LRU + 디스크)"""
+        if not translation:
+            return
+
+        key = (direction, normalize_text(text))
+
+        with self._lock:
+            self._remember(key, (translation, engine))
+            try:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO translations (direction, source, translation, engine, created_at) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (key[0], key[1], translation, engine, time.time())
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"번역 메모리 저장 오류: {e}")
+
+    def stats(self):
+        """적중/미스 통계"""
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            total = hits + self.misses
+            try:
+                disk_entries = self._conn.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+            except sqlite3.Error:
+                disk_entries = None
+            return {
+                'hits': hits,
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_ratio': round(hits / total, 4) if total else 0.0,
+                'memory_entries': len(self._lru),
+                'max_memory_entries': self.max_entries,
+                'disk_entries': disk_entries,
+                'db_path': self.db_path
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# 프로세스 전역 공유 인스턴스
+_shared_memory = None
+_shared_lock = threading.Lock()
+
+
+def get_translation_memory():
+    """프로세스 전역 번역 메모리 반환 (환경 변수로 경로/크기 설정 가능)"""
+    global _shared_memory
+    with _shared_lock:
+        if _shared_memory is None:
+            _shared_memory = TranslationMemory(
+                db_path=os.environ.get('TRANSLATION_MEMORY_PATH') or None,
+                max_entries=int(os.environ.get('TRANSLATION_MEMORY_SIZE', DEFAULT_MAX_ENTRIES))
+            )
+        return _shared_memory